@@ -48,7 +48,13 @@ from models import (
     alert_frequency,
     candidate_alert_configuration,
     candidate_position_preference,
-    work_experience
+    work_experience,
+    active_offer,
+    code_counter,
+    postulation_counter,
+    upload_reference,
+    saved_search,
+    saved_search_hit
 )
 
 settings = get_settings()
@@ -107,4 +107,19 @@ async def send_postulation_email_confirmation(title: str):
     )
     # Send Email
     fm = FastMail(config)
-    await fm.send_message(message, template_name="postulation-confirmation.html")
\ No newline at end of file
+    await fm.send_message(message, template_name="postulation-confirmation.html")
+
+async def send_not_selected_email(emails: list[str], title: str):
+    # Create Message Schema (Candidates Go In BCC So One Message Serves The Whole Batch)
+    message = MessageSchema(
+        subject="Proceso De Seleccion Finalizado",
+        recipients=[settings.smtp_mail_from],
+        bcc=emails,
+        template_body={
+            "title": title
+        },
+        subtype=MessageType.html
+    )
+    # Send Email
+    fm = FastMail(config)
+    await fm.send_message(message, template_name="postulation-not-selected.html")
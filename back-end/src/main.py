@@ -1,11 +1,15 @@
-import os
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
 from contextlib import asynccontextmanager
+from datetime import time
 
 from config.db import close_db
 from config.settings import get_settings
+from services.active_offers import run_daily_rollover
+from services.maintenance import run_nightly_maintenance
+from services.job_alerts import run_job_alerts
+from services.scheduler import start_job, schedule_daily, stop_scheduled_jobs
+from services.notifications import start_notification_worker, stop_notification_worker
 from routers import (
     admin_users,
     admin,
@@ -33,15 +37,26 @@ from routers import (
     generic_positions,
     metadata,
     scrapers,
-    unified_jobs
+    unified_jobs,
+    images,
+    uploads,
+    saved_searches
 )
 
 # LifeSpan Server Cycle
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup Actions
+    # Projection Rebuilds Run In One Worker At A Time; Deployments Can Also Run 'scripts.run_active_offers_rollover'
+    start_job(run_daily_rollover, exclusive=True)
+    schedule_daily(run_nightly_maintenance, time(0, 0, 5), exclusive=True)
+    # One Worker Sends The Digests, The Rate Limit Is Per Process
+    schedule_daily(run_job_alerts, time(8, 0), exclusive=True)
+    start_notification_worker()
     yield
     # Shutdown Actions
+    await stop_scheduled_jobs()
+    await stop_notification_worker()
     await close_db()
 
 app = FastAPI(lifespan=lifespan) # Create Server Instance
@@ -54,13 +69,6 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
-# Mount Static Files
-app.mount(
-    "/v1/uploads",
-    StaticFiles(directory=os.path.join(os.path.dirname(__file__), "uploads")),
-    name="uploads"
-)
-
 # App Routers
 app.include_router(admin_users.router, prefix="/v1")
 app.include_router(admin.router, prefix="/v1")
@@ -88,4 +96,7 @@ app.include_router(role_positions.router, prefix="/v1")
 app.include_router(generic_positions.router, prefix="/v1")
 app.include_router(metadata.router, prefix="/v1")
 app.include_router(scrapers.router, prefix="/v1")
-app.include_router(unified_jobs.router, prefix="/v1")
\ No newline at end of file
+app.include_router(unified_jobs.router, prefix="/v1")
+app.include_router(images.router, prefix="/v1")
+app.include_router(uploads.router, prefix="/v1")
+app.include_router(saved_searches.router, prefix="/v1")
\ No newline at end of file
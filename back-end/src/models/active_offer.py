@@ -0,0 +1,41 @@
+from sqlmodel import SQLModel, Field
+from sqlalchemy import Column, Text, Index
+from datetime import date
+
+# Denormalized Copy Of Portal Visible Job Offers
+class ActiveOffer(SQLModel, table=True):
+    __tablename__="oferta_activa"
+    __table_args__=(
+        Index("ix_oferta_activa_publicacion", "fecha_publicacion", "id_oferta"),
+        Index("ix_oferta_activa_destacada", "destacada", "id_oferta"),
+        Index("ft_oferta_activa_busqueda", "titulo", "descripcion", mysql_prefix="FULLTEXT"),
+        Index("ft_oferta_activa_empresa", "nombre_fantasia", mysql_prefix="FULLTEXT"),
+    )
+    offer_id: int = Field(primary_key=True, foreign_key="oferta.id_oferta", sa_column_kwargs={"name": "id_oferta", "autoincrement": False})
+    code: int = Field(sa_column_kwargs={"name": "codigo"})
+    title: str = Field(sa_column_kwargs={"name": "titulo"})
+    position: str | None = Field(default=None, max_length=150, sa_column_kwargs={"name": "cargo"})
+    description: str | None = Field(default=None, sa_column=Column("descripcion", Text))
+    publication_date: date = Field(sa_column_kwargs={"name": "fecha_publicacion"})
+    closing_date: date | None = Field(default=None, sa_column_kwargs={"name": "fecha_cierre"})
+    state: str = Field(max_length=50, sa_column_kwargs={"name": "estado"})
+    featured: int = Field(sa_column_kwargs={"name": "destacada"})
+    # City And Region Summary
+    city_id: int | None = Field(default=None, index=True, sa_column_kwargs={"name": "id_ciudad"})
+    city_name: str | None = Field(default=None, max_length=150, sa_column_kwargs={"name": "nombre_ciudad"})
+    region_id: int | None = Field(default=None, index=True, sa_column_kwargs={"name": "id_region"})
+    region_name: str | None = Field(default=None, max_length=150, sa_column_kwargs={"name": "nombre_region"})
+    # Contract Type And Job Type Summary
+    type_id: int | None = Field(default=None, index=True, sa_column_kwargs={"name": "id_contrato"})
+    contract_name: str | None = Field(default=None, max_length=150, sa_column_kwargs={"name": "nombre_contrato"})
+    job_type_id: int | None = Field(default=None, index=True, sa_column_kwargs={"name": "id_jornada"})
+    # Company Summary
+    company_id: int | None = Field(default=None, index=True, sa_column_kwargs={"name": "id_empresa"})
+    company_trade_name: str | None = Field(default=None, max_length=300, sa_column_kwargs={"name": "nombre_fantasia"})
+    company_web: str | None = Field(default=None, max_length=300, sa_column_kwargs={"name": "web_empresa"})
+    company_email: str | None = Field(default=None, max_length=300, sa_column_kwargs={"name": "email_empresa"})
+    company_description: str | None = Field(default=None, sa_column=Column("descripcion_empresa", Text))
+    company_phone: str | None = Field(default=None, max_length=15, sa_column_kwargs={"name": "fono_empresa"})
+    company_logo: str | None = Field(default=None, sa_column=Column("logo_empresa", Text))
+    sector_id: int | None = Field(default=None, sa_column_kwargs={"name": "id_sector"})
+    sector_name: str | None = Field(default=None, max_length=150, sa_column_kwargs={"name": "nombre_sector"})
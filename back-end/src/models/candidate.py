@@ -1,16 +1,20 @@
 from sqlmodel import SQLModel, Field, Relationship
-from sqlalchemy import Column, Text
+from sqlalchemy import Column, Text, Index
 from datetime import date, datetime
 
 from .driver_license import DriverLicense
 
 class Candidate(SQLModel, table=True):
     __tablename__="candidato"
+    __table_args__=(
+        Index("ft_candidato_nombre_busqueda", "nombre_busqueda", mysql_prefix="FULLTEXT"),
+    )
     candidate_id: int | None = Field(default=None, primary_key=True, sa_column_kwargs={"name": "id_candidato"})
     run: str | None = Field(default=None, max_length=13, unique=True)
     name: str = Field(max_length=150, sa_column_kwargs={"name": "nombre"})
     paternal: str = Field(max_length=150, sa_column_kwargs={"name": "paterno"})
     maternal: str | None = Field(default=None, max_length=150, sa_column_kwargs={"name": "materno"})
+    search_name: str | None = Field(default=None, max_length=460, sa_column_kwargs={"name": "nombre_busqueda"})
     birth_date: date | None = Field(default=None, sa_column_kwargs={"name": "fecha_nacimiento"})
     gender: str | None = Field(default=None, max_length=50, sa_column_kwargs={"name": "sexo"})
     nationality: str | None = Field(default=None, max_length=150, sa_column_kwargs={"name": "nacionalidad"})
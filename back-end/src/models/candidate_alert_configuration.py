@@ -1,4 +1,5 @@
 from sqlmodel import SQLModel, Field, Relationship
+from sqlalchemy import Index
 from datetime import datetime
 
 from .alert_frequency import AlertFrequency
@@ -6,6 +7,9 @@ from .candidate import Candidate
 
 class CandidateAlertConfiguration(SQLModel, table=True):
     __tablename__="configuracion_alertas_candidato"
+    __table_args__=(
+        Index("ix_configuracion_alertas_proxima", "alertas_activas", "proxima_alerta"),
+    )
     configuration_id: int | None = Field(default=None, primary_key=True, sa_column_kwargs={"name": "id_configuracion"})
     active_alerts: int = Field(default=1, sa_column_kwargs={"name": "alertas_activas"})
     email_alerts: str | None = Field(default=None, sa_column_kwargs={"name": "email_alertas"})
@@ -0,0 +1,6 @@
+from sqlmodel import SQLModel, Field
+
+class CodeCounter(SQLModel, table=True):
+    __tablename__="contador_codigo"
+    name: str = Field(primary_key=True, max_length=50, sa_column_kwargs={"name": "nombre"})
+    next_value: int = Field(sa_column_kwargs={"name": "siguiente_valor"})
@@ -3,6 +3,7 @@ Modelo para empleos scraped de Codelco
 """
 
 from sqlmodel import SQLModel, Field
+from sqlalchemy import Index
 from datetime import datetime
 from typing import Optional
 
@@ -24,6 +25,9 @@ class CodelcoJobBase(SQLModel):
 class CodelcoJob(CodelcoJobBase, table=True):
     """Tabla de empleos de Codelco en la base de datos"""
     __tablename__ = "codelco_jobs"
+    __table_args__ = (
+        Index("ft_codelco_busqueda", "titulo", "descripcion", mysql_prefix="FULLTEXT"),
+    )
     
     id: Optional[int] = Field(default=None, primary_key=True)
     fecha_scraped: datetime = Field(default_factory=datetime.now, description="Fecha de scraping")
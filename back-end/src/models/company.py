@@ -1,10 +1,13 @@
 from sqlmodel import SQLModel, Field, Relationship
-from sqlalchemy import Column, Text
+from sqlalchemy import Column, Text, Index
 
 from .company_sector import CompanySector
 
 class Company(SQLModel, table=True):
     __tablename__ = "empresa"
+    __table_args__ = (
+        Index("ft_empresa_nombre", "nombre_fantasia", mysql_prefix="FULLTEXT"),
+    )
     company_id: int | None = Field(default=None, primary_key=True, sa_column_kwargs={"name": "id_empresa"})
     rut: str = Field(max_length=13)
     legal_name: str = Field(max_length=300, sa_column_kwargs={"name": "razon_social"})
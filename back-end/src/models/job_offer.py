@@ -1,5 +1,5 @@
 from sqlmodel import SQLModel, Field, Relationship
-from sqlalchemy import Column, Text
+from sqlalchemy import Column, Text, Index
 from datetime import date
 
 from .specific_position import SpecificPosition
@@ -14,6 +14,14 @@ from .job_day import JobDay
 
 class JobOffer(SQLModel, table=True):
     __tablename__="oferta"
+    __table_args__=(
+        Index("ix_oferta_publicacion", "fecha_publicacion", "id_oferta"),
+        Index("ix_oferta_estado_publicacion", "estado", "fecha_publicacion", "id_oferta"),
+        Index("ix_oferta_estado_cierre", "estado", "fecha_cierre"),
+        Index("ft_oferta_busqueda", "titulo", "descripcion", mysql_prefix="FULLTEXT"),
+        # A Named Unique Index, So 'create_indexes' Also Adds It To Existing Databases
+        Index("uq_oferta_codigo", "codigo", unique=True),
+    )
     offer_id: int | None = Field(default=None, primary_key=True, sa_column_kwargs={"name": "id_oferta"})
     code: int = Field(sa_column_kwargs={"name": "codigo"})
     title: str = Field(sa_column_kwargs={"name": "titulo"})
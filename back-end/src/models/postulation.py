@@ -1,4 +1,5 @@
 from sqlmodel import SQLModel, Field, Relationship
+from sqlalchemy import Index
 from datetime import date
 
 from .candidate import Candidate
@@ -6,9 +7,19 @@ from .job_offer import JobOffer
 
 class Postulation(SQLModel, table=True):
     __tablename__ = "postulacion"
+    __table_args__ = (
+        Index("uq_postulacion_oferta_candidato", "id_oferta", "candidate_id", unique=True),
+        Index("ix_postulacion_notificacion", "id_oferta", "notificacion_pendiente"),
+        Index("uq_postulacion_candidato_clave", "candidate_id", "clave_idempotencia", unique=True),
+    )
     postulation_id: int | None = Field(default=None, primary_key=True, sa_column_kwargs={"name": "id_postulacion"})
     postulation_date: date = Field(default_factory=date.today, sa_column_kwargs={"name": "fecha_postulacion"})
     state: str = Field(max_length=30, sa_column_kwargs={"name": "estado"})
+    # Set By The Statement That Discards The Postulation, Cleared When Its Email Is Sent
+    notification_pending: int = Field(default=0, sa_column_kwargs={"name": "notificacion_pendiente"})
+    # Idempotency Key Sent With The Submission And SHA-256 Of Its Body, Compared When The Key Is Reused
+    idempotency_key: str | None = Field(default=None, max_length=100, sa_column_kwargs={"name": "clave_idempotencia"})
+    request_hash: str | None = Field(default=None, max_length=64, sa_column_kwargs={"name": "huella_solicitud"})
     # Candidate Relationship
     candidate_id: int = Field(foreign_key="candidato.id_candidato")
     candidate: Candidate = Relationship(back_populates="postulations")
@@ -0,0 +1,8 @@
+from sqlmodel import SQLModel, Field
+
+# Postulations Per Offer And State, Kept In Sync With 'postulacion'
+class PostulationCounter(SQLModel, table=True):
+    __tablename__="contador_postulacion"
+    offer_id: int = Field(primary_key=True, foreign_key="oferta.id_oferta", sa_column_kwargs={"name": "id_oferta", "autoincrement": False})
+    state: str = Field(primary_key=True, max_length=30, sa_column_kwargs={"name": "estado"})
+    total: int = Field(default=0, sa_column_kwargs={"name": "total"})
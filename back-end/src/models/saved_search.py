@@ -0,0 +1,15 @@
+from sqlmodel import SQLModel, Field
+from datetime import datetime
+
+# 'get_offers' Filters Saved By A Candidate, Matched Against Every Offer That Becomes Visible
+class SavedSearch(SQLModel, table=True):
+    __tablename__="busqueda_guardada"
+    search_id: int | None = Field(default=None, primary_key=True, sa_column_kwargs={"name": "id_busqueda"})
+    name: str = Field(max_length=100, sa_column_kwargs={"name": "nombre"})
+    search: str | None = Field(default=None, max_length=150, sa_column_kwargs={"name": "busqueda"})
+    region_id: int | None = Field(default=None, foreign_key="region.numero_region", sa_column_kwargs={"name": "id_region"})
+    city_id: int | None = Field(default=None, foreign_key="ciudad.id_ciudad", sa_column_kwargs={"name": "id_ciudad"})
+    type_id: int | None = Field(default=None, foreign_key="tipo_contrato.id_tipo", sa_column_kwargs={"name": "id_contrato"})
+    job_type_id: int | None = Field(default=None, foreign_key="jornada.id_jornada", sa_column_kwargs={"name": "id_jornada"})
+    creation_date: datetime = Field(default_factory=datetime.today, sa_column_kwargs={"name": "fecha_creacion"})
+    candidate_id: int = Field(foreign_key="candidato.id_candidato", index=True, sa_column_kwargs={"name": "id_candidato"})
@@ -0,0 +1,15 @@
+from sqlmodel import SQLModel, Field
+from sqlalchemy import Index
+from datetime import datetime
+
+# Offers Matched By A Saved Search, One Row Per Pair Even If The Offer Is Activated Again
+class SavedSearchHit(SQLModel, table=True):
+    __tablename__="coincidencia_busqueda"
+    __table_args__=(
+        Index("ix_coincidencia_candidato", "id_candidato", "vista", "fecha_creacion"),
+    )
+    search_id: int = Field(primary_key=True, foreign_key="busqueda_guardada.id_busqueda", sa_column_kwargs={"name": "id_busqueda", "autoincrement": False})
+    offer_id: int = Field(primary_key=True, foreign_key="oferta.id_oferta", sa_column_kwargs={"name": "id_oferta", "autoincrement": False})
+    candidate_id: int = Field(foreign_key="candidato.id_candidato", sa_column_kwargs={"name": "id_candidato"})
+    seen: int = Field(default=0, sa_column_kwargs={"name": "vista"})
+    creation_date: datetime = Field(default_factory=datetime.today, sa_column_kwargs={"name": "fecha_creacion"})
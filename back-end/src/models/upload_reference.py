@@ -0,0 +1,8 @@
+from sqlmodel import SQLModel, Field
+
+# Rows Pointing At Each Stored Upload, The File Is Removed When It Reaches Zero
+class UploadReference(SQLModel, table=True):
+    __tablename__="referencia_archivo"
+    folder: str = Field(primary_key=True, max_length=30, sa_column_kwargs={"name": "carpeta"})
+    filename: str = Field(primary_key=True, max_length=300, sa_column_kwargs={"name": "archivo"})
+    total: int = Field(default=0, sa_column_kwargs={"name": "total"})
@@ -31,7 +31,8 @@ from utilities import (
     get_password_hash, 
     validate_password_hash,
     create_access_token,
-    get_current_user
+    get_current_user,
+    build_search_name
 )
 
 router = APIRouter(prefix="/auth", tags=["auth"])
@@ -67,6 +68,7 @@ async def register_candidate(
             exclude={"password"}),
             password=hashed_password
         )
+        candidate.search_name = build_search_name(candidate.name, candidate.paternal, candidate.maternal)
         session.add(candidate)
         await session.flush()
         # Create Candidate Position Preferece Base Configuration
@@ -241,6 +243,7 @@ async def login_oauth(
                 **data.model_dump(),
                 last_connection=now
             )
+            new_candidate.search_name = build_search_name(new_candidate.name, new_candidate.paternal, new_candidate.maternal)
             session.add(new_candidate)
             await session.flush()
             # Create Candidate Position Preferece Base Configuration
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, HTTPException, Path, Depends, status
+from fastapi import APIRouter, HTTPException, Path, Body, Depends, status
 from fastapi.responses import JSONResponse
 from sqlmodel import select
 from sqlalchemy.orm import selectinload
@@ -10,9 +10,13 @@ from models.candidate_certification import CandidateCertification
 from models.candidate import Candidate
 from schemas.candidate_certification import (
     CreateCertification, 
+    UpsertCertification,
     UpdateCertification, 
     GetCertification
 )
+from services.resume_pdf import invalidate_resume_cache
+from services.candidate_profiles import invalidate_candidate_profile
+from services.profile_sections import SECTION_MAX_ITEMS, SectionItemError, replace_section
 from utilities import get_current_user
 
 router = APIRouter(prefix="/candidate-certifications", tags=["candidate-certifications"])
@@ -58,6 +62,8 @@ async def create_certification(
         )
         session.add(certiticaction)
         await session.commit()
+        invalidate_resume_cache(candidate_id)
+        invalidate_candidate_profile(candidate_id)
         return JSONResponse(
             status_code=status.HTTP_201_CREATED,
             content={"detail": "Successfully registered certification"}
@@ -75,6 +81,49 @@ async def create_certification(
             detail="An error occurred on the server"
         )
 
+@router.put("/")
+async def replace_certifications(
+    session: SessionDep,
+    data: Annotated[list[UpsertCertification], Body(max_length=SECTION_MAX_ITEMS)],
+    current_user: dict = Depends(get_current_user)
+) -> JSONResponse:
+    try:
+        candidate_id = current_user.get("sub")
+        # Replace Candidate Certifications With The Sent Ones
+        try:
+            changes = await replace_section(
+                session,
+                CandidateCertification,
+                "certification_id",
+                candidate_id,
+                [certification.model_dump() for certification in data]
+            )
+        except SectionItemError:
+            await session.rollback()
+            return JSONResponse(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                content={"detail": "Certification does not exists"}
+            )
+        await session.commit()
+        invalidate_resume_cache(candidate_id)
+        invalidate_candidate_profile(candidate_id)
+        return JSONResponse(
+            status_code=status.HTTP_200_OK,
+            content={"detail": "Successfully updated certifications", **changes}
+        )
+    except IntegrityError as ex:
+        await session.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, 
+            detail="An integrity error occurred. This may be due to a foreign key constraint violation or a data integrity issue. Please verify the data and try again"
+        )
+    except Exception as ex:
+        await session.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, 
+            detail="An error occurred on the server"
+        )
+
 @router.put("/{certification_id}")
 async def update_certification(
     session: SessionDep,
@@ -96,6 +145,8 @@ async def update_certification(
             setattr(certification, key, value)
         session.add(certification)
         await session.commit()
+        invalidate_resume_cache(certification.candidate_id)
+        invalidate_candidate_profile(certification.candidate_id)
         return JSONResponse(
             status_code=status.HTTP_200_OK,
             content={"detail": "Successfully updated certification"}
@@ -130,6 +181,8 @@ async def remove_certification(
         # Delete Candidate Certification
         await session.delete(certification)
         await session.commit()
+        invalidate_resume_cache(certification.candidate_id)
+        invalidate_candidate_profile(certification.candidate_id)
         return JSONResponse(
             status_code=status.HTTP_200_OK,
             content={"detail": "Successfully removed certification"}
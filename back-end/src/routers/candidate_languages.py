@@ -1,4 +1,4 @@
-from fastapi import APIRouter, HTTPException, Path, Depends, status
+from fastapi import APIRouter, HTTPException, Path, Body, Depends, status
 from fastapi.responses import JSONResponse
 from sqlmodel import select
 from sqlalchemy.exc import IntegrityError
@@ -13,6 +13,9 @@ from schemas.candidate_language import (
     UpdateLanguage,
     GetCandidateLanguage
 )
+from services.resume_pdf import invalidate_resume_cache
+from services.candidate_profiles import invalidate_candidate_profile
+from services.profile_sections import SECTION_MAX_ITEMS, SectionItemError, replace_section
 from utilities import get_current_user
 
 router = APIRouter(prefix="/candidate-languages", tags=["candidate-languages"])
@@ -71,6 +74,8 @@ async def create_language(
         )
         session.add(language)
         await session.commit()
+        invalidate_resume_cache(candidate_id)
+        invalidate_candidate_profile(candidate_id)
         return JSONResponse(
             status_code=status.HTTP_201_CREATED,
             content={"detail": "Successfully registered language"}
@@ -88,6 +93,50 @@ async def create_language(
             detail="An error occurred on the server"
         )
 
+@router.put("/")
+async def replace_languages(
+    session: SessionDep,
+    data: Annotated[list[CreateLanguage], Body(max_length=SECTION_MAX_ITEMS)],
+    curret_user: dict = Depends(get_current_user)
+) -> JSONResponse:
+    try:
+        candidate_id = curret_user.get("sub")
+        # Replace Candidate Languages With The Sent Ones
+        try:
+            changes = await replace_section(
+                session,
+                CandidateLanguage,
+                "candidate_language_id",
+                candidate_id,
+                [language.model_dump() for language in data],
+                key_fields=("language_id",)
+            )
+        except SectionItemError:
+            await session.rollback()
+            return JSONResponse(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                content={"detail": "Languages must not be repeated"}
+            )
+        await session.commit()
+        invalidate_resume_cache(candidate_id)
+        invalidate_candidate_profile(candidate_id)
+        return JSONResponse(
+            status_code=status.HTTP_200_OK,
+            content={"detail": "Successfully updated languages", **changes}
+        )
+    except IntegrityError as ex:
+        await session.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, 
+            detail="An integrity error occurred. This may be due to a foreign key constraint violation or a data integrity issue. Please verify the data and try again"
+        )
+    except Exception as ex:
+        await session.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, 
+            detail="An error occurred on the server"
+        )
+
 @router.put("/{candidate_language_id}")
 async def update_language(
     session: SessionDep,
@@ -109,6 +158,8 @@ async def update_language(
             setattr(language, key, value)
         session.add(language)
         await session.commit()
+        invalidate_resume_cache(language.candidate_id)
+        invalidate_candidate_profile(language.candidate_id)
         return JSONResponse(
             status_code=status.HTTP_200_OK,
             content={"detail": "Successfully updated language"}
@@ -143,6 +194,8 @@ async def remove_language(
         # Delete Candidate Language
         await session.delete(language)
         await session.commit()
+        invalidate_resume_cache(language.candidate_id)
+        invalidate_candidate_profile(language.candidate_id)
         return JSONResponse(
             status_code=status.HTTP_200_OK,
             content={"detail": "Successfully removed language"}
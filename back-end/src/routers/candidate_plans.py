@@ -1,10 +1,8 @@
-import os
 import json
 from fastapi import APIRouter, HTTPException, Depends, Path, Query, Form, UploadFile, File, status
 from fastapi.responses import JSONResponse
 from sqlmodel import select, func
 from sqlalchemy.exc import IntegrityError
-from uuid import uuid4
 from typing import Annotated
 
 from config.db import SessionDep
@@ -15,6 +13,14 @@ from schemas.extras import (
     UpdatePlan, 
     GetPlan
 )
+from services.uploads import (
+    JPEG_CONTENT_TYPES,
+    UploadTypeError,
+    UploadSizeError,
+    save_upload,
+    remove_upload
+)
+from services.image_variants import queue_image_variants
 from utilities import get_current_user
 
 router = APIRouter(prefix="/candidate-plans", tags=["candidate-plans"])
@@ -85,23 +91,19 @@ async def create_candidate_plan(
         # Des-Serielize Payload
         data_dict = json.loads(payload)
         data = CreatePlan(**data_dict)
-        # Check Photo Validations
-        if photo.content_type != "image/jpeg":
+        # Save Photo Checking Its Type And Size While Streaming
+        try:
+            filename = await save_upload(session, photo, "plan_photos", JPEG_CONTENT_TYPES, PHOTO_MAX_SIZE)
+        except UploadTypeError:
             return JSONResponse(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 content={"detail": "The file type must be .jpg"}
             )
-        file_content = await photo.read()
-        if len(file_content) > PHOTO_MAX_SIZE:
+        except UploadSizeError:
             return JSONResponse(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 content={"detail": "The file size must be a maximum of 1 MB"}
             )
-        # Create Photo Path And Save It
-        filename = f"{uuid4().hex}_{photo.filename}"
-        file_path = os.path.join("src/uploads/plan_photos", filename)
-        with open(file_path, "wb") as buffer:
-            buffer.write(file_content)
         # Create Candidate Plan
         candidate_plan = CandidatePlan(
             **data.model_dump(exclude={"photo"}),
@@ -109,6 +111,7 @@ async def create_candidate_plan(
         )
         session.add(candidate_plan)
         await session.commit()
+        queue_image_variants("plan_photos", filename)
         return JSONResponse(
             status_code=status.HTTP_201_CREATED,
             content={"detail": "Successfully registered candidate plan"}
@@ -145,29 +148,22 @@ async def update_candidate_plan(
                 status_code=status.HTTP_404_NOT_FOUND,
                 content={"detail": "Candidate plan does not exists"}
             )
-        # Check Photo Validations
+        # Save Photo Checking Its Type And Size While Streaming
+        old_photo = None
         if photo:
-            if photo.content_type != "image/jpeg":
+            try:
+                filename = await save_upload(session, photo, "plan_photos", JPEG_CONTENT_TYPES, PHOTO_MAX_SIZE)
+            except UploadTypeError:
                 return JSONResponse(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     content={"detail": "The file type must be .jpg"}
                 )
-            file_content = await photo.read()
-            if len(file_content) > PHOTO_MAX_SIZE:
+            except UploadSizeError:
                 return JSONResponse(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     content={"detail": "The file size must be a maximum of 1 MB"}
                 )
-            # Check If Candidate Plan Already Had Photo And Remove It
-            if candidate_plan.photo:
-                old_photo_path = os.path.join("src/uploads/plan_photos", candidate_plan.photo)
-                if os.path.exists(old_photo_path):
-                    os.remove(old_photo_path)
-            # Update Photo Path And Save It
-            filename = f"{uuid4().hex}_{photo.filename}"
-            file_path = os.path.join("src/uploads/plan_photos", filename)
-            with open(file_path, "wb") as buffer:
-                buffer.write(file_content)
+            old_photo = candidate_plan.photo
             candidate_plan.photo = filename
         # Update Candidate Plan
         upated_data = data.model_dump(exclude_unset=True)
@@ -175,6 +171,9 @@ async def update_candidate_plan(
             setattr(candidate_plan, key, value)
         session.add(candidate_plan)
         await session.commit()
+        await remove_upload(session, "plan_photos", old_photo)
+        if photo:
+            queue_image_variants("plan_photos", filename)
         return JSONResponse(
             status_code=status.HTTP_200_OK,
             content={"detail": "Successfully updated candidate plan"}
@@ -206,12 +205,10 @@ async def remove_candidate_plan(
                 status_code=status.HTTP_404_NOT_FOUND,
                 content={"detail": "Candidate plan does not exists"}
             )
-        # Check If Candidate Plan Has Photo And Delete It
-        if candidate_plan.photo:
-            os.remove(os.path.join("src/uploads/plan_photos", candidate_plan.photo))
-        # Delete Candidate Plan
+        # Delete Candidate Plan And Its Photo
         await session.delete(candidate_plan)
         await session.commit()
+        await remove_upload(session, "plan_photos", candidate_plan.photo)
         return JSONResponse(
             status_code=status.HTTP_200_OK,
             content={"detail": "Successfully removed candidate plan"}
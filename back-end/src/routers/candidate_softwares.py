@@ -1,4 +1,4 @@
-from fastapi import APIRouter, HTTPException, Path, Depends, status
+from fastapi import APIRouter, HTTPException, Path, Body, Depends, status
 from fastapi.responses import JSONResponse
 from sqlmodel import select
 from sqlalchemy.orm import selectinload
@@ -13,6 +13,9 @@ from schemas.candidate_software import (
     UpdateSoftware,
     GetCandidateSoftware
 )
+from services.resume_pdf import invalidate_resume_cache
+from services.candidate_profiles import invalidate_candidate_profile
+from services.profile_sections import SECTION_MAX_ITEMS, SectionItemError, replace_section
 from utilities import get_current_user
 
 router = APIRouter(prefix="/candidate-softwares", tags=["candidate-softwares"])
@@ -71,6 +74,8 @@ async def create_software(
         )
         session.add(software)
         await session.commit()
+        invalidate_resume_cache(candidate_id)
+        invalidate_candidate_profile(candidate_id)
         return JSONResponse(
             status_code=status.HTTP_201_CREATED,
             content={"detail": "Successfully registered software"}
@@ -88,6 +93,50 @@ async def create_software(
             detail="An error occurred on the server"
         )
 
+@router.put("/")
+async def replace_softwares(
+    session: SessionDep,
+    data: Annotated[list[CreateSoftware], Body(max_length=SECTION_MAX_ITEMS)],
+    current_user: dict = Depends(get_current_user)
+) -> JSONResponse:
+    try:
+        candidate_id = current_user.get("sub")
+        # Replace Candidate Softwares With The Sent Ones
+        try:
+            changes = await replace_section(
+                session,
+                CandidateSoftware,
+                "candidate_software_id",
+                candidate_id,
+                [software.model_dump() for software in data],
+                key_fields=("software_id",)
+            )
+        except SectionItemError:
+            await session.rollback()
+            return JSONResponse(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                content={"detail": "Softwares must not be repeated"}
+            )
+        await session.commit()
+        invalidate_resume_cache(candidate_id)
+        invalidate_candidate_profile(candidate_id)
+        return JSONResponse(
+            status_code=status.HTTP_200_OK,
+            content={"detail": "Successfully updated softwares", **changes}
+        )
+    except IntegrityError as ex:
+        await session.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, 
+            detail="An integrity error occurred. This may be due to a foreign key constraint violation or a data integrity issue. Please verify the data and try again"
+        )
+    except Exception as ex:
+        await session.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, 
+            detail="An error occurred on the server"
+        )
+
 @router.put("/{candidate_software_id}")
 async def update_software(
     session: SessionDep,
@@ -109,6 +158,8 @@ async def update_software(
             setattr(software, key, value)
         session.add(software)
         await session.commit()
+        invalidate_resume_cache(software.candidate_id)
+        invalidate_candidate_profile(software.candidate_id)
         return JSONResponse(
             status_code=status.HTTP_200_OK,
             content={"detail": "Successfully updated software"}
@@ -143,6 +194,8 @@ async def remove_software(
         # Delete Candidate Software
         await session.delete(software)
         await session.commit()
+        invalidate_resume_cache(software.candidate_id)
+        invalidate_candidate_profile(software.candidate_id)
         return JSONResponse(
             status_code=status.HTTP_200_OK,
             content={"detail": "Successfully removed software"}
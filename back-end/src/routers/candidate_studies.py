@@ -1,4 +1,4 @@
-from fastapi import APIRouter, HTTPException, Path, Depends, status
+from fastapi import APIRouter, HTTPException, Path, Body, Depends, status
 from fastapi.responses import JSONResponse
 from sqlalchemy.exc import IntegrityError
 from sqlmodel import select
@@ -7,7 +7,10 @@ from typing import Annotated
 from config.db import SessionDep
 from models.candidate import Candidate
 from models.candidate_study import CandidateStudy
-from schemas.candidate_study import CreateStudy, UpdateStudy, GetStudy
+from schemas.candidate_study import CreateStudy, UpdateStudy, UpsertStudy, GetStudy
+from services.resume_pdf import invalidate_resume_cache
+from services.candidate_profiles import invalidate_candidate_profile
+from services.profile_sections import SECTION_MAX_ITEMS, SectionItemError, replace_section
 from utilities import get_current_user
 
 router = APIRouter(prefix="/candidate-studies", tags=["candidate-studies"])
@@ -53,6 +56,8 @@ async def create_study(
         )
         session.add(study)
         await session.commit()
+        invalidate_resume_cache(candidate_id)
+        invalidate_candidate_profile(candidate_id)
         return JSONResponse(
             status_code=status.HTTP_201_CREATED,
             content={"detail": "Successfully registered study"}
@@ -70,6 +75,49 @@ async def create_study(
             detail="An error occurred on the server"
         )
 
+@router.put("/")
+async def replace_studies(
+    session: SessionDep,
+    data: Annotated[list[UpsertStudy], Body(max_length=SECTION_MAX_ITEMS)],
+    current_user: dict = Depends(get_current_user)
+) -> JSONResponse:
+    try:
+        candidate_id = current_user.get("sub")
+        # Replace Candidate Studies With The Sent Ones
+        try:
+            changes = await replace_section(
+                session,
+                CandidateStudy,
+                "study_id",
+                candidate_id,
+                [study.model_dump() for study in data]
+            )
+        except SectionItemError:
+            await session.rollback()
+            return JSONResponse(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                content={"detail": "Study does not exists"}
+            )
+        await session.commit()
+        invalidate_resume_cache(candidate_id)
+        invalidate_candidate_profile(candidate_id)
+        return JSONResponse(
+            status_code=status.HTTP_200_OK,
+            content={"detail": "Successfully updated studies", **changes}
+        )
+    except IntegrityError as ex:
+        await session.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, 
+            detail="An integrity error occurred. This may be due to a foreign key constraint violation or a data integrity issue. Please verify the data and try again"
+        )
+    except Exception as ex:
+        await session.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, 
+            detail="An error occurred on the server"
+        )
+
 @router.put("/{study_id}")
 async def update_study(
     session: SessionDep,
@@ -91,6 +139,8 @@ async def update_study(
             setattr(study, key, value)
         session.add(study)
         await session.commit()
+        invalidate_resume_cache(study.candidate_id)
+        invalidate_candidate_profile(study.candidate_id)
         return JSONResponse(
             status_code=status.HTTP_200_OK,
             content={"detail": "Successfully updated study"}
@@ -125,6 +175,8 @@ async def remove_study(
         # Delete Candidate Study
         await session.delete(study)
         await session.commit()
+        invalidate_resume_cache(study.candidate_id)
+        invalidate_candidate_profile(study.candidate_id)
         return JSONResponse(
             status_code=status.HTTP_200_OK,
             content={"detail": "Successfully removed study"}
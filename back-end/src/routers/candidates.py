@@ -1,32 +1,44 @@
-import os
-import pdfkit
-from fastapi import APIRouter, HTTPException, UploadFile, File, Depends, Path, status
-from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi import APIRouter, HTTPException, UploadFile, File, Query, Depends, Path, status
+from fastapi.responses import JSONResponse, FileResponse, StreamingResponse
 from sqlmodel import select
 from sqlalchemy.orm import selectinload
 from sqlalchemy.exc import IntegrityError
-from jinja2 import Environment, FileSystemLoader
-from io import BytesIO
 from typing import Annotated
-from uuid import uuid4
 
 from config.db import SessionDep
 from config.settings import get_settings
 from models.candidate import Candidate
-from models.candidate_certification import CandidateCertification
-from models.candidate_software import CandidateSoftware
-from models.candidate_language import CandidateLanguage
 from models.candidate_position_preference import CandidatePositionPreference
 from models.city import City
+from models.postulation import Postulation
+from models.job_offer import JobOffer
+from models.company_user import CompanyUser
 from schemas.candidate import UpdateCandidate, GetCandidate
 from schemas.candidate_position_preference import GetPositionPreference, UpdatePositionPreference
-from utilities import get_current_user
+from schemas.candidate_profile import GetCandidateProfile
+from schemas.extras import UserRoleEnum
+from services.resume_pdf import (
+    resume_profile_query,
+    render_resume_html,
+    get_resume_pdf,
+    stream_resumes_zip,
+    invalidate_resume_cache
+)
+from services.uploads import (
+    JPEG_CONTENT_TYPES,
+    UploadTypeError,
+    UploadSizeError,
+    save_upload,
+    remove_upload
+)
+from services.image_variants import queue_image_variants
+from services.candidate_profiles import get_candidate_profile, invalidate_candidate_profile
+from services.offer_matching import matching_engine
+from utilities import get_current_user, build_search_name
 
 router = APIRouter(prefix="/candidates", tags=["candidates"])
-template_dir = Environment(loader=FileSystemLoader("src/templates/cv"))
 settings = get_settings()
 
-WKHTMLTOPDF_PATH = settings.wkhtmltopdf_exe_path
 RESUME_CONTENT_TYPES = {
     "application/pdf",
     "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
@@ -60,6 +72,89 @@ async def get_candidate(
             detail="An error occurred on the server"
         )
 
+@router.get("/profile", response_model=GetCandidateProfile)
+async def get_profile(
+    session: SessionDep,
+    current_user: dict = Depends(get_current_user)
+) -> GetCandidateProfile | JSONResponse:
+    try:
+        # Get Every Profile Section In One Request, Cached Until A Section Changes
+        profile = await get_candidate_profile(session, int(current_user.get("sub")))
+        if not profile:
+            return JSONResponse(
+                status_code=status.HTTP_404_NOT_FOUND,
+                content={"detail": "Candidate does not exists"}
+            )
+        return JSONResponse(
+            status_code=status.HTTP_200_OK,
+            content=profile
+        )
+    except Exception as ex:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, 
+            detail="An error occurred on the server"
+        )
+
+@router.get("/resumes")
+async def get_resumes(
+    session: SessionDep,
+    offer_id: Annotated[int | None, Query(gt=0)] = None,
+    candidate_ids: Annotated[list[int] | None, Query()] = None,
+    current_user: dict = Depends(get_current_user)
+):
+    try:
+        # Check User Role, Resumes Are Only Downloaded By Companies Of Their Applicants
+        if current_user.get("user_role") != UserRoleEnum.company_user:
+            return JSONResponse(
+                status_code=status.HTTP_403_FORBIDDEN,
+                content={"detail": "Only company users can download resumes"}
+            )
+        user = await session.get(CompanyUser, current_user.get("sub"))
+        # Get Offer Applicants Or Use The Requested Candidates
+        if offer_id:
+            # Check If Job Offer Exists And Belongs To The Company User
+            offer = await session.get(JobOffer, offer_id)
+            if not offer or offer.company_id != user.company_id:
+                return JSONResponse(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    content={"detail": "Job offer does not exists"}
+                )
+            query = select(Postulation.candidate_id).where(
+                Postulation.offer_id == offer_id
+            ).order_by(Postulation.postulation_id)
+            result = await session.execute(query)
+            candidate_ids = result.scalars().all()
+        elif candidate_ids:
+            # Check Every Candidate Applied To An Offer Of The Company
+            query = select(Postulation.candidate_id).join(
+                JobOffer, Postulation.offer_id == JobOffer.offer_id
+            ).where(
+                JobOffer.company_id == user.company_id,
+                Postulation.candidate_id.in_(candidate_ids)
+            ).distinct()
+            result = await session.execute(query)
+            if set(candidate_ids) - set(result.scalars().all()):
+                return JSONResponse(
+                    status_code=status.HTTP_403_FORBIDDEN,
+                    content={"detail": "Candidates must be applicants of the company job offers"}
+                )
+        if not candidate_ids:
+            return JSONResponse(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                content={"detail": "Offer id or candidate ids must be on the request and have candidates"}
+            )
+        file_name = f"cvs-oferta-{offer_id}.zip" if offer_id else "cvs.zip"
+        return StreamingResponse(
+            stream_resumes_zip(list(dict.fromkeys(candidate_ids))),
+            media_type="application/zip",
+            headers={"Content-Disposition": f'attachment; filename="{file_name}"'}
+        )
+    except Exception as ex:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, 
+            detail="An error occurred on the server"
+        )
+
 @router.get("/resume/{candidate_id}")
 async def get_resume(
     session: SessionDep,
@@ -68,21 +163,7 @@ async def get_resume(
 ):
     try:
         # Check If Candidate Exists
-        query = select(Candidate).options(
-            selectinload(Candidate.work_experiences),
-            selectinload(Candidate.candidate_studies),
-            selectinload(Candidate.candidate_certifications).options(
-                selectinload(CandidateCertification.certification_type)
-            ),
-            selectinload(Candidate.candidate_softwares).options(
-                selectinload(CandidateSoftware.software),
-                selectinload(CandidateSoftware.knownledge_level)
-            ),
-            selectinload(Candidate.candidate_languages).options(
-                selectinload(CandidateLanguage.language),
-                selectinload(CandidateLanguage.language_level)
-            )
-        ).where(Candidate.candidate_id == candidate_id)
+        query = resume_profile_query().where(Candidate.candidate_id == candidate_id)
         result = await session.execute(query)
         candidate = result.scalar_one_or_none()
         if not candidate:
@@ -90,16 +171,12 @@ async def get_resume(
                 status_code=status.HTTP_404_NOT_FOUND,
                 content={"detail": "Candidate does not exists"}
             )
-        # Set Resume HTML Template
-        template = template_dir.get_template("cv.html")
-        html_content = template.render(candidate=candidate)
-        # Generate PDF
-        config = pdfkit.configuration(wkhtmltopdf=WKHTMLTOPDF_PATH) if WKHTMLTOPDF_PATH else None
-        pdf_bytes = pdfkit.from_string(html_content, False, configuration=config)
-        return StreamingResponse(
-            BytesIO(pdf_bytes),
+        # Generate PDF Off The Event Loop Or Reuse The Cached One
+        pdf_path = await get_resume_pdf(candidate_id, render_resume_html(candidate))
+        return FileResponse(
+            pdf_path,
             media_type="application/pdf",
-            headers={"Content-Disposition": "attachment; filename=cv.pdf"}
+            filename="cv.pdf"
         )
     except Exception as ex:
         print(ex)
@@ -154,8 +231,11 @@ async def update_candidate(
         upated_data = data.model_dump(exclude_unset=True)
         for key, value in upated_data.items():
             setattr(candidate, key, value)
+        candidate.search_name = build_search_name(candidate.name, candidate.paternal, candidate.maternal)
         session.add(candidate)
         await session.commit()
+        invalidate_resume_cache(candidate.candidate_id)
+        invalidate_candidate_profile(candidate.candidate_id)
         return JSONResponse(
             status_code=status.HTTP_200_OK,
             content={"detail": "Successfully updated candidate"}
@@ -187,34 +267,26 @@ async def update_resume(
                 status_code=status.HTTP_404_NOT_FOUND,
                 content={"detail": "Candidate does not exists"}
             )
-        # Check File Content Type
-        if resume.content_type not in RESUME_CONTENT_TYPES:
+        # Save Resume Checking Its Type And Size While Streaming
+        try:
+            filename = await save_upload(session, resume, "resumes", RESUME_CONTENT_TYPES, RESUME_MAX_SIZE)
+        except UploadTypeError:
             return JSONResponse(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 content={"detail": "The file type must be .pdf or .docx"}
             )
-        # Check File Size
-        file_content = await resume.read()
-        if len(file_content) > RESUME_MAX_SIZE:
+        except UploadSizeError:
             return JSONResponse(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                content={"detail": "The file size must be a maximum of 1 MB"}
+                content={"detail": "The file size must be a maximum of 5 MB"}
             )
-        # Ensure Upload Directory Exists
-        os.makedirs("src/uploads/resumes", exist_ok=True)
-        # Check If Candidate Already Had Resume And Remove
-        if candidate.resume:
-            old_resume_path = os.path.join("src/uploads/resumes", candidate.resume)
-            if os.path.exists(old_resume_path):
-                os.remove(old_resume_path)
-        # Update Resume Path And Save It
-        filename = f"{uuid4().hex}_{resume.filename}"
-        file_path = os.path.join("src/uploads/resumes", filename)
-        with open(file_path, "wb") as buffer:
-            buffer.write(file_content)
+        # Update Resume Path And Remove The Previous One
+        old_resume = candidate.resume
         candidate.resume = filename
         session.add(candidate)
         await session.commit()
+        invalidate_candidate_profile(candidate.candidate_id)
+        await remove_upload(session, "resumes", old_resume)
         return JSONResponse(
             status_code=status.HTTP_200_OK,
             content={"detail": "Successfully updated candidate resume"}
@@ -246,34 +318,27 @@ async def update_photo(
                 status_code=status.HTTP_404_NOT_FOUND,
                 content={"detail": "Candidate does not exists"}
             )
-        # Check File Content Type
-        if photo.content_type != "image/jpeg":
+        # Save Photo Checking Its Type And Size While Streaming
+        try:
+            filename = await save_upload(session, photo, "photos", JPEG_CONTENT_TYPES, PHOTO_MAX_SIZE)
+        except UploadTypeError:
             return JSONResponse(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 content={"detail": "The file type must be .jpg"}
             )
-        # Check File Size
-        file_content = await photo.read()
-        if len(file_content) > PHOTO_MAX_SIZE:
+        except UploadSizeError:
             return JSONResponse(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 content={"detail": "The file size must be a maximum of 1 MB"}
             )
-        # Ensure Upload Directory Exists
-        os.makedirs("src/uploads/photos", exist_ok=True)
-        # Check If Candidate Already Had Photo And Remove
-        if candidate.photo:
-            old_photo_path = os.path.join("src/uploads/photos", candidate.photo)
-            if os.path.exists(old_photo_path):
-                os.remove(old_photo_path)
-        # Update Photo Path And Save It
-        filename = f"{uuid4().hex}_{photo.filename}"
-        file_path = os.path.join("src/uploads/photos", filename)
-        with open(file_path, "wb") as buffer:
-            buffer.write(file_content)
+        # Update Photo Path And Remove The Previous One
+        old_photo = candidate.photo
         candidate.photo = filename
         session.add(candidate)
         await session.commit()
+        invalidate_candidate_profile(candidate.candidate_id)
+        await remove_upload(session, "photos", old_photo)
+        queue_image_variants("photos", filename)
         return JSONResponse(
             status_code=status.HTTP_200_OK,
             content={"detail": "Successfully updated candidate photo"}
@@ -313,6 +378,8 @@ async def update_position_preferences(
             setattr(position_preference, key, value)
         session.add(position_preference)
         await session.commit()
+        invalidate_candidate_profile(position_preference.candidate_id)
+        await matching_engine.refresh_preference(session, position_preference.candidate_id)
         return JSONResponse(
             status_code=status.HTTP_200_OK,
             content={"detail": "Successfully updated candidate position preferences"}
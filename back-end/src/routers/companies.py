@@ -1,11 +1,9 @@
-import os
 from fastapi import APIRouter, HTTPException, UploadFile, File, Path, Query, Depends, status
 from fastapi.responses import JSONResponse
 from sqlmodel import select, func
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import selectinload
 from typing import Annotated
-from uuid import uuid4
 
 from config.db import SessionDep
 from models.company import Company
@@ -19,13 +17,17 @@ from schemas.company import (
 )
 from schemas.company_user import UserPositionEnum, UserStateEnum
 from schemas.extras import UserRoleEnum
+from services.active_offers import refresh_company_offers
+from services.offer_cache import invalidate_offer_caches
+from services.uploads import UploadTypeError, UploadSizeError, save_upload, remove_upload
+from services.image_variants import queue_image_variants
 from utilities import get_current_user
 
 router = APIRouter(prefix="/companies", tags=["companies"])
 
 LOGO_CONTENT_TYPES = {
     "image/jpeg",
-    "image/svg",
+    "image/svg+xml",
     "image/png"
 }
 # Size Is Set In 1 MB
@@ -184,34 +186,30 @@ async def update_photo(
                 status_code=status.HTTP_404_NOT_FOUND,
                 content={"detail": "Company does not exists"}
             )
-        # Check File Content Type
-        if logo.content_type not in LOGO_CONTENT_TYPES:
+        # Save Logo Checking Its Type And Size While Streaming
+        try:
+            filename = await save_upload(session, logo, "logos", LOGO_CONTENT_TYPES, LOGO_MAX_SIZE)
+        except UploadTypeError:
             return JSONResponse(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 content={"detail": "The file type must be .jpg, .svg or .png"}
             )
-        # Check File Size
-        file_content = await logo.read()
-        if len(file_content) > LOGO_MAX_SIZE:
+        except UploadSizeError:
             return JSONResponse(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 content={"detail": "The file size must be a maximum of 1 MB"}
             )
-        # Ensure Upload Directory Exists
-        os.makedirs("src/uploads/logos", exist_ok=True)
-        # Check If Company Already Had Logo And Remove
-        if company.logo:
-            old_logo_path = os.path.join("src/uploads/logos", company.logo)
-            if os.path.exists(old_logo_path):
-                os.remove(old_logo_path)
-        # Update Logo Path And Save It
-        filename = f"{uuid4().hex}_{logo.filename}"
-        file_path = os.path.join("src/uploads/logos", filename)
-        with open(file_path, "wb") as buffer:
-            buffer.write(file_content)
+        # Update Logo Path And Remove The Previous One
+        old_logo = company.logo
         company.logo = filename
         session.add(company)
+        # Sync Company Summary In Active Offers Projection
+        await session.flush()
+        await refresh_company_offers(session, company.company_id)
         await session.commit()
+        invalidate_offer_caches()
+        await remove_upload(session, "logos", old_logo)
+        queue_image_variants("logos", filename)
         return JSONResponse(
             status_code=status.HTTP_200_OK,
             content={"detail": "Successfully updated company logo"}
@@ -294,7 +292,11 @@ async def update_company(
         for key, value in upated_data.items():
             setattr(company, key, value)
         session.add(company)
+        # Sync Company Summary In Active Offers Projection
+        await session.flush()
+        await refresh_company_offers(session, company_id)
         await session.commit()
+        invalidate_offer_caches()
         return JSONResponse(
             status_code=status.HTTP_200_OK,
             content={"detail": "Successfully updated company"}
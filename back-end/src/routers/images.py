@@ -0,0 +1,53 @@
+import os
+from fastapi import APIRouter, Path, Request, Response
+from fastapi.responses import JSONResponse, FileResponse
+from typing import Annotated, Literal
+
+from services.uploads import UPLOADS_DIR, IMMUTABLE_CACHE_CONTROL, content_hash, upload_headers
+from services.image_variants import IMAGE_FOLDERS, variant_filename
+from routers.uploads import not_modified
+
+router = APIRouter(prefix="/images", tags=["images"])
+
+ImageSize = Literal["thumb", "small", "medium", "original"]
+# Variants Of Files Stored Before Content Addressing
+VARIANT_CACHE_CONTROL = "public, max-age=604800"
+
+@router.get("/{folder}/{size}/{filename}")
+async def get_image(
+    request: Request,
+    folder: str,
+    size: ImageSize,
+    filename: Annotated[str, Path(max_length=300)]
+):
+    # Check Folder And File Name
+    if folder not in IMAGE_FOLDERS or os.path.basename(filename) != filename:
+        return JSONResponse(
+            status_code=404,
+            content={"detail": "Image does not exists"}
+        )
+    original_path = os.path.join(UPLOADS_DIR, folder, filename)
+    if size != "original":
+        variant_path = variant_filename(original_path, size)
+        if os.path.exists(variant_path):
+            digest = content_hash(filename)
+            if not digest:
+                return FileResponse(
+                    variant_path,
+                    media_type="image/webp",
+                    headers={"Cache-Control": VARIANT_CACHE_CONTROL}
+                )
+            headers = {
+                "Cache-Control": IMMUTABLE_CACHE_CONTROL,
+                "ETag": f'"{digest}-{size}"'
+            }
+            if not_modified(request, headers["ETag"]):
+                return Response(status_code=304, headers=headers)
+            return FileResponse(variant_path, media_type="image/webp", headers=headers)
+    # Serve The Original While The Variant Is Not Generated Yet
+    if not os.path.exists(original_path):
+        return JSONResponse(
+            status_code=404,
+            content={"detail": "Image does not exists"}
+        )
+    return FileResponse(original_path, headers={"Cache-Control": "no-cache", **upload_headers(filename)})
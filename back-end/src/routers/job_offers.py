@@ -1,13 +1,18 @@
-from fastapi import APIRouter, HTTPException, Query, Path, Depends, status
-from fastapi.responses import JSONResponse
-from sqlmodel import select, func, or_
+import json
+import hashlib
+from fastapi import APIRouter, HTTPException, Request, Query, Path, Depends, status
+from fastapi.responses import JSONResponse, Response
+from sqlmodel import select, func, or_, and_
+from sqlalchemy import update
 from sqlalchemy.orm import selectinload
+from sqlalchemy.dialects.mysql import match
 from sqlalchemy.exc import IntegrityError
 from datetime import date
 from typing import Annotated, Literal, List, Dict, Any
 
 from config.db import SessionDep
 from models.job_offer import JobOffer
+from models.active_offer import ActiveOffer
 from models.codelco_job import CodelcoJob
 from models.job_question import JobQuestion
 from models.city import City
@@ -20,32 +25,88 @@ from models.job_type import JobType
 from models.shift import Shift
 from models.job_day import JobDay
 from models.postulation import Postulation
+from models.candidate import Candidate
 from schemas.job_offer import (
     CreateOffer,
     UpdateOffer,
     GetOffers,
     GetOffer,
     GetSummaryOffer,
+    GetOfferFacets,
+    GetOfferFunnel,
+    GetRecommendedOffer,
     OfferStateEnum,
     OfferFeaturedEnum
 )
 from schemas.job_question import QuestionTypeEnum
 from schemas.postulation import PostulationStateEnum
+from schemas.candidate import GetRecommendedCandidate
 from schemas.extras import UserRoleEnum
+from services.active_offers import refresh_active_offer, to_summary_offer
+from services.offer_facets import count_offer_facets
+from services.offer_matching import matching_engine
+from services.postulation_counters import get_offer_funnels, refresh_offer_counters
+from services.offer_codes import offer_code_allocator
+from services.offer_import import (
+    IMPORT_BATCH_SIZE,
+    IMPORT_MAX_ROWS,
+    ImportFormatError,
+    iter_json_rows,
+    iter_csv_rows,
+    import_offer_batch
+)
+from services.notifications import queue_notification, notify_not_selected_postulations
+from services.saved_searches import percolate_offer
+from services.offer_cache import (
+    OFFER_CACHE_TTL,
+    get_cached_latest,
+    set_cached_latest,
+    get_cached_facets,
+    set_cached_facets,
+    invalidate_offer_caches
+)
 from utilities import (
     validate_earlier_date, 
     get_current_user,
-    get_optional_user
+    get_optional_user,
+    encode_cursor,
+    decode_cursor,
+    build_fulltext_query
 )
 
 router = APIRouter(prefix="/job-offers", tags=["job-offers"])
 
 SourceType = Literal["portal", "panel"]
+SortType = Literal["recent", "relevance"]
+LATEST_MAX_LIMIT = 20
+RECOMMENDED_MAX_LIMIT = 50
+
+def apply_text_filters(query, offer_model, company_column, clean_search: str | None, clean_company: str | None):
+    # Use FullText Indexes And Fallback To LIKE When There Are No Indexable Terms
+    relevance = None
+    if clean_search:
+        search_terms = build_fulltext_query(clean_search)
+        if search_terms:
+            relevance = match(offer_model.title, offer_model.description, against=search_terms).in_boolean_mode()
+            query = query.where(relevance > 0)
+        else:
+            query = query.where(offer_model.title.ilike(f"%{clean_search}%"))
+    if clean_company:
+        company_terms = build_fulltext_query(clean_company)
+        if company_terms:
+            query = query.where(match(company_column, against=company_terms).in_boolean_mode() > 0)
+        else:
+            query = query.where(company_column.ilike(f"%{clean_company}%"))
+    return query, relevance
 
 @router.get("/", response_model=GetOffers)
 async def get_offers(
     session: SessionDep,
     page: Annotated[int, Query(gt=0)] = 1,
+    size: Annotated[int, Query(ge=1, le=50)] = 5,
+    cursor: Annotated[str | None, Query()] = None,
+    include_total: Annotated[bool, Query()] = True,
+    sort: Annotated[SortType, Query()] = "recent",
     search: Annotated[str | None, Query()] = None,
     region: Annotated[int | None, Query(gt=0)] = None,
     city: Annotated[int | None, Query(gt=0)] = None,
@@ -60,17 +121,18 @@ async def get_offers(
     try:
         clean_search = search.strip() if search and search.strip() else None
         clean_company = company.strip() if company and company.strip() else None
-        base_query = select(JobOffer).outerjoin(JobOffer.city).outerjoin(City.region).outerjoin(JobOffer.job_type).outerjoin(Company)
-        # Check Job Offers Source
-        if source == "portal":
-            base_query = base_query.where(
-                JobOffer.state == OfferStateEnum.active,
-                JobOffer.publication_date <= date.today(),
-                or_(
-                    JobOffer.closing_date >= date.today(),
-                    JobOffer.closing_date == None
-                )
+        # Relevance Ordering Is Page Based, Cursors Only Follow Publication Order
+        if cursor and sort == "relevance":
+            return JSONResponse(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                content={"detail": "Cursor pagination is only available for recent sort"}
             )
+        # Check Job Offers Source (Portal Reads The Active Offers Projection)
+        if source == "portal":
+            offer_model = ActiveOffer
+            base_query = select(ActiveOffer)
+            region_column = ActiveOffer.region_id
+            company_column = ActiveOffer.company_trade_name
         if source == "panel":
             # Check If User Is Authenticated
             if not current_user:
@@ -78,6 +140,10 @@ async def get_offers(
                     status_code=status.HTTP_401_UNAUTHORIZED,
                     content={"detail": "Not authenticated"}
                 )
+            offer_model = JobOffer
+            base_query = select(JobOffer).outerjoin(JobOffer.city).outerjoin(City.region).outerjoin(Company)
+            region_column = Region.number_region
+            company_column = Company.trade_name
             # Check User Type/Role
             if current_user.get("user_role") == UserRoleEnum.company_user:
                 # Get Company Id By User
@@ -85,40 +151,81 @@ async def get_offers(
                 base_query = base_query.where(JobOffer.company_id == user.company_id)
         # Check Query Params
         if region:
-            base_query = base_query.where(Region.number_region == region)
+            base_query = base_query.where(region_column == region)
         if city:
-            base_query = base_query.where(JobOffer.city_id == city)
-        if clean_search:
-            base_query = base_query.where(JobOffer.title.ilike(f"%{clean_search}%"))
+            base_query = base_query.where(offer_model.city_id == city)
         if contract:
-            base_query = base_query.where(JobOffer.type_id == contract)
+            base_query = base_query.where(offer_model.type_id == contract)
         if job_type:
-            base_query = base_query.where(JobType.name.ilike(job_type))
+            base_query = base_query.where(offer_model.job_type_id.in_(
+                select(JobType.job_type_id).where(JobType.name.ilike(job_type))
+            ))
         if state:
-            base_query = base_query.where(JobOffer.state == state)
-        if clean_company:
-            base_query = base_query.where(Company.trade_name.ilike(f"%{clean_company}%"))
-        # Get The Total Number Of Offers
-        f_query = select(func.count()).select_from(base_query.subquery())
-        f_result = await session.execute(f_query)
-        total_offers = f_result.scalar()
-        # Get Offers With Relationships
-        s_query = base_query.options(
-            selectinload(JobOffer.performance_area),
-            selectinload(JobOffer.city).selectinload(City.region),
-            selectinload(JobOffer.contract_type),
-            selectinload(JobOffer.job_type),
-            selectinload(JobOffer.company).selectinload(Company.company_sector)
-        ).offset(5 * (page - 1)).limit(5)
-        s_result = await session.execute(s_query)
+            base_query = base_query.where(offer_model.state == state)
+        base_query, relevance = apply_text_filters(base_query, offer_model, company_column, clean_search, clean_company)
+        # Get The Total Number Of Offers If It's Requested
+        total_offers = None
+        if include_total:
+            f_query = select(func.count()).select_from(base_query.subquery())
+            f_result = await session.execute(f_query)
+            total_offers = f_result.scalar()
+        # Apply Keyset Cursor Or Page Offset
+        order_clauses = [offer_model.publication_date.desc(), offer_model.offer_id.desc()]
+        if sort == "relevance" and relevance is not None:
+            order_clauses.insert(0, relevance.desc())
+        s_query = base_query.order_by(*order_clauses)
+        if cursor:
+            cursor_values = decode_cursor(cursor, (date, int))
+            if not cursor_values:
+                return JSONResponse(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    content={"detail": "Invalid pagination cursor"}
+                )
+            cursor_date, cursor_id = cursor_values
+            s_query = s_query.where(or_(
+                offer_model.publication_date < cursor_date,
+                and_(
+                    offer_model.publication_date == cursor_date,
+                    offer_model.offer_id < cursor_id
+                )
+            ))
+        else:
+            s_query = s_query.offset(size * (page - 1))
+        # Get Offers (One Extra Row To Know If There Are More)
+        if source == "panel":
+            s_query = s_query.options(
+                selectinload(JobOffer.performance_area),
+                selectinload(JobOffer.city).selectinload(City.region),
+                selectinload(JobOffer.contract_type),
+                selectinload(JobOffer.job_type),
+                selectinload(JobOffer.company).selectinload(Company.company_sector)
+            )
+        s_result = await session.execute(s_query.limit(size + 1))
         offers = s_result.scalars().all()
+        has_more = len(offers) > size
+        offers = offers[:size]
+        next_cursor = None
+        if has_more and sort == "recent":
+            next_cursor = encode_cursor(offers[-1].publication_date, offers[-1].offer_id)
         # Exclude Company Information If Is Necessary
-        if not company_info:
-            for offer in offers:
-                offer.company = None
+        if source == "portal":
+            offers = [to_summary_offer(offer, company_info) for offer in offers]
+        else:
+            if not company_info:
+                for offer in offers:
+                    offer.company = None
+            # Add Postulation Counts To Panel Offers With One Query
+            funnels = await get_offer_funnels(session, [offer.offer_id for offer in offers])
+            offers = [
+                GetSummaryOffer.model_validate(offer, from_attributes=True).model_copy(
+                    update={"funnel": GetOfferFunnel(**funnels[offer.offer_id])}
+                ) for offer in offers
+            ]
         return {
             "total_offers": total_offers,
-            "offers": offers
+            "offers": offers,
+            "next_cursor": next_cursor,
+            "has_more": has_more
         }
     except Exception as ex:
         raise HTTPException(
@@ -129,27 +236,119 @@ async def get_offers(
 @router.get("/latest", response_model=list[GetSummaryOffer], response_model_exclude_unset=True)
 async def get_latest(
     session: SessionDep,
-    featured: Annotated[bool, Query()] = False
-) -> list[GetSummaryOffer]:
+    request: Request,
+    featured: Annotated[bool, Query()] = False,
+    limit: Annotated[int, Query(ge=1, le=LATEST_MAX_LIMIT)] = 5
+) -> Response:
     try:
-       # Get 5 Latest Job Offers (Featured Or Not)
-        featured = 1 if featured else 0
-        query = select(JobOffer).options(
-            selectinload(JobOffer.city).selectinload(City.region),
-            selectinload(JobOffer.company).selectinload(Company.company_sector),
-            selectinload(JobOffer.contract_type)
-        ).where(
-            JobOffer.featured == featured,
-            JobOffer.state == OfferStateEnum.active,
-            JobOffer.publication_date <= date.today(),
-            or_(
-                JobOffer.closing_date >= date.today(),
-                JobOffer.closing_date == None
+        # Get Latest Job Offers (Featured Or Not) From Cache Or Database
+        offers = get_cached_latest(featured)
+        if offers is None:
+            query = select(ActiveOffer).where(
+                ActiveOffer.featured == (1 if featured else 0)
+            ).order_by(ActiveOffer.offer_id.desc()).limit(LATEST_MAX_LIMIT)
+            result = await session.execute(query)
+            offers = [
+                GetSummaryOffer.model_validate(to_summary_offer(offer)).model_dump(mode="json")
+                for offer in result.scalars().all()
+            ]
+            set_cached_latest(featured, offers)
+        # Let Browsers And Proxies Revalidate With The ETag
+        content = json.dumps(offers[:limit], ensure_ascii=False).encode("utf-8")
+        headers = {
+            "ETag": f'"{hashlib.sha1(content).hexdigest()}"',
+            "Cache-Control": f"public, max-age={OFFER_CACHE_TTL}"
+        }
+        if request.headers.get("if-none-match") == headers["ETag"]:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        return Response(content=content, media_type="application/json", headers=headers)
+    except Exception as ex:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, 
+            detail="An error occurred on the server"
+        )
+
+@router.get("/facets", response_model=GetOfferFacets)
+async def get_facets(
+    session: SessionDep,
+    search: Annotated[str | None, Query()] = None,
+    region: Annotated[int | None, Query(gt=0)] = None,
+    city: Annotated[int | None, Query(gt=0)] = None,
+    contract: Annotated[int | None, Query(gt=0)] = None,
+    job_type: Annotated[str | None, Query()] = None,
+    company: Annotated[str | None, Query()] = None
+) -> GetOfferFacets:
+    try:
+        clean_search = search.strip() if search and search.strip() else None
+        clean_company = company.strip() if company and company.strip() else None
+        clean_job_type = job_type.strip().lower() if job_type and job_type.strip() else None
+        signature = (clean_search, region, city, contract, clean_job_type, clean_company)
+        facets = get_cached_facets(signature)
+        if facets is None:
+            # Group Active Offers By Every Facet In One Pass (Text Filters Are Applied In SQL)
+            group_columns = [
+                ActiveOffer.region_id,
+                ActiveOffer.region_name,
+                ActiveOffer.city_id,
+                ActiveOffer.city_name,
+                ActiveOffer.type_id,
+                ActiveOffer.contract_name,
+                ActiveOffer.job_type_id,
+                JobType.name.label("job_type_name"),
+                ActiveOffer.company_id,
+                ActiveOffer.company_trade_name
+            ]
+            query = select(*group_columns, func.count().label("total")).outerjoin(
+                JobType, ActiveOffer.job_type_id == JobType.job_type_id
             )
-        ).order_by(JobOffer.offer_id.desc()) 
-        result = await session.execute(query)
-        offers = result.scalars().all()
-        return offers
+            query, _ = apply_text_filters(query, ActiveOffer, ActiveOffer.company_trade_name, clean_search, clean_company)
+            result = await session.execute(query.group_by(*group_columns))
+            groups = result.all()
+            # Same Facet Semantics As 'get_offers'
+            selected = {}
+            if region:
+                selected["regions"] = lambda group: group.region_id == region
+            if city:
+                selected["cities"] = lambda group: group.city_id == city
+            if contract:
+                selected["contract_types"] = lambda group: group.type_id == contract
+            if clean_job_type:
+                selected["job_types"] = lambda group: (group.job_type_name or "").lower() == clean_job_type
+            facets = count_offer_facets(groups, selected)
+            set_cached_facets(signature, facets)
+        return facets
+    except Exception as ex:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, 
+            detail="An error occurred on the server"
+        )
+
+@router.get("/recommended", response_model=list[GetRecommendedOffer], response_model_exclude_unset=True)
+async def get_recommended_offers(
+    session: SessionDep,
+    limit: Annotated[int, Query(ge=1, le=RECOMMENDED_MAX_LIMIT)] = 10,
+    current_user: dict = Depends(get_current_user)
+) -> list[GetRecommendedOffer] | JSONResponse:
+    try:
+        # Check If User Is A Candidate
+        if current_user.get("user_role") != UserRoleEnum.candidate:
+            return JSONResponse(
+                status_code=status.HTTP_403_FORBIDDEN,
+                content={"detail": "Only candidates have recommended job offers"}
+            )
+        # Score Every Active Offer Against The Candidate Preferences
+        await matching_engine.ensure_loaded(session)
+        matches = matching_engine.offers_for_candidate(int(current_user.get("sub")), limit)
+        if not matches:
+            return []
+        result = await session.execute(
+            select(ActiveOffer).where(ActiveOffer.offer_id.in_([offer_id for offer_id, _ in matches]))
+        )
+        offers = {offer.offer_id: offer for offer in result.scalars().all()}
+        return [
+            {**to_summary_offer(offers[offer_id]), "score": score}
+            for offer_id, score in matches if offer_id in offers
+        ]
     except Exception as ex:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, 
@@ -200,6 +399,83 @@ async def get_by_id(
             detail="An error occurred on the server"
         )
 
+@router.get("/{offer_id}/funnel", response_model=GetOfferFunnel)
+async def get_funnel(
+    session: SessionDep,
+    offer_id: Annotated[int, Path(gt=0)],
+    current_user: dict = Depends(get_current_user)
+) -> GetOfferFunnel | JSONResponse:
+    try:
+        # Check User Role, Postulation Counts Are Only Shown To The Offer Company And Admins
+        if current_user.get("user_role") not in (UserRoleEnum.company_user, UserRoleEnum.admin):
+            return JSONResponse(
+                status_code=status.HTTP_403_FORBIDDEN,
+                content={"detail": "Only company users and admins can see the offer funnel"}
+            )
+        # Check If Job Offer Exists And Belongs To The Company User
+        offer = await session.get(JobOffer, offer_id)
+        if offer and current_user.get("user_role") == UserRoleEnum.company_user:
+            user = await session.get(CompanyUser, current_user.get("sub"))
+            if offer.company_id != user.company_id:
+                offer = None
+        if not offer:
+            return JSONResponse(
+                status_code=status.HTTP_404_NOT_FOUND,
+                content={"detail": "Job offer does not exists"}
+            )
+        # Get Postulation Counts By State
+        funnels = await get_offer_funnels(session, [offer_id])
+        return funnels[offer_id]
+    except Exception as ex:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, 
+            detail="An error occurred on the server"
+        )
+
+@router.get("/{offer_id}/recommended-candidates", response_model=list[GetRecommendedCandidate])
+async def get_recommended_candidates(
+    session: SessionDep,
+    offer_id: Annotated[int, Path(gt=0)],
+    limit: Annotated[int, Query(ge=1, le=RECOMMENDED_MAX_LIMIT)] = 20,
+    current_user: dict = Depends(get_current_user)
+) -> list[GetRecommendedCandidate] | JSONResponse:
+    try:
+        # Check User Role, Candidate Contact Data Is Only Listed To The Offer Company And Admins
+        if current_user.get("user_role") not in (UserRoleEnum.company_user, UserRoleEnum.admin):
+            return JSONResponse(
+                status_code=status.HTTP_403_FORBIDDEN,
+                content={"detail": "Only company users and admins can list recommended candidates"}
+            )
+        # Check If Job Offer Exists And Belongs To The Company User
+        offer = await session.get(JobOffer, offer_id)
+        if offer and current_user.get("user_role") == UserRoleEnum.company_user:
+            user = await session.get(CompanyUser, current_user.get("sub"))
+            if offer.company_id != user.company_id:
+                offer = None
+        if not offer:
+            return JSONResponse(
+                status_code=status.HTTP_404_NOT_FOUND,
+                content={"detail": "Job offer does not exists"}
+            )
+        # Score Every Active Candidate Preference Against The Offer
+        await matching_engine.ensure_loaded(session)
+        matches = matching_engine.candidates_for_offer(offer_id, limit)
+        if not matches:
+            return []
+        result = await session.execute(
+            select(Candidate).where(Candidate.candidate_id.in_([candidate_id for candidate_id, _ in matches]))
+        )
+        candidates = {candidate.candidate_id: candidate for candidate in result.scalars().all()}
+        return [
+            {**candidates[candidate_id].model_dump(), "score": score}
+            for candidate_id, score in matches if candidate_id in candidates
+        ]
+    except Exception as ex:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, 
+            detail="An error occurred on the server"
+        )
+
 @router.post("/")
 async def create_offer(
     session: SessionDep,
@@ -229,14 +505,10 @@ async def create_offer(
             await session.flush()
             base_data["position"] = None
             base_data["specific_position_id"]= specific_position.specific_position_id
-        # Generate Next Job Offer Code
-        result = await session.execute(select(func.count(JobOffer.offer_id)))
-        count = result.scalar()
-        today = date.today()
-        # Create Job Offer
+        # Create Job Offer With The Next Unique Code
         offer = JobOffer(
             **base_data,
-            code= (1000 + count) + today.year + today.month + today.day,
+            code=await offer_code_allocator.allocate(),
             state=OfferStateEnum.pending,
             featured=OfferFeaturedEnum.not_featured
         )
@@ -265,7 +537,13 @@ async def create_offer(
                     offer_id=offer.offer_id
                 ))
             session.add_all(questions)
+        # Sync Active Offers Projection
+        await session.flush()
+        await refresh_active_offer(session, offer.offer_id)
         await session.commit()
+        invalidate_offer_caches()
+        await matching_engine.refresh_offer(session, offer.offer_id)
+        queue_notification(percolate_offer, offer.offer_id)
         return JSONResponse(
             status_code=status.HTTP_201_CREATED,
             content={"detail": "Successfully registered job offer"}
@@ -283,6 +561,73 @@ async def create_offer(
             detail="An error occurred on the server"
         )
 
+@router.post("/import")
+async def import_offers(
+    request: Request,
+    session: SessionDep,
+    current_user: dict = Depends(get_current_user)
+) -> JSONResponse:
+    try:
+        # Get Company Id Once For Every Imported Offer
+        company_id = None
+        if current_user.get("user_role") == UserRoleEnum.company_user:
+            user = await session.get(CompanyUser, current_user.get("sub"))
+            company_id = user.company_id
+        # Read Rows As They Arrive And Insert Them In Batches
+        if request.headers.get("content-type", "").startswith("text/csv"):
+            rows = iter_csv_rows(request.stream())
+        else:
+            rows = iter_json_rows(request.stream())
+        results = []
+        batch = []
+        row_number = 0
+        async for row in rows:
+            row_number += 1
+            if row_number > IMPORT_MAX_ROWS:
+                return JSONResponse(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    content={
+                        "detail": f"Import is limited to {IMPORT_MAX_ROWS} job offers per request",
+                        "results": results
+                    }
+                )
+            batch.append((row_number, row))
+            if len(batch) == IMPORT_BATCH_SIZE:
+                results += await import_offer_batch(session, batch, company_id)
+                await session.commit()
+                batch = []
+        if batch:
+            results += await import_offer_batch(session, batch, company_id)
+            await session.commit()
+        created = sum(1 for result in results if result["status"] == "created")
+        return JSONResponse(
+            status_code=status.HTTP_200_OK,
+            content={
+                "detail": "Job offers import finished",
+                "created": created,
+                "failed": len(results) - created,
+                "results": results
+            }
+        )
+    except ImportFormatError as ex:
+        await session.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"{ex}. Rows before the error were imported"
+        )
+    except IntegrityError as ex:
+        await session.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, 
+            detail="An integrity error occurred. This may be due to a foreign key constraint violation or a data integrity issue. Please verify the data and try again"
+        )
+    except Exception as ex:
+        await session.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, 
+            detail="An error occurred on the server"
+        )
+
 @router.put("/finish/{offer_id}")
 async def finish_offer(
     session: SessionDep,
@@ -299,16 +644,30 @@ async def finish_offer(
             )
         # Update Job Offer State
         offer.state = OfferStateEnum.finished
-        # Get Postulation Candidates
-        query = select(Postulation).where(Postulation.offer_id == offer_id)
-        result = await session.execute(query)
-        candidates = result.scalars().all()
-        # Update Candidate States
-        for candidate in candidates:
-            if candidate.state not in [PostulationStateEnum.contracted, PostulationStateEnum.not_selected]:
-                candidate.state = PostulationStateEnum.not_selected
-        session.add_all([*candidates, offer])
+        session.add(offer)
+        # Discard Remaining Candidates In One Statement, Flagging Them For The Notifier
+        result = await session.execute(
+            update(Postulation).where(
+                Postulation.offer_id == offer_id,
+                Postulation.state.not_in([
+                    PostulationStateEnum.contracted,
+                    PostulationStateEnum.not_selected
+                ])
+            ).values(
+                state=PostulationStateEnum.not_selected,
+                notification_pending=1
+            ).execution_options(synchronize_session=False)
+        )
+        # Sync Active Offers Projection And Postulation Counters
+        await session.flush()
+        await refresh_active_offer(session, offer_id)
+        await refresh_offer_counters(session, offer_id)
         await session.commit()
+        invalidate_offer_caches()
+        await matching_engine.refresh_offer(session, offer_id)
+        # Notify Discarded Candidates Outside The Request, Earlier Rejections Were Already Emailed
+        if result.rowcount:
+            queue_notification(notify_not_selected_postulations, offer_id)
         return JSONResponse(
             status_code=status.HTTP_200_OK,
             content={"detail": "Job offer finished successfully"}
@@ -353,7 +712,13 @@ async def update_offer(
         for key, value in upated_data.items():
             setattr(offer, key, value)
         session.add(offer)
+        # Sync Active Offers Projection
+        await session.flush()
+        await refresh_active_offer(session, offer_id)
         await session.commit()
+        invalidate_offer_caches()
+        await matching_engine.refresh_offer(session, offer_id)
+        queue_notification(percolate_offer, offer_id)
         return JSONResponse(
             status_code=status.HTTP_200_OK,
             content={"detail": "Successfully updated job offer"}
@@ -1,10 +1,15 @@
-from fastapi import APIRouter, HTTPException, BackgroundTasks, Query, Depends, Path, status
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, HTTPException, BackgroundTasks, Query, Header, Depends, Path, status
+from fastapi.responses import JSONResponse, StreamingResponse
 from fastapi_mail import MessageSchema, MessageType
+from sqlalchemy import insert, update
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import selectinload
+from sqlalchemy.dialects.mysql import match
 from sqlmodel import select, func, or_
-from typing import Annotated
+from collections import Counter
+import hashlib
+from datetime import date
+from typing import Annotated, Literal
 
 from config.db import SessionDep
 from config.email.email_utilities import send_postulation_email_confirmation
@@ -14,16 +19,33 @@ from models.job_offer import JobOffer
 from models.city import City
 from models.company import Company
 from models.candidate import Candidate
+from models.company_user import CompanyUser
 from schemas.postulation import (
     CreatePostulation,
     GetPostulations,
     UpdatePostulation,
+    UpdatePostulations,
     PostulationStateEnum
 )
-from utilities import get_current_user
+from schemas.extras import UserRoleEnum
+from services.postulation_counters import add_to_counter, move_counter
+from services.notifications import queue_notification, notify_not_selected_postulations
+from services.applicant_export import (
+    get_offer_questions,
+    stream_applicants_csv,
+    stream_applicants_xlsx
+)
+from utilities import (
+    get_current_user,
+    is_duplicate_entry,
+    build_search_name,
+    build_fulltext_query
+)
 
 router = APIRouter(prefix="/postulations", tags=["postulations"])
 
+BULK_UPDATE_BATCH_SIZE = 500
+
 @router.get("/", response_model=GetPostulations)
 async def get_by_candidate(
     session: SessionDep,
@@ -82,11 +104,18 @@ async def get_by_offer(
         # Check Query Params
         base_query = select(Postulation).join(Postulation.candidate).where(Postulation.offer_id == offer_id)
         if clean_search:
-            base_query = base_query.where(or_(
-                Candidate.name.ilike(f"%{clean_search}%"),
-                Candidate.paternal.ilike(f"%{clean_search}%"),
-                Candidate.maternal.ilike(f"%{clean_search}%")
-            ))
+            # Match Every Term By Prefix On The Accent Folded Full Name
+            search_terms = build_fulltext_query(clean_search)
+            if search_terms:
+                base_query = base_query.where(
+                    match(Candidate.search_name, against=search_terms).in_boolean_mode() > 0
+                )
+            else:
+                for token in build_search_name(clean_search).split():
+                    base_query = base_query.where(or_(
+                        Candidate.search_name.like(f"{token}%"),
+                        Candidate.search_name.like(f"% {token}%")
+                    ))
         if state:
             base_query = base_query.where(Postulation.state == state)
         # Get Total Postulations
@@ -111,54 +140,221 @@ async def get_by_offer(
             detail="An error occurred on the server"
         )
 
+@router.get("/{offer_id}/export", response_model=None)
+async def export_by_offer(
+    session: SessionDep,
+    offer_id: Annotated[int, Path(gt=0)],
+    format: Annotated[Literal["csv", "xlsx"], Query()] = "csv",
+    current_user: dict = Depends(get_current_user)
+) -> StreamingResponse | JSONResponse:
+    try:
+        # Check User Role, Applicant Data Is Only Exported To The Offer Company
+        if current_user.get("user_role") != UserRoleEnum.company_user:
+            return JSONResponse(
+                status_code=status.HTTP_403_FORBIDDEN,
+                content={"detail": "Only company users can export applicants"}
+            )
+        # Check If Job Offer Exists And Belongs To The Company User
+        offer = await session.get(JobOffer, offer_id)
+        if offer:
+            user = await session.get(CompanyUser, current_user.get("sub"))
+            if offer.company_id != user.company_id:
+                offer = None
+        if not offer:
+            return JSONResponse(
+                status_code=status.HTTP_404_NOT_FOUND,
+                content={"detail": "Job offer does not exists"}
+            )
+        # Get Offer Questions, One Column Per Question
+        questions = await get_offer_questions(session, offer_id)
+        if format == "xlsx":
+            content = stream_applicants_xlsx(offer_id, questions)
+            media_type = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+        else:
+            content = stream_applicants_csv(offer_id, questions)
+            media_type = "text/csv; charset=utf-8"
+        return StreamingResponse(
+            content,
+            media_type=media_type,
+            headers={"Content-Disposition": f'attachment; filename="postulantes-oferta-{offer.code}.{format}"'}
+        )
+    except Exception as ex:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, 
+            detail="An error occurred on the server"
+        )
+
 @router.post("/")
 async def create_postulation(
      session: SessionDep,
      background_tasks: BackgroundTasks,
      data: CreatePostulation,
+     idempotency_key: Annotated[str | None, Header(max_length=100)] = None,
      current_user: dict = Depends(get_current_user)
 ) -> JSONResponse:
     try:
         candidate_id = current_user.get("sub")
-        # Check If Candidate Already Apply To This Offer
-        query = select(Postulation).where(
-            Postulation.offer_id == data.offer_id,
-            Postulation.candidate_id == candidate_id
+        request_hash = hashlib.sha256(data.model_dump_json().encode("utf-8")).hexdigest() if idempotency_key else None
+        # Get Job Offer Title For The Confirmation Email
+        result = await session.execute(
+            select(JobOffer.title).where(JobOffer.offer_id == data.offer_id)
         )
-        result = await session.execute(query)
-        applied_already = result.scalar_one_or_none()
-        if applied_already:
+        offer_title = result.scalar_one_or_none()
+        if offer_title is None:
             return JSONResponse(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                content={"detail": "Candidate applied already to this job offer"}
+                status_code=status.HTTP_404_NOT_FOUND,
+                content={"detail": "Job offer does not exists"}
+            )
+        # Create Postulation, The Unique Offer And Candidate Index Rejects Duplicates And Reused Keys
+        result = await session.execute(
+            insert(Postulation).values(
+                postulation_date=date.today(),
+                state=PostulationStateEnum.postulate,
+                candidate_id=candidate_id,
+                offer_id=data.offer_id,
+                idempotency_key=idempotency_key,
+                request_hash=request_hash
             )
-        # Create Postulation
-        postulation = Postulation(
-            **data.model_dump(), 
-            state=PostulationStateEnum.postulate,
-            candidate_id=candidate_id
         )
-        session.add(postulation)
-        # Check If Postulation Have Answers And Register
+        postulation_id = result.inserted_primary_key[0]
+        await add_to_counter(session, data.offer_id, PostulationStateEnum.postulate, 1)
+        # Register Postulation Answers In One Statement
         if data.answers:
-            await session.flush()
-            answers = []
-            for a in data.answers:
-                answers.append(JobAnswer(
-                    answer=a.answer,
-                    question_id=a.question_id,
-                    postulation_id=postulation.postulation_id
-                ))
-                session.add_all(answers)
+            await session.execute(
+                insert(JobAnswer),
+                [{
+                    "answer": a.answer,
+                    "question_id": a.question_id,
+                    "postulation_id": postulation_id
+                } for a in data.answers]
+            )
         await session.commit()
-         # Get Job Offer
-        offer = await session.get(JobOffer, data.offer_id)
         # Send Postulation Email Confirmation
-        background_tasks.add_task(send_postulation_email_confirmation, offer.title)
-        # Send Confirmation Email
+        background_tasks.add_task(send_postulation_email_confirmation, offer_title)
+        return JSONResponse(
+            status_code=status.HTTP_200_OK,
+            content={
+                "detail": "Successfully registered postulation",
+                "postulation_id": postulation_id
+            }
+        )
+    except IntegrityError as ex:
+        await session.rollback()
+        if is_duplicate_entry(ex):
+            # Retries Carrying The Same Idempotency Key And Body Get The Original Answer Back
+            if idempotency_key:
+                result = await session.execute(
+                    select(Postulation.postulation_id, Postulation.request_hash).where(
+                        Postulation.candidate_id == candidate_id,
+                        Postulation.idempotency_key == idempotency_key
+                    )
+                )
+                original = result.first()
+                if original and original.request_hash == request_hash:
+                    return JSONResponse(
+                        status_code=status.HTTP_200_OK,
+                        content={
+                            "detail": "Successfully registered postulation",
+                            "postulation_id": original.postulation_id
+                        }
+                    )
+                if original:
+                    return JSONResponse(
+                        status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                        content={"detail": "Idempotency key was already used with a different request"}
+                    )
+            return JSONResponse(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                content={"detail": "Candidate applied already to this job offer"}
+            )
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, 
+            detail="An integrity error occurred. This may be due to a foreign key constraint violation or a data integrity issue. Please verify the data and try again"
+        )
+    except Exception as ex:
+        await session.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, 
+            detail="An error occurred on the server"
+        )
+
+@router.put("/state")
+async def update_states(
+    session: SessionDep,
+    data: UpdatePostulations,
+    current_user: dict = Depends(get_current_user)
+) -> JSONResponse:
+    try:
+        # Check User Role, Postulation States Are Only Changed By Companies And Admins
+        if current_user.get("user_role") not in (UserRoleEnum.company_user, UserRoleEnum.admin):
+            return JSONResponse(
+                status_code=status.HTTP_403_FORBIDDEN,
+                content={"detail": "Only company users and admins can update postulation states"}
+            )
+        # Check If Job Offer Exists And Belongs To The Company User
+        offer = await session.get(JobOffer, data.offer_id)
+        if offer and current_user.get("user_role") == UserRoleEnum.company_user:
+            user = await session.get(CompanyUser, current_user.get("sub"))
+            if offer.company_id != user.company_id:
+                offer = None
+        if not offer:
+            return JSONResponse(
+                status_code=status.HTTP_404_NOT_FOUND,
+                content={"detail": "Job offer does not exists"}
+            )
+        # Lock The Selected Postulations Of The Offer And Read Their Current State
+        query = select(Postulation.postulation_id, Postulation.state).where(
+            Postulation.offer_id == data.offer_id
+        )
+        if data.postulation_ids:
+            query = query.where(Postulation.postulation_id.in_(data.postulation_ids))
+        if data.current_state:
+            query = query.where(Postulation.state == data.current_state)
+        result = await session.execute(query.with_for_update())
+        current_states = dict(result.all())
+        updated_ids = [
+            postulation_id for postulation_id, state in current_states.items()
+            if state != data.state
+        ]
+        # Update Postulations In One Statement Per Batch
+        for start in range(0, len(updated_ids), BULK_UPDATE_BATCH_SIZE):
+            await session.execute(
+                update(Postulation).where(
+                    Postulation.postulation_id.in_(updated_ids[start:start + BULK_UPDATE_BATCH_SIZE])
+                ).values(
+                    state=data.state,
+                    # Only Postulations Discarded Here Are Left For The Notifier
+                    notification_pending=int(data.state == PostulationStateEnum.not_selected)
+                ).execution_options(synchronize_session=False)
+            )
+        # Move Postulation Counters
+        if updated_ids:
+            moved = Counter(current_states[postulation_id] for postulation_id in updated_ids)
+            for state, amount in moved.items():
+                await add_to_counter(session, data.offer_id, state, -amount)
+            await add_to_counter(session, data.offer_id, data.state, len(updated_ids))
+        await session.commit()
+        # Notify Not Selected Candidates Outside The Request
+        if updated_ids and data.state == PostulationStateEnum.not_selected:
+            queue_notification(notify_not_selected_postulations, data.offer_id)
+        # Report Outcome Per Postulation
+        requested_ids = data.postulation_ids or list(current_states)
+        results = []
+        for postulation_id in requested_ids:
+            if postulation_id not in current_states:
+                outcome = "not_found"
+            elif current_states[postulation_id] == data.state:
+                outcome = "unchanged"
+            else:
+                outcome = "updated"
+            results.append({"postulation_id": postulation_id, "status": outcome})
         return JSONResponse(
             status_code=status.HTTP_200_OK,
-            content={"detail": "Successfully registered postulation"}
+            content={
+                "detail": "Successfully updated postulations",
+                "updated": len(updated_ids),
+                "results": results
+            }
         )
     except IntegrityError as ex:
         await session.rollback()
@@ -181,18 +377,20 @@ async def update_study(
     _: dict = Depends(get_current_user)
 ) -> JSONResponse:
     try:
-        # Check If Postulation Exists
-        postulation = await session.get(Postulation, postulation_id)
+        # Check If Postulation Exists (Locked So Counters Move From The Real State)
+        postulation = await session.get(Postulation, postulation_id, with_for_update=True)
         if not postulation:
             return JSONResponse(
                 status_code=status.HTTP_404_NOT_FOUND,
                 content={"detail": "Postulation does not exists"}
             )
+        previous_state = postulation.state
         # Update Postulation
         upated_data = data.model_dump(exclude_unset=True)
         for key, value in upated_data.items():
             setattr(postulation, key, value)
         session.add(postulation)
+        await move_counter(session, postulation.offer_id, previous_state, postulation.state)
         await session.commit()
         return JSONResponse(
             status_code=status.HTTP_200_OK,
@@ -1,11 +1,9 @@
-import os
 import json
 from fastapi import APIRouter, HTTPException, Path, Depends, File, Form, Query, UploadFile, status
 from fastapi.responses import JSONResponse
 from sqlmodel import select, func
 from sqlalchemy.orm import selectinload
 from sqlalchemy.exc import IntegrityError
-from uuid import uuid4
 from typing import Annotated, Literal
 
 from config.db import SessionDep
@@ -17,6 +15,14 @@ from schemas.publication import (
     GetPublications,
     PublicationStateEnum
 )
+from services.uploads import (
+    JPEG_CONTENT_TYPES,
+    UploadTypeError,
+    UploadSizeError,
+    save_upload,
+    remove_upload
+)
+from services.image_variants import queue_image_variants
 from utilities import get_current_user
 
 router = APIRouter(prefix="/publications", tags=["publications"])
@@ -103,25 +109,19 @@ async def create_postulation(
         # Des-Serielize Payload
         data_dict = json.loads(payload)
         data = CreatePublication(**data_dict)
-        # Check Image Validations
-        if image.content_type != "image/jpeg":
+        # Save Image Checking Its Type And Size While Streaming
+        try:
+            filename = await save_upload(session, image, "publication_images", JPEG_CONTENT_TYPES, IMAGE_MAX_SIZE)
+        except UploadTypeError:
             return JSONResponse(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 content={"detail": "The file type must be .jpg"}
             )
-        file_content = await image.read()
-        if len(file_content) > IMAGE_MAX_SIZE:
+        except UploadSizeError:
             return JSONResponse(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 content={"detail": "The file size must be a maximum of 1 MB"}
             )
-        # Ensure Upload Directory Exists
-        os.makedirs("src/uploads/publication_images", exist_ok=True)
-        # Create Image Path And Save It
-        filename = f"{uuid4().hex}_{image.filename}"
-        file_path = os.path.join("src/uploads/publication_images", filename)
-        with open(file_path, "wb") as buffer:
-            buffer.write(file_content)
         # Create Publication
         publication = Publication(
             **data.model_dump(),
@@ -129,6 +129,7 @@ async def create_postulation(
         )
         session.add(publication)
         await session.commit()
+        queue_image_variants("publication_images", filename)
         return JSONResponse(
             status_code=status.HTTP_201_CREATED,
             content={"detail": "Successfully registered publication"}
@@ -165,31 +166,22 @@ async def update_publication(
                 status_code=status.HTTP_404_NOT_FOUND,
                 content={"detail": "Publication does not exists"}
             )
-        # Check Image Validations
+        # Save Image Checking Its Type And Size While Streaming
+        old_image = None
         if image:
-            if image.content_type != "image/jpeg":
+            try:
+                filename = await save_upload(session, image, "publication_images", JPEG_CONTENT_TYPES, IMAGE_MAX_SIZE)
+            except UploadTypeError:
                 return JSONResponse(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     content={"detail": "The file type must be .jpg"}
                 )
-            file_content = await image.read()
-            if len(file_content) > IMAGE_MAX_SIZE:
+            except UploadSizeError:
                 return JSONResponse(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     content={"detail": "The file size must be a maximum of 1 MB"}
                 )
-            # Ensure Upload Directory Exists
-            os.makedirs("src/uploads/publication_images", exist_ok=True)
-            # Check If Publication Already Had Image And Remove It
-            if publication.image:
-                old_photo_path = os.path.join("src/uploads/publication_images", publication.image)
-                if os.path.exists(old_photo_path):
-                    os.remove(old_photo_path)
-            # Update Image Path And Save It
-            filename = f"{uuid4().hex}_{image.filename}"
-            file_path = os.path.join("src/uploads/publication_images", filename)
-            with open(file_path, "wb") as buffer:
-                buffer.write(file_content)
+            old_image = publication.image
             publication.image = filename
         # Update Publication
         upated_data = data.model_dump(exclude_unset=True)
@@ -197,6 +189,9 @@ async def update_publication(
             setattr(publication, key, value)
         session.add(publication)
         await session.commit()
+        await remove_upload(session, "publication_images", old_image)
+        if image:
+            queue_image_variants("publication_images", filename)
         return JSONResponse(
             status_code=status.HTTP_200_OK,
             content={"detail": "Successfully updated publication"}
@@ -229,14 +224,10 @@ async def remove_publication(
                 status_code=status.HTTP_404_NOT_FOUND,
                 content={"detail": "Publication plan does not exists"}
             )
-        # Check If Publication Has Image And Delete It
-        if publication.image:
-            # Ensure Upload Directory Exists
-            os.makedirs("src/uploads/publication_images", exist_ok=True)
-            os.remove(os.path.join("src/uploads/publication_images", publication.image))
-        # Delete Publication
+        # Delete Publication And Its Image
         await session.delete(publication)
         await session.commit()
+        await remove_upload(session, "publication_images", publication.image)
         return JSONResponse(
             status_code=status.HTTP_200_OK,
             content={"detail": "Successfully removed publication"}
@@ -0,0 +1,181 @@
+from fastapi import APIRouter, HTTPException, Query, Path, Depends, status
+from fastapi.responses import JSONResponse
+from sqlmodel import select, func
+from sqlalchemy import update, delete
+from sqlalchemy.exc import IntegrityError
+from typing import Annotated
+
+from config.db import SessionDep
+from models.saved_search import SavedSearch
+from models.saved_search_hit import SavedSearchHit
+from models.active_offer import ActiveOffer
+from schemas.saved_search import CreateSavedSearch, GetSavedSearch, GetSavedSearchHit
+from schemas.extras import UserRoleEnum
+from services.active_offers import to_summary_offer
+from services.saved_searches import SAVED_SEARCH_MAX_PER_CANDIDATE, saved_search_index
+from utilities import get_current_user
+
+router = APIRouter(prefix="/saved-searches", tags=["saved-searches"])
+
+HITS_MAX_LIMIT = 50
+
+@router.get("/", response_model=list[GetSavedSearch])
+async def get_saved_searches(
+    session: SessionDep,
+    current_user: dict = Depends(get_current_user)
+) -> list[GetSavedSearch]:
+    try:
+        # Get Candidate Saved Searches
+        query = select(SavedSearch).where(
+            SavedSearch.candidate_id == current_user.get("sub")
+        ).order_by(SavedSearch.search_id)
+        result = await session.execute(query)
+        searches = result.scalars().all()
+        return searches
+    except Exception as ex:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="An error occurred on the server"
+        )
+
+@router.get("/hits", response_model=list[GetSavedSearchHit], response_model_exclude_unset=True)
+async def get_saved_search_hits(
+    session: SessionDep,
+    limit: Annotated[int, Query(ge=1, le=HITS_MAX_LIMIT)] = 20,
+    unseen: Annotated[bool, Query()] = False,
+    current_user: dict = Depends(get_current_user)
+) -> list[GetSavedSearchHit]:
+    try:
+        # Get The Latest Hits Whose Offer Is Still Visible
+        query = select(SavedSearchHit, ActiveOffer).join(
+            ActiveOffer, SavedSearchHit.offer_id == ActiveOffer.offer_id
+        ).where(
+            SavedSearchHit.candidate_id == current_user.get("sub")
+        ).order_by(SavedSearchHit.creation_date.desc()).limit(limit)
+        if unseen:
+            query = query.where(SavedSearchHit.seen == 0)
+        result = await session.execute(query)
+        return [
+            {
+                "search_id": hit.search_id,
+                "seen": hit.seen,
+                "creation_date": hit.creation_date,
+                "offer": to_summary_offer(offer)
+            } for hit, offer in result.all()
+        ]
+    except Exception as ex:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="An error occurred on the server"
+        )
+
+@router.post("/")
+async def create_saved_search(
+    session: SessionDep,
+    data: CreateSavedSearch,
+    current_user: dict = Depends(get_current_user)
+) -> JSONResponse:
+    try:
+        # Check If User Is A Candidate
+        if current_user.get("user_role") != UserRoleEnum.candidate:
+            return JSONResponse(
+                status_code=status.HTTP_403_FORBIDDEN,
+                content={"detail": "Only candidates can save searches"}
+            )
+        candidate_id = current_user.get("sub")
+        # Check Saved Searches Limit
+        result = await session.execute(
+            select(func.count()).select_from(SavedSearch).where(SavedSearch.candidate_id == candidate_id)
+        )
+        if result.scalar() >= SAVED_SEARCH_MAX_PER_CANDIDATE:
+            return JSONResponse(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                content={"detail": f"Candidates can save up to {SAVED_SEARCH_MAX_PER_CANDIDATE} searches"}
+            )
+        # Create Saved Search
+        search = SavedSearch(
+            **data.model_dump(),
+            candidate_id=candidate_id
+        )
+        session.add(search)
+        await session.commit()
+        saved_search_index.add(search)
+        return JSONResponse(
+            status_code=status.HTTP_201_CREATED,
+            content={"detail": "Successfully registered saved search"}
+        )
+    except IntegrityError as ex:
+        await session.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="An integrity error occurred. This may be due to a foreign key constraint violation or a data integrity issue. Please verify the data and try again"
+        )
+    except Exception as ex:
+        await session.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="An error occurred on the server"
+        )
+
+@router.put("/hits/seen")
+async def mark_hits_seen(
+    session: SessionDep,
+    current_user: dict = Depends(get_current_user)
+) -> JSONResponse:
+    try:
+        # Mark Every Candidate Hit As Seen
+        await session.execute(
+            update(SavedSearchHit).where(
+                SavedSearchHit.candidate_id == current_user.get("sub"),
+                SavedSearchHit.seen == 0
+            ).values(seen=1)
+        )
+        await session.commit()
+        return JSONResponse(
+            status_code=status.HTTP_200_OK,
+            content={"detail": "Successfully updated saved search hits"}
+        )
+    except Exception as ex:
+        await session.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="An error occurred on the server"
+        )
+
+@router.delete("/{search_id}")
+async def remove_saved_search(
+    session: SessionDep,
+    search_id: Annotated[int, Path(gt=0)],
+    current_user: dict = Depends(get_current_user)
+) -> JSONResponse:
+    try:
+        # Check If Saved Search Exists And Belongs To The Candidate
+        search = await session.get(SavedSearch, search_id)
+        if search and search.candidate_id != int(current_user.get("sub")):
+            search = None
+        if not search:
+            return JSONResponse(
+                status_code=status.HTTP_404_NOT_FOUND,
+                content={"detail": "Saved search does not exists"}
+            )
+        # Delete Saved Search With Its Hits
+        await session.execute(delete(SavedSearchHit).where(SavedSearchHit.search_id == search_id))
+        await session.delete(search)
+        await session.commit()
+        saved_search_index.remove(search_id)
+        return JSONResponse(
+            status_code=status.HTTP_200_OK,
+            content={"detail": "Successfully removed saved search"}
+        )
+    except IntegrityError as ex:
+        await session.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="An integrity error occurred. This may be due to a foreign key constraint violation or a data integrity issue. Please verify the data and try again"
+        )
+    except Exception as ex:
+        await session.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="An error occurred on the server"
+        )
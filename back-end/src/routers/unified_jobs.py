@@ -1,156 +1,214 @@
 from fastapi import APIRouter, HTTPException, Query, status
 from fastapi.responses import JSONResponse
-from sqlmodel import select, or_
-from datetime import date
+from sqlmodel import select, func, or_
+from sqlalchemy import String, DateTime, cast, literal, null, tuple_, union_all
+from sqlalchemy.dialects.mysql import match
+from datetime import datetime
 from typing import Annotated
 
 from config.db import SessionDep
 from models.job_offer import JobOffer
 from models.codelco_job import CodelcoJob
-from models.company import Company
+from models.active_offer import ActiveOffer
+from utilities import build_fulltext_query, encode_cursor, decode_cursor
 
 router = APIRouter(prefix="/unified-jobs", tags=["unified-jobs"])
 
+def build_unified_query(clean_search: str | None, region: str | None):
+    """
+    Construye el UNION ALL de empleos regulares y de Codelco con una proyección común
+    """
+    search_terms = build_fulltext_query(clean_search)
+
+    # Empleos regulares (la proyección de ofertas activas ya contiene solo las visibles)
+    regular_jobs_query = select(
+        literal("internal").label("source_type"),
+        JobOffer.offer_id.label("internal_id"),
+        JobOffer.title.label("title"),
+        ActiveOffer.company_trade_name.label("company_name"),
+        JobOffer.location.label("location"),
+        JobOffer.description.label("description"),
+        JobOffer.requirements.label("requirements"),
+        cast(JobOffer.publication_date, DateTime).label("publication_date"),
+        cast(JobOffer.closing_date, String).label("closing_date"),
+        JobOffer.salary.label("salary"),
+        JobOffer.years_experience.label("years_experience"),
+        null().label("external_url"),
+        null().label("external_id"),
+        JobOffer.featured.label("featured"),
+        JobOffer.position.label("position")
+    ).join(
+        ActiveOffer, JobOffer.offer_id == ActiveOffer.offer_id
+    )
+    if search_terms:
+        regular_jobs_query = regular_jobs_query.where(
+            match(JobOffer.title, JobOffer.description, against=search_terms).in_boolean_mode() > 0
+        )
+    elif clean_search:
+        regular_jobs_query = regular_jobs_query.where(
+            or_(
+                JobOffer.title.ilike(f"%{clean_search}%"),
+                JobOffer.description.ilike(f"%{clean_search}%")
+            )
+        )
+    if region:
+        regular_jobs_query = regular_jobs_query.where(JobOffer.location.ilike(f"%{region}%"))
+
+    # Empleos de Codelco activos
+    codelco_query = select(
+        literal("external").label("source_type"),
+        CodelcoJob.id.label("internal_id"),
+        CodelcoJob.titulo.label("title"),
+        literal("Codelco").label("company_name"),
+        CodelcoJob.ubicacion.label("location"),
+        CodelcoJob.descripcion.label("description"),
+        CodelcoJob.requisitos.label("requirements"),
+        CodelcoJob.fecha_scraped.label("publication_date"),
+        CodelcoJob.fecha.label("closing_date"),
+        null().label("salary"),
+        null().label("years_experience"),
+        CodelcoJob.url.label("external_url"),
+        CodelcoJob.id_proceso.label("external_id"),
+        literal(0).label("featured"),
+        CodelcoJob.titulo.label("position")
+    ).where(CodelcoJob.activo == True)
+    if search_terms:
+        codelco_query = codelco_query.where(
+            match(CodelcoJob.titulo, CodelcoJob.descripcion, against=search_terms).in_boolean_mode() > 0
+        )
+    elif clean_search:
+        codelco_query = codelco_query.where(
+            or_(
+                CodelcoJob.titulo.ilike(f"%{clean_search}%"),
+                CodelcoJob.descripcion.ilike(f"%{clean_search}%")
+            )
+        )
+    if region:
+        codelco_query = codelco_query.where(
+            or_(
+                CodelcoJob.region.ilike(f"%{region}%"),
+                CodelcoJob.ubicacion.ilike(f"%{region}%")
+            )
+        )
+
+    return union_all(regular_jobs_query, codelco_query).subquery("unified_jobs")
+
+def format_unified_job(job) -> dict:
+    """
+    Da formato a una fila del UNION ALL según su origen
+    """
+    if job.source_type == "internal":
+        return {
+            "id": f"regular_{job.internal_id}",
+            "internal_id": job.internal_id,
+            "title": job.title,
+            "company_name": job.company_name,
+            "location": job.location or "No especificada",
+            "description": job.description or "Descripción no disponible",
+            "requirements": job.requirements or "No especificados",
+            "publication_date": job.publication_date.date().isoformat() if job.publication_date else None,
+            "closing_date": job.closing_date,
+            "salary": job.salary,
+            "years_experience": job.years_experience,
+            "source_type": "internal",
+            "source": "Portal",
+            "can_apply_internal": True,
+            "can_apply_external": False,
+            "external_url": None,
+            "is_featured": job.featured == 1,
+            "position": job.position
+        }
+    return {
+        "id": f"codelco_{job.internal_id}",
+        "internal_id": job.internal_id,
+        "title": job.title,
+        "company_name": "Codelco",
+        "location": job.location,
+        "description": job.description or "Descripción no disponible",
+        "requirements": job.requirements or "No especificados",
+        "publication_date": job.publication_date.isoformat(),
+        "closing_date": job.closing_date,  # Fecha de cierre como string
+        "salary": None,
+        "years_experience": None,
+        "source_type": "external",
+        "source": "Codelco",
+        "can_apply_internal": False,
+        "can_apply_external": True,
+        "external_url": job.external_url,
+        "external_id": job.external_id,
+        "is_featured": False,
+        "position": job.position
+    }
+
 @router.get("/all-including-external")
 async def get_all_offers_including_external(
     session: SessionDep,
     page: Annotated[int, Query(gt=0)] = 1,
+    cursor: Annotated[str | None, Query()] = None,
     search: Annotated[str | None, Query()] = None,
     region: Annotated[str | None, Query()] = None,
     limit: Annotated[int, Query(ge=1, le=100)] = 20
 ) -> JSONResponse:
     """
     Endpoint público que incluye tanto empleos regulares como empleos de Codelco
-    para mostrar todo en el listado principal del portal
+    para mostrar todo en el listado principal del portal.
+    La unión, el orden y la paginación se resuelven en SQL (UNION ALL)
     """
     try:
         offset = (page - 1) * limit
-        all_jobs = []
-        
-        # Obtener empleos regulares activos
-        regular_jobs_query = select(JobOffer, Company.name.label("company_name")).join(
-            Company, JobOffer.company_id == Company.company_id
-        ).where(
-            JobOffer.state == "active",
-            JobOffer.publication_date <= date.today(),
-            or_(
-                JobOffer.closing_date >= date.today(),
-                JobOffer.closing_date == None
-            )
+        clean_search = search.strip() if search and search.strip() else None
+        unified = build_unified_query(clean_search, region)
+
+        # Conteos por fuente en una sola consulta agrupada
+        counts_result = await session.execute(
+            select(unified.c.source_type, func.count()).group_by(unified.c.source_type)
         )
-        
-        # Aplicar filtros
-        if search:
-            clean_search = search.strip()
-            regular_jobs_query = regular_jobs_query.where(
-                or_(
-                    JobOffer.title.ilike(f"%{clean_search}%"),
-                    JobOffer.description.ilike(f"%{clean_search}%")
-                )
-            )
-        
-        if region:
-            regular_jobs_query = regular_jobs_query.where(JobOffer.location.ilike(f"%{region}%"))
-        
-        regular_result = await session.execute(regular_jobs_query.order_by(JobOffer.publication_date.desc()))
-        regular_jobs = regular_result.all()
-        
-        # Formatear empleos regulares
-        for job, company_name in regular_jobs:
-            all_jobs.append({
-                "id": f"regular_{job.offer_id}",
-                "internal_id": job.offer_id,
-                "title": job.title,
-                "company_name": company_name,
-                "location": job.location or "No especificada",
-                "description": job.description or "Descripción no disponible",
-                "requirements": job.requirements or "No especificados",
-                "publication_date": job.publication_date.isoformat() if job.publication_date else None,
-                "closing_date": job.closing_date.isoformat() if job.closing_date else None,
-                "salary": job.salary,
-                "years_experience": job.years_experience,
-                "source_type": "internal",
-                "source": "Portal",
-                "can_apply_internal": True,
-                "can_apply_external": False,
-                "external_url": None,
-                "is_featured": job.featured == 1,
-                "position": job.position
-            })
-        
-        # Obtener empleos de Codelco activos
-        codelco_query = select(CodelcoJob).where(CodelcoJob.activo == True)
-        
-        # Aplicar filtros para Codelco
-        if search:
-            clean_search = search.strip()
-            codelco_query = codelco_query.where(
-                or_(
-                    CodelcoJob.titulo.ilike(f"%{clean_search}%"),
-                    CodelcoJob.descripcion.ilike(f"%{clean_search}%")
-                )
-            )
-        
-        if region:
-            codelco_query = codelco_query.where(
-                or_(
-                    CodelcoJob.region.ilike(f"%{region}%"),
-                    CodelcoJob.ubicacion.ilike(f"%{region}%")
+        counts = dict(counts_result.all())
+        internal_jobs = counts.get("internal", 0)
+        external_jobs = counts.get("external", 0)
+        total_jobs = internal_jobs + external_jobs
+
+        # Ordenar por fecha de publicación (más recientes primero) y paginar
+        sort_key = (unified.c.publication_date, unified.c.source_type, unified.c.internal_id)
+        jobs_query = select(unified).order_by(*[column.desc() for column in sort_key])
+        if cursor:
+            cursor_values = decode_cursor(cursor, (datetime, str, int))
+            if not cursor_values:
+                return JSONResponse(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    content={"detail": "Invalid pagination cursor"}
                 )
-            )
-        
-        codelco_result = await session.execute(codelco_query.order_by(CodelcoJob.fecha_scraped.desc()))
-        codelco_jobs = codelco_result.scalars().all()
-        
-        # Formatear empleos de Codelco
-        for job in codelco_jobs:
-            all_jobs.append({
-                "id": f"codelco_{job.id}",
-                "internal_id": job.id,
-                "title": job.titulo,
-                "company_name": "Codelco",
-                "location": job.ubicacion,
-                "description": job.descripcion or "Descripción no disponible",
-                "requirements": job.requisitos or "No especificados",
-                "publication_date": job.fecha_scraped.isoformat(),
-                "closing_date": job.fecha,  # Fecha de cierre como string
-                "salary": None,
-                "years_experience": None,
-                "source_type": "external",
-                "source": "Codelco",
-                "can_apply_internal": False,
-                "can_apply_external": True,
-                "external_url": job.url,
-                "external_id": job.id_proceso,
-                "is_featured": False,
-                "position": job.titulo
-            })
-        
-        # Ordenar todos los empleos por fecha de publicación (más recientes primero)
-        all_jobs.sort(key=lambda x: x["publication_date"] or "", reverse=True)
-        
-        # Aplicar paginación
-        total_jobs = len(all_jobs)
-        paginated_jobs = all_jobs[offset:offset + limit]
-        
+            jobs_query = jobs_query.where(tuple_(*sort_key) < tuple_(*cursor_values))
+        else:
+            jobs_query = jobs_query.offset(offset)
+        jobs_result = await session.execute(jobs_query.limit(limit + 1))
+        rows = jobs_result.all()
+        has_next = len(rows) > limit
+        rows = rows[:limit]
+        next_cursor = None
+        if has_next:
+            last = rows[-1]
+            next_cursor = encode_cursor(last.publication_date, last.source_type, last.internal_id)
+
         return JSONResponse(
             status_code=status.HTTP_200_OK,
             content={
                 "detail": "All offers including external retrieved successfully",
-                "jobs": paginated_jobs,
+                "jobs": [format_unified_job(job) for job in rows],
                 "pagination": {
                     "page": page,
                     "limit": limit,
                     "total": total_jobs,
                     "total_pages": (total_jobs + limit - 1) // limit,
-                    "has_next": offset + limit < total_jobs,
-                    "has_prev": page > 1
+                    "has_next": has_next,
+                    "has_prev": page > 1 or cursor is not None,
+                    "next_cursor": next_cursor
                 },
                 "statistics": {
                     "total_jobs": total_jobs,
-                    "internal_jobs": len([j for j in all_jobs if j["source_type"] == "internal"]),
-                    "external_jobs": len([j for j in all_jobs if j["source_type"] == "external"]),
-                    "codelco_jobs": len([j for j in all_jobs if j["source"] == "Codelco"])
+                    "internal_jobs": internal_jobs,
+                    "external_jobs": external_jobs,
+                    "codelco_jobs": external_jobs
                 },
                 "filters_applied": {
                     "search": search,
@@ -159,7 +217,7 @@ async def get_all_offers_including_external(
                 }
             }
         )
-        
+
     except Exception as ex:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -0,0 +1,48 @@
+import os
+from fastapi import APIRouter, Path, Request, Response
+from fastapi.responses import JSONResponse, FileResponse
+from typing import Annotated
+
+from services.uploads import (
+    UPLOADS_DIR,
+    UPLOAD_FOLDERS,
+    IMMUTABLE_CACHE_CONTROL,
+    content_hash,
+    upload_headers
+)
+
+router = APIRouter(prefix="/uploads", tags=["uploads"])
+
+def not_modified(request: Request, etag: str) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    return if_none_match.strip() == "*" or etag in [tag.strip() for tag in if_none_match.split(",")]
+
+@router.get("/{folder}/{filename}")
+async def get_upload(
+    request: Request,
+    folder: str,
+    filename: Annotated[str, Path(max_length=300)]
+):
+    # Check Folder And File Name
+    path = os.path.join(UPLOADS_DIR, folder, filename)
+    if folder not in UPLOAD_FOLDERS or os.path.basename(filename) != filename or not os.path.isfile(path):
+        return JSONResponse(
+            status_code=404,
+            content={"detail": "File does not exists"}
+        )
+    digest = content_hash(filename)
+    if not digest:
+        # Files Stored Before Content Addressing Must Be Revalidated
+        return FileResponse(path, headers={"Cache-Control": "no-cache", **upload_headers(filename)})
+    # The Name Is The Content Hash, So It Is A Strong Validator That Never Expires
+    headers = {
+        "Cache-Control": IMMUTABLE_CACHE_CONTROL,
+        "ETag": f'"{digest}"',
+        **upload_headers(filename)
+    }
+    if not_modified(request, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    # Range And If-Range Requests Are Answered By FileResponse
+    return FileResponse(path, headers=headers)
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, HTTPException, Path, Depends, status
+from fastapi import APIRouter, HTTPException, Path, Body, Depends, status
 from fastapi.responses import JSONResponse
 from sqlalchemy.exc import IntegrityError
 from sqlmodel import select
@@ -7,7 +7,10 @@ from typing import Annotated
 from config.db import SessionDep
 from models.candidate import Candidate
 from models.work_experience import WorkExperience
-from schemas.work_experience import CreateExperience, UpdateExperience, GetExperience
+from schemas.work_experience import CreateExperience, UpdateExperience, UpsertExperience, GetExperience
+from services.resume_pdf import invalidate_resume_cache
+from services.candidate_profiles import invalidate_candidate_profile
+from services.profile_sections import SECTION_MAX_ITEMS, SectionItemError, replace_section
 from utilities import get_current_user
 
 router = APIRouter(prefix="/work-experiences", tags=["work-experiences"])
@@ -51,6 +54,8 @@ async def create_experience(
         )
         session.add(experience)
         await session.commit()
+        invalidate_resume_cache(candidate_id)
+        invalidate_candidate_profile(candidate_id)
         return JSONResponse(
             status_code=status.HTTP_201_CREATED,
             content={"detail": "Successfully registered work experience"}
@@ -68,6 +73,49 @@ async def create_experience(
             detail="An error occurred on the server"
         )
 
+@router.put("/")
+async def replace_experiences(
+    session: SessionDep,
+    data: Annotated[list[UpsertExperience], Body(max_length=SECTION_MAX_ITEMS)],
+    current_user: dict = Depends(get_current_user)
+) -> JSONResponse:
+    try:
+        candidate_id = current_user.get("sub")
+        # Replace Candidate Experiences With The Sent Ones
+        try:
+            changes = await replace_section(
+                session,
+                WorkExperience,
+                "experience_id",
+                candidate_id,
+                [experience.model_dump() for experience in data]
+            )
+        except SectionItemError:
+            await session.rollback()
+            return JSONResponse(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                content={"detail": "Experience does not exists"}
+            )
+        await session.commit()
+        invalidate_resume_cache(candidate_id)
+        invalidate_candidate_profile(candidate_id)
+        return JSONResponse(
+            status_code=status.HTTP_200_OK,
+            content={"detail": "Successfully updated experiences", **changes}
+        )
+    except IntegrityError as ex:
+        await session.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, 
+            detail="An integrity error occurred. This may be due to a foreign key constraint violation or a data integrity issue. Please verify the data and try again"
+        )
+    except Exception as ex:
+        await session.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, 
+            detail="An error occurred on the server"
+        )
+
 @router.put("/{experience_id}")
 async def update_experience(
     session: SessionDep,
@@ -89,6 +137,8 @@ async def update_experience(
             setattr(experience, key, value)
         session.add(experience)
         await session.commit()
+        invalidate_resume_cache(experience.candidate_id)
+        invalidate_candidate_profile(experience.candidate_id)
         return JSONResponse(
             status_code=status.HTTP_200_OK,
             content={"detail": "Successfully updated work experience"}
@@ -123,6 +173,8 @@ async def remove_experience(
         # Delete Work Experience
         await session.delete(experience)
         await session.commit()
+        invalidate_resume_cache(experience.candidate_id)
+        invalidate_candidate_profile(experience.candidate_id)
         return JSONResponse(
             status_code=status.HTTP_200_OK,
             content={"detail": "Successfully removed work experience"}
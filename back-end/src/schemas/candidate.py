@@ -35,6 +35,9 @@ class GetSummaryCandidate(BaseModel):
     phone: str | None = None
     email: str
 
+class GetRecommendedCandidate(GetSummaryCandidate):
+    score: float
+
 class GetCandidate(GetSummaryCandidate):
     candidate_id: int
     run: str | None = None
@@ -60,4 +60,7 @@ class UpdateCertification(BaseCertification):
     def start_date_validations(cls, value: date, info: ValidationInfo) -> date:
         if not validate_earlier_date(value, info.data["expiration_date"]):
             raise ValueError("Start date must be less than the end date")
-        return value
\ No newline at end of file
+        return value
+
+class UpsertCertification(CreateCertification):
+    certification_id: conint(gt=0) | None = None
\ No newline at end of file
@@ -0,0 +1,18 @@
+from pydantic import BaseModel
+
+from .candidate import GetCandidate
+from .work_experience import GetExperience
+from .candidate_study import GetStudy
+from .candidate_language import GetCandidateLanguage
+from .candidate_software import GetCandidateSoftware
+from .candidate_certification import GetCertification
+from .candidate_position_preference import GetPositionPreference
+
+class GetCandidateProfile(BaseModel):
+    candidate: GetCandidate
+    work_experiences: list[GetExperience]
+    studies: list[GetStudy]
+    languages: list[GetCandidateLanguage]
+    softwares: list[GetCandidateSoftware]
+    certifications: list[GetCertification]
+    position_preference: GetPositionPreference | None = None
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, ConfigDict, ValidationInfo, field_validator
+from pydantic import BaseModel, ConfigDict, ValidationInfo, conint, field_validator
 from datetime import date
 
 from utilities import (
@@ -71,4 +71,7 @@ class UpdateStudy(BaseCompanyStudy):
     def start_date_validations(cls, value: date, info: ValidationInfo) -> date:
         if not validate_earlier_date(value, info.data["end_date"]):
             raise ValueError("Start date must be less than the end date")
-        return value
\ No newline at end of file
+        return value
+
+class UpsertStudy(CreateStudy):
+    study_id: conint(gt=0) | None = None
\ No newline at end of file
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, ConfigDict, EmailStr, field_validator
+from pydantic import BaseModel, ConfigDict, EmailStr, computed_field, field_validator
 
 from utilities import (
     validate_empty_string,
@@ -7,6 +7,7 @@ from utilities import (
 )
 from .company_user import CreateFounder, UserStateEnum
 from .company_sector import GetSector
+from services.image_variants import image_variant_url
 
 class BaseCompany(BaseModel):
     model_config=ConfigDict(
@@ -36,6 +37,11 @@ class GetSummaryCompany(BaseModel):
     logo: str | None = None
     company_sector: GetSector | None = None
 
+    @computed_field
+    @property
+    def logo_small(self) -> str | None:
+        return image_variant_url("logos", self.logo, "small")
+
 class GetCompanyWithState(GetCompany):
     state: int
 
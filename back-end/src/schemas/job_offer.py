@@ -56,6 +56,13 @@ class GetOffer(BaseModel):
     job_day: GetJobDay | None = None
     job_questions: list[GetQuestion]
 
+class GetOfferFunnel(BaseModel):
+    total: int = 0
+    postulate: int = 0
+    in_progress: int = 0
+    not_selected: int = 0
+    contracted: int = 0
+
 class GetSummaryOffer(BaseModel):
     offer_id: int
     title: str
@@ -69,10 +76,29 @@ class GetSummaryOffer(BaseModel):
     city: GetCity | None = None
     contract_type: GetContract | None = None
     company: GetSummaryCompany | None = None
+    funnel: GetOfferFunnel | None = None
+
+class GetRecommendedOffer(GetSummaryOffer):
+    score: float
 
 class GetOffers(BaseModel):
-    total_offers: int
+    total_offers: int | None = None
     offers: list[GetSummaryOffer]
+    next_cursor: str | None = None
+    has_more: bool = False
+
+class GetFacetValue(BaseModel):
+    value_id: int
+    name: str | None = None
+    total: int
+
+class GetOfferFacets(BaseModel):
+    total_offers: int
+    regions: list[GetFacetValue]
+    cities: list[GetFacetValue]
+    contract_types: list[GetFacetValue]
+    job_types: list[GetFacetValue]
+    companies: list[GetFacetValue]
 
 class CreateOffer(BaseJobOffer):
     title: str
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, ConfigDict, conint, conlist
+from pydantic import BaseModel, ConfigDict, conint, conlist, model_validator
 from enum import Enum
 from datetime import date
 
@@ -41,4 +41,17 @@ class CreatePostulation(BasePostulation):
     answers: conlist(CreateAnswer, min_length=1) | None = None
 
 class UpdatePostulation(BasePostulation):
-    state: PostulationStateEnum
\ No newline at end of file
+    state: PostulationStateEnum
+
+class UpdatePostulations(BasePostulation):
+    offer_id: conint(gt=0)
+    state: PostulationStateEnum
+    postulation_ids: conlist(conint(gt=0), min_length=1, max_length=1000) | None = None
+    current_state: PostulationStateEnum | None = None
+
+    @model_validator(mode="after")
+    def validate_update_postulations(self) -> "UpdatePostulations":
+        # Check Postulation Ids Or Filter
+        if not self.postulation_ids and not self.current_state:
+            raise ValueError("Postulation ids or current state filter must be on the request")
+        return self
@@ -1,8 +1,9 @@
 from enum import Enum
 from datetime import date
-from pydantic import BaseModel, ConfigDict, conint, field_validator
+from pydantic import BaseModel, ConfigDict, computed_field, conint, field_validator
 
 from .publication_category import GetPublicationCategory
+from services.image_variants import image_variant_url
 from utilities import validate_empty_string
 
 class PublicationStateEnum(str, Enum):
@@ -24,6 +25,11 @@ class GetPublication(BaseModel):
     state: PublicationStateEnum
     publication_category: GetPublicationCategory
 
+    @computed_field
+    @property
+    def image_small(self) -> str | None:
+        return image_variant_url("publication_images", self.image, "small")
+
 class GetPublications(BaseModel):
     total_publications: int
     publications: list[GetPublication]
@@ -0,0 +1,48 @@
+from pydantic import BaseModel, ConfigDict, conint, field_validator, model_validator
+from datetime import datetime
+
+from utilities import validate_empty_string
+from .job_offer import GetSummaryOffer
+
+class BaseSavedSearch(BaseModel):
+    model_config=ConfigDict(
+        str_strip_whitespace=True,
+        extra="forbid"
+    )
+
+class GetSavedSearch(BaseModel):
+    search_id: int
+    name: str
+    search: str | None
+    region_id: int | None
+    city_id: int | None
+    type_id: int | None
+    job_type_id: int | None
+    creation_date: datetime
+
+class CreateSavedSearch(BaseSavedSearch):
+    name: str
+    search: str | None = None
+    region_id: conint(gt=0) | None = None
+    city_id: conint(gt=0) | None = None
+    type_id: conint(gt=0) | None = None
+    job_type_id: conint(gt=0) | None = None
+
+    @model_validator(mode="after")
+    def validate_create_saved_search(self) -> "CreateSavedSearch":
+        # Check That The Search Filters Something
+        if not any((self.search, self.region_id, self.city_id, self.type_id, self.job_type_id)):
+            raise ValueError("At least one search filter must be on the request")
+        return self
+
+    @field_validator("name", "search")
+    def non_empty_string(cls, value: str) -> str:
+        if not validate_empty_string(value):
+            raise ValueError("Field cannot be an empty string")
+        return value
+
+class GetSavedSearchHit(BaseModel):
+    search_id: int
+    seen: int
+    creation_date: datetime
+    offer: GetSummaryOffer
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, ConfigDict, ValidationInfo, field_validator
+from pydantic import BaseModel, ConfigDict, ValidationInfo, conint, field_validator
 from datetime import date
 
 from utilities import (
@@ -57,3 +57,6 @@ class UpdateExperience(BaseWorkExperience):
         if not validate_earlier_date(value, info.data["end_date"]):
             raise ValueError("Start date must be less than the end date")
         return value
+
+class UpsertExperience(CreateExperience):
+    experience_id: conint(gt=0) | None = None
\ No newline at end of file
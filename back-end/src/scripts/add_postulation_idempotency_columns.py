@@ -0,0 +1,32 @@
+import asyncio
+from sqlalchemy import inspect, text
+
+from config.db import engine, close_db
+from scripts.create_indexes import create_missing_indexes
+
+IDEMPOTENCY_COLUMNS = {
+    "clave_idempotencia": "VARCHAR(100) NULL",
+    "huella_solicitud": "VARCHAR(64) NULL"
+}
+
+def add_idempotency_columns(connection):
+    # 'create_all' Does Not Alter Existing Tables; Earlier Postulations Keep No Key
+    columns = {column["name"] for column in inspect(connection).get_columns("postulacion")}
+    for name, definition in IDEMPOTENCY_COLUMNS.items():
+        if name not in columns:
+            print(f"[INFO]: Adding Column {name} On postulacion")
+            connection.execute(text(f"ALTER TABLE postulacion ADD COLUMN {name} {definition}"))
+
+async def add_postulation_idempotency_columns():
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(add_idempotency_columns)
+            await conn.run_sync(create_missing_indexes)
+        print("[INFO]: Postulation Idempotency Columns And Indexes Are Up To Date")
+    except Exception as error:
+        print(f"[ERROR]: Error adding postulation idempotency columns: {error}")
+    finally:
+        await close_db()
+
+if __name__ == "__main__":
+    asyncio.run(add_postulation_idempotency_columns())
@@ -0,0 +1,26 @@
+import asyncio
+from sqlalchemy import inspect, text
+
+from config.db import engine, close_db
+from scripts.create_indexes import create_missing_indexes
+
+def add_notification_column(connection):
+    # 'create_all' Does Not Alter Existing Tables; Existing Rows Start Without A Pending Email
+    columns = {column["name"] for column in inspect(connection).get_columns("postulacion")}
+    if "notificacion_pendiente" not in columns:
+        print("[INFO]: Adding Column notificacion_pendiente On postulacion")
+        connection.execute(text("ALTER TABLE postulacion ADD COLUMN notificacion_pendiente INT NOT NULL DEFAULT 0"))
+
+async def add_postulation_notification_column():
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(add_notification_column)
+            await conn.run_sync(create_missing_indexes)
+        print("[INFO]: Postulation Notification Column And Indexes Are Up To Date")
+    except Exception as error:
+        print(f"[ERROR]: Error adding postulation notification column: {error}")
+    finally:
+        await close_db()
+
+if __name__ == "__main__":
+    asyncio.run(add_postulation_notification_column())
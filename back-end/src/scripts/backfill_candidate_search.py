@@ -0,0 +1,62 @@
+import asyncio
+from sqlalchemy import inspect, text, update
+from sqlmodel import select
+
+from config.db import engine, async_session, close_db
+from models.candidate import Candidate
+from scripts.create_indexes import create_missing_indexes
+from utilities import build_search_name
+
+BACKFILL_BATCH_SIZE = 1000
+
+def add_search_name_column(connection):
+    # 'create_all' Does Not Alter Existing Tables
+    columns = {column["name"] for column in inspect(connection).get_columns("candidato")}
+    if "nombre_busqueda" not in columns:
+        print("[INFO]: Adding Column nombre_busqueda On candidato")
+        connection.execute(text("ALTER TABLE candidato ADD COLUMN nombre_busqueda VARCHAR(460) NULL"))
+
+async def backfill_candidate_search():
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(add_search_name_column)
+        # Fill Search Names By Candidate Id Ranges
+        last_candidate_id = 0
+        total = 0
+        async with async_session() as session:
+            while True:
+                query = select(
+                    Candidate.candidate_id,
+                    Candidate.name,
+                    Candidate.paternal,
+                    Candidate.maternal
+                ).where(
+                    Candidate.candidate_id > last_candidate_id
+                ).order_by(Candidate.candidate_id).limit(BACKFILL_BATCH_SIZE)
+                result = await session.execute(query)
+                rows = result.all()
+                if not rows:
+                    break
+                await session.execute(
+                    update(Candidate),
+                    [
+                        {
+                            "candidate_id": row.candidate_id,
+                            "search_name": build_search_name(row.name, row.paternal, row.maternal)
+                        } for row in rows
+                    ]
+                )
+                await session.commit()
+                last_candidate_id = rows[-1].candidate_id
+                total += len(rows)
+        print(f"[INFO]: Search Names Updated For {total} Candidates")
+        async with engine.begin() as conn:
+            await conn.run_sync(create_missing_indexes)
+        print("[INFO]: Indexes Are Up To Date")
+    except Exception as error:
+        print(f"[ERROR]: Error backfilling candidate search names: {error}")
+    finally:
+        await close_db()
+
+if __name__ == "__main__":
+    asyncio.run(backfill_candidate_search())
@@ -0,0 +1,63 @@
+import time
+import random
+import numpy as np
+
+from services.offer_matching import MatchingEngine
+
+BENCHMARK_CANDIDATES = 100_000
+BENCHMARK_OFFERS = 5_000
+BENCHMARK_ROUNDS = 50
+BENCHMARK_LIMIT = 20
+
+def random_features(generator: random.Random, wage_field: str) -> dict:
+    city = generator.randint(0, 350)
+    return {
+        "position": generator.randint(0, 400),
+        "area": generator.randint(0, 30),
+        "city": city,
+        "region": city % 16 + 1 if city else 0,
+        "contract": generator.randint(0, 5),
+        "job_type": generator.randint(0, 4),
+        wage_field: generator.choice([np.nan, generator.randint(500_000, 3_000_000)]),
+        "experience": generator.choice([np.nan, float(generator.randint(0, 10))])
+    }
+
+def timed(action, rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        action()
+    return (time.perf_counter() - start) / rounds * 1000
+
+def benchmark_matching():
+    # Synthetic Data, No Database Needed
+    generator = random.Random(42)
+    preferences = [(candidate_id, random_features(generator, "min_wage")) for candidate_id in range(1, BENCHMARK_CANDIDATES + 1)]
+    offers = [(offer_id, random_features(generator, "salary")) for offer_id in range(1, BENCHMARK_OFFERS + 1)]
+    engine = MatchingEngine()
+    start = time.perf_counter()
+    engine.load(preferences, offers)
+    print(f"[INFO]: Loaded {BENCHMARK_CANDIDATES} Preferences And {BENCHMARK_OFFERS} Offers In {(time.perf_counter() - start) * 1000:.1f} ms")
+    offer_ids = [generator.randint(1, BENCHMARK_OFFERS) for _ in range(BENCHMARK_ROUNDS)]
+    candidate_ids = [generator.randint(1, BENCHMARK_CANDIDATES) for _ in range(BENCHMARK_ROUNDS)]
+    offer_iter = iter(offer_ids)
+    candidate_iter = iter(candidate_ids)
+    per_offer = timed(lambda: engine.candidates_for_offer(next(offer_iter), BENCHMARK_LIMIT), BENCHMARK_ROUNDS)
+    print(f"[INFO]: Top {BENCHMARK_LIMIT} Candidates For An Offer: {per_offer:.2f} ms")
+    per_candidate = timed(lambda: engine.offers_for_candidate(next(candidate_iter), BENCHMARK_LIMIT), BENCHMARK_ROUNDS)
+    print(f"[INFO]: Top {BENCHMARK_LIMIT} Offers For A Candidate: {per_candidate:.2f} ms")
+    updates = iter(range(BENCHMARK_CANDIDATES + 1, BENCHMARK_CANDIDATES + 1 + BENCHMARK_ROUNDS))
+    per_update = timed(lambda: engine.preferences.upsert(next(updates), random_features(generator, "min_wage")), BENCHMARK_ROUNDS)
+    print(f"[INFO]: Incremental Preference Upsert: {per_update * 1000:.1f} us")
+    # Reference: The Same Scores Row By Row In Plain Python
+    offer = engine.offers.get(offer_ids[0])
+    rows = engine.preferences.view()
+    start = time.perf_counter()
+    for index in range(engine.preferences.size):
+        sum(
+            rows[field][index] == 0 or rows[field][index] == offer[field]
+            for field in ("position", "area", "city", "contract", "job_type")
+        )
+    print(f"[INFO]: Row By Row Category Checks Only: {(time.perf_counter() - start) * 1000:.1f} ms")
+
+if __name__ == "__main__":
+    benchmark_matching()
@@ -0,0 +1,87 @@
+import asyncio
+import random
+import statistics
+import time
+from datetime import date, timedelta
+from sqlmodel import select, func, or_
+from sqlalchemy import delete, insert
+from sqlalchemy.dialects.mysql import match
+
+from config.db import async_session, close_db
+from models.job_offer import JobOffer
+from schemas.job_offer import OfferStateEnum, OfferFeaturedEnum
+from utilities import build_fulltext_query
+
+# Run Against A Development Database, Seeded Rows Are Removed At The End
+TOTAL_OFFERS = 100_000
+BATCH_SIZE = 5_000
+REPETITIONS = 10
+BENCHMARK_MARKER = "__benchmark_busqueda__"
+TITLE_WORDS = [
+    "Ingeniero", "Técnico", "Operador", "Mecánico", "Eléctrico", "Supervisor",
+    "Analista", "Administrativo", "Mantención", "Planta", "Minería", "Logística",
+    "Bodega", "Contabilidad", "Prevención", "Riesgos", "Soldador", "Camión"
+]
+DESCRIPTION_WORDS = TITLE_WORDS + [
+    "experiencia", "turno", "faena", "equipo", "proyecto", "desarrollo",
+    "atención", "clientes", "gestión", "calidad", "seguridad", "operación"
+]
+SEARCH_TERMS = ["ingeniero", "mecanico electrico", "mantencion planta", "prevencion de riesgos"]
+
+def build_offer(index: int) -> dict:
+    return {
+        "code": index,
+        "title": " ".join(random.sample(TITLE_WORDS, 3)),
+        "description": " ".join(random.choices(DESCRIPTION_WORDS, k=40)),
+        "location": BENCHMARK_MARKER,
+        "publication_date": date.today() - timedelta(days=random.randint(0, 60)),
+        "state": OfferStateEnum.active,
+        "featured": OfferFeaturedEnum.not_featured
+    }
+
+def like_query(term: str):
+    return select(JobOffer.offer_id).where(or_(
+        JobOffer.title.ilike(f"%{term}%"),
+        JobOffer.description.ilike(f"%{term}%")
+    ))
+
+def fulltext_query(term: str):
+    relevance = match(JobOffer.title, JobOffer.description, against=build_fulltext_query(term)).in_boolean_mode()
+    return select(JobOffer.offer_id).where(relevance > 0)
+
+async def measure(session, query) -> tuple[float, int]:
+    timings = []
+    total = 0
+    for _ in range(REPETITIONS):
+        start = time.perf_counter()
+        result = await session.execute(select(func.count()).select_from(query.subquery()))
+        total = result.scalar()
+        await session.execute(query.order_by(JobOffer.publication_date.desc()).limit(5))
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings), total
+
+async def benchmark_offer_search():
+    try:
+        async with async_session() as session:
+            print(f"[INFO]: Seeding {TOTAL_OFFERS} Job Offers")
+            for start in range(0, TOTAL_OFFERS, BATCH_SIZE):
+                await session.execute(
+                    insert(JobOffer),
+                    [build_offer(index) for index in range(start, start + BATCH_SIZE)]
+                )
+            await session.commit()
+            print(f"{'Term':<25}{'LIKE ms':>10}{'FULLTEXT ms':>14}{'LIKE rows':>12}{'FT rows':>10}")
+            for term in SEARCH_TERMS:
+                like_ms, like_rows = await measure(session, like_query(term))
+                fulltext_ms, fulltext_rows = await measure(session, fulltext_query(term))
+                print(f"{term:<25}{like_ms:>10.1f}{fulltext_ms:>14.1f}{like_rows:>12}{fulltext_rows:>10}")
+            # Remove Seeded Job Offers
+            await session.execute(delete(JobOffer).where(JobOffer.location == BENCHMARK_MARKER))
+            await session.commit()
+    except Exception as error:
+        print(f"[ERROR]: Error running benchmark: {error}")
+    finally:
+        await close_db()
+
+if __name__ == "__main__":
+    asyncio.run(benchmark_offer_search())
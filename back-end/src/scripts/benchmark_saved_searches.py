@@ -0,0 +1,69 @@
+import time
+import random
+from types import SimpleNamespace
+
+from services.saved_searches import SavedSearchIndex, OfferTerms
+
+BENCHMARK_SEARCHES = 300_000
+BENCHMARK_OFFERS = 1_000
+BENCHMARK_BASELINE_OFFERS = 20
+BENCHMARK_VOCABULARY = 5_000
+BENCHMARK_DESCRIPTION_WORDS = 150
+
+def random_vocabulary(generator: random.Random) -> list[str]:
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    return ["".join(generator.choices(letters, k=generator.randint(4, 12))) for _ in range(BENCHMARK_VOCABULARY)]
+
+def random_words(generator: random.Random, vocabulary: list[str], total: int) -> list[str]:
+    # Skewed Like Real Text: A Few Words Are Everywhere, Most Are Rare
+    return [vocabulary[min(int(generator.paretovariate(1.0)) - 1, len(vocabulary) - 1)] for _ in range(total)]
+
+def random_search(generator: random.Random, vocabulary: list[str], search_id: int) -> SimpleNamespace:
+    return SimpleNamespace(
+        search_id=search_id,
+        # Most Saved Searches Carry A Term, Picked Evenly So Rare Words Are As Likely As Common Ones
+        search=generator.choice([None, *[" ".join(generator.sample(vocabulary, generator.randint(1, 2)))] * 4]),
+        region_id=generator.choice([None, None, generator.randint(1, 16)]),
+        city_id=generator.choice([None, None, generator.randint(1, 350)]),
+        type_id=generator.choice([None, None, generator.randint(1, 5)]),
+        job_type_id=generator.choice([None, None, None, generator.randint(1, 4)])
+    )
+
+def random_offer(generator: random.Random, vocabulary: list[str], offer_id: int) -> SimpleNamespace:
+    return SimpleNamespace(
+        offer_id=offer_id,
+        title=" ".join(random_words(generator, vocabulary, 4)),
+        description=" ".join(random_words(generator, vocabulary, BENCHMARK_DESCRIPTION_WORDS)),
+        city_id=generator.randint(1, 350),
+        region_id=generator.randint(1, 16),
+        type_id=generator.randint(1, 5),
+        job_type_id=generator.randint(1, 4)
+    )
+
+def benchmark_saved_searches():
+    # Synthetic Data, No Database Needed
+    generator = random.Random(42)
+    vocabulary = random_vocabulary(generator)
+    searches = [random_search(generator, vocabulary, search_id) for search_id in range(1, BENCHMARK_SEARCHES + 1)]
+    offers = [random_offer(generator, vocabulary, offer_id) for offer_id in range(1, BENCHMARK_OFFERS + 1)]
+    index = SavedSearchIndex()
+    start = time.perf_counter()
+    index.load(searches)
+    print(f"[INFO]: Indexed {BENCHMARK_SEARCHES} Saved Searches In {(time.perf_counter() - start) * 1000:.1f} ms")
+    start = time.perf_counter()
+    hits = sum(len(index.match(offer)) for offer in offers)
+    per_offer = (time.perf_counter() - start) / BENCHMARK_OFFERS * 1000
+    print(f"[INFO]: Reverse Index: {per_offer:.2f} ms Per Offer, {hits / BENCHMARK_OFFERS:.0f} Hits Per Offer")
+    # Reference: Every Saved Search Checked Against Every Offer
+    filters = list(index.filters.values())
+    start = time.perf_counter()
+    baseline_hits = 0
+    for offer in offers[:BENCHMARK_BASELINE_OFFERS]:
+        terms = OfferTerms(offer)
+        baseline_hits += sum(1 for search_filter in filters if search_filter.matches(terms))
+    per_offer = (time.perf_counter() - start) / BENCHMARK_BASELINE_OFFERS * 1000
+    indexed_hits = sum(len(index.match(offer)) for offer in offers[:BENCHMARK_BASELINE_OFFERS])
+    print(f"[INFO]: Every Search Checked: {per_offer:.2f} ms Per Offer, Same Hits: {baseline_hits == indexed_hits}")
+
+if __name__ == "__main__":
+    benchmark_saved_searches()
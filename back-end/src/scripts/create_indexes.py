@@ -0,0 +1,47 @@
+import asyncio
+from sqlalchemy import inspect, func
+from sqlmodel import SQLModel, select
+
+from config.db import engine, async_session, close_db
+from models import codelco_job
+from models.job_offer import JobOffer
+from services.offer_codes import reassign_duplicate_offer_codes
+
+def has_duplicate_offer_codes(connection) -> bool:
+    query = select(JobOffer.code).group_by(JobOffer.code).having(func.count() > 1).limit(1)
+    return connection.execute(query).first() is not None
+
+def create_missing_indexes(connection):
+    # 'create_all' Skips Existing Tables, So New Indexes Must Be Added One By One
+    inspector = inspect(connection)
+    existing_tables = set(inspector.get_table_names())
+    for table in SQLModel.metadata.sorted_tables:
+        if table.name not in existing_tables:
+            continue
+        existing_indexes = {index["name"] for index in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name in existing_indexes:
+                continue
+            # The Unique Index Cannot Be Built Over Repeated Codes, 'create_indexes' Reassigns Them First
+            if index.name == "uq_oferta_codigo" and has_duplicate_offer_codes(connection):
+                print(f"[ERROR]: Skipping Index {index.name}, Run 'scripts.create_indexes' To Reassign Duplicated Codes")
+                continue
+            print(f"[INFO]: Creating Index {index.name} On {table.name}")
+            index.create(connection)
+
+async def create_indexes():
+    try:
+        async with async_session() as session:
+            reassigned = await reassign_duplicate_offer_codes(session)
+        for offer_id, code in reassigned.items():
+            print(f"[INFO]: Offer {offer_id} Had A Duplicated Code, New Code {code}")
+        async with engine.begin() as conn:
+            await conn.run_sync(create_missing_indexes)
+        print("[INFO]: Indexes Are Up To Date")
+    except Exception as error:
+        print(f"[ERROR]: Error creating indexes: {error}")
+    finally:
+        await close_db()
+
+if __name__ == "__main__":
+    asyncio.run(create_indexes())
@@ -0,0 +1,23 @@
+import os
+
+from services.uploads import UPLOADS_DIR
+from services.image_variants import IMAGE_FOLDERS, generate_image_variants
+
+def generate_missing_variants():
+    total = 0
+    for folder in IMAGE_FOLDERS:
+        directory = os.path.join(UPLOADS_DIR, folder)
+        if not os.path.isdir(directory):
+            continue
+        for filename in os.listdir(directory):
+            if filename.endswith((".webp", ".part")):
+                continue
+            try:
+                generate_image_variants(os.path.join(directory, filename))
+                total += 1
+            except Exception as error:
+                print(f"[ERROR]: Error generating variants for {folder}/{filename}: {error}")
+    print(f"[INFO]: Variants Generated For {total} Images")
+
+if __name__ == "__main__":
+    generate_missing_variants()
@@ -46,7 +46,13 @@ from models import (
     candidate_alert_configuration,
     candidate_position_preference,
     work_experience,
-    codelco_job
+    codelco_job,
+    active_offer,
+    code_counter,
+    postulation_counter,
+    upload_reference,
+    saved_search,
+    saved_search_hit
 )
 from utilities import get_password_hash
 
@@ -0,0 +1,108 @@
+import os
+import glob
+import shutil
+import asyncio
+import hashlib
+from sqlalchemy import delete, insert, update
+from sqlmodel import select
+
+from config.db import engine, async_session, close_db
+from models.candidate import Candidate
+from models.company import Company
+from models.publication import Publication
+from models.candidate_plan import CandidatePlan
+from models.company_plan import CompanyPlan
+from models.upload_reference import UploadReference
+from services.uploads import (
+    UPLOADS_DIR,
+    UPLOAD_CHUNK_SIZE,
+    UPLOAD_EXTENSIONS,
+    content_hash,
+    sniff_content_type
+)
+from services.image_variants import IMAGE_FOLDERS, generate_image_variants
+
+# (Model, Primary Key, File Column, Upload Folder)
+UPLOAD_COLUMNS = [
+    (Candidate, Candidate.candidate_id, Candidate.resume, "resumes"),
+    (Candidate, Candidate.candidate_id, Candidate.photo, "photos"),
+    (Company, Company.company_id, Company.logo, "logos"),
+    (Publication, Publication.publication_id, Publication.image, "publication_images"),
+    (CandidatePlan, CandidatePlan.plan_id, CandidatePlan.photo, "plan_photos"),
+    (CompanyPlan, CompanyPlan.plan_id, CompanyPlan.photo, "plan_photos")
+]
+
+def content_address(folder: str, filename: str) -> str | None:
+    path = os.path.join(UPLOADS_DIR, folder, filename)
+    if not os.path.isfile(path):
+        return None
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        head = file.read(UPLOAD_CHUNK_SIZE)
+        chunk = head
+        while chunk:
+            digest.update(chunk)
+            chunk = file.read(UPLOAD_CHUNK_SIZE)
+    extension = UPLOAD_EXTENSIONS.get(sniff_content_type(head)) or os.path.splitext(filename)[1].lower()
+    new_filename = f"{digest.hexdigest()}{extension}"
+    new_path = os.path.join(UPLOADS_DIR, folder, new_filename)
+    # Copy So Rows Keep Working Until They Point At The New Name, Equal Files Collapse Into One
+    if not os.path.exists(new_path):
+        shutil.copyfile(path, f"{new_path}.part")
+        os.replace(f"{new_path}.part", new_path)
+    if folder in IMAGE_FOLDERS:
+        generate_image_variants(new_path)
+    return new_filename
+
+def remove_legacy_file(folder: str, filename: str):
+    path = os.path.join(UPLOADS_DIR, folder, filename)
+    for variant_path in glob.glob(f"{glob.escape(path)}.*.webp"):
+        os.remove(variant_path)
+    os.remove(path)
+
+async def migrate_uploads():
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(UploadReference.__table__.create, checkfirst=True)
+        async with async_session() as session:
+            references = {}
+            for model, primary_key, column, folder in UPLOAD_COLUMNS:
+                result = await session.execute(select(primary_key, column).where(column.is_not(None)))
+                renamed = []
+                for row_id, filename in result.all():
+                    new_filename = filename
+                    if not content_hash(filename):
+                        new_filename = await asyncio.to_thread(content_address, folder, filename)
+                        if not new_filename:
+                            print(f"[INFO]: Missing File {folder}/{filename}")
+                            continue
+                        renamed.append({primary_key.key: row_id, column.key: new_filename, "legacy": filename})
+                    references[(folder, new_filename)] = references.get((folder, new_filename), 0) + 1
+                if renamed:
+                    await session.execute(
+                        update(model),
+                        [{key: value for key, value in row.items() if key != "legacy"} for row in renamed]
+                    )
+                    await session.commit()
+                    for row in renamed:
+                        await asyncio.to_thread(remove_legacy_file, folder, row["legacy"])
+                print(f"[INFO]: {len(renamed)} Files Moved To Content Addressed Names In {folder}")
+            # Rebuild Reference Counts From The Owner Rows
+            await session.execute(delete(UploadReference))
+            if references:
+                await session.execute(
+                    insert(UploadReference),
+                    [
+                        {"folder": folder, "filename": filename, "total": total}
+                        for (folder, filename), total in references.items()
+                    ]
+                )
+            await session.commit()
+            print(f"[INFO]: {len(references)} Upload References Rebuilt")
+    except Exception as error:
+        print(f"[ERROR]: Error migrating uploads: {error}")
+    finally:
+        await close_db()
+
+if __name__ == "__main__":
+    asyncio.run(migrate_uploads())
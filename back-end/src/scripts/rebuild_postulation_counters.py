@@ -0,0 +1,18 @@
+import asyncio
+
+from config.db import async_session, close_db
+from services.postulation_counters import rebuild_postulation_counters
+
+async def rebuild_counters():
+    try:
+        async with async_session() as session:
+            await rebuild_postulation_counters(session)
+            await session.commit()
+        print("[INFO]: Postulation Counters Rebuilt Successfully")
+    except Exception as error:
+        print(f"[ERROR]: Error rebuilding postulation counters: {error}")
+    finally:
+        await close_db()
+
+if __name__ == "__main__":
+    asyncio.run(rebuild_counters())
@@ -0,0 +1,17 @@
+import asyncio
+
+from config.db import close_db
+from services.active_offers import run_daily_rollover
+from services.scheduler import run_exclusive
+
+async def run_active_offers_rollover():
+    try:
+        # Same Lock As The Workers, So A Deployment Run Never Overlaps Theirs
+        await run_exclusive(run_daily_rollover)
+    except Exception as error:
+        print(f"[ERROR]: Error running active offers rollover: {error}")
+    finally:
+        await close_db()
+
+if __name__ == "__main__":
+    asyncio.run(run_active_offers_rollover())
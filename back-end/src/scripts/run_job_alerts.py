@@ -0,0 +1,16 @@
+import asyncio
+
+from config.db import close_db
+from services.job_alerts import run_job_alerts
+from services.scheduler import run_exclusive
+
+async def send_job_alerts():
+    try:
+        await run_exclusive(run_job_alerts)
+    except Exception as error:
+        print(f"[ERROR]: Error sending job alerts: {error}")
+    finally:
+        await close_db()
+
+if __name__ == "__main__":
+    asyncio.run(send_job_alerts())
@@ -0,0 +1,16 @@
+import asyncio
+
+from config.db import close_db
+from services.maintenance import run_nightly_maintenance
+from services.scheduler import run_exclusive
+
+async def run_maintenance():
+    try:
+        await run_exclusive(run_nightly_maintenance)
+    except Exception as error:
+        print(f"[ERROR]: Error running maintenance: {error}")
+    finally:
+        await close_db()
+
+if __name__ == "__main__":
+    asyncio.run(run_maintenance())
@@ -0,0 +1,158 @@
+from sqlmodel import select, or_
+from sqlalchemy import delete, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import date
+
+from config.db import async_session
+from models.active_offer import ActiveOffer
+from models.job_offer import JobOffer
+from models.city import City
+from models.region import Region
+from models.contract_type import ContractType
+from models.company import Company
+from models.company_sector import CompanySector
+from schemas.job_offer import OfferStateEnum
+from services.offer_cache import invalidate_offer_caches
+from services.image_variants import image_variant_url
+from services.offer_matching import matching_engine
+from services.saved_searches import percolate_published_offers
+
+# Projection Column -> Source Column
+PROJECTION_COLUMNS = [
+    (ActiveOffer.offer_id, JobOffer.offer_id),
+    (ActiveOffer.code, JobOffer.code),
+    (ActiveOffer.title, JobOffer.title),
+    (ActiveOffer.position, JobOffer.position),
+    (ActiveOffer.description, JobOffer.description),
+    (ActiveOffer.publication_date, JobOffer.publication_date),
+    (ActiveOffer.closing_date, JobOffer.closing_date),
+    (ActiveOffer.state, JobOffer.state),
+    (ActiveOffer.featured, JobOffer.featured),
+    (ActiveOffer.city_id, JobOffer.city_id),
+    (ActiveOffer.city_name, City.name),
+    (ActiveOffer.region_id, Region.number_region),
+    (ActiveOffer.region_name, Region.name),
+    (ActiveOffer.type_id, JobOffer.type_id),
+    (ActiveOffer.contract_name, ContractType.name),
+    (ActiveOffer.job_type_id, JobOffer.job_type_id),
+    (ActiveOffer.company_id, JobOffer.company_id),
+    (ActiveOffer.company_trade_name, Company.trade_name),
+    (ActiveOffer.company_web, Company.web),
+    (ActiveOffer.company_email, Company.email),
+    (ActiveOffer.company_description, Company.description),
+    (ActiveOffer.company_phone, Company.phone),
+    (ActiveOffer.company_logo, Company.logo),
+    (ActiveOffer.sector_id, CompanySector.sector_id),
+    (ActiveOffer.sector_name, CompanySector.name)
+]
+
+def visible_offers_query(today: date):
+    return select(
+        *[source for _, source in PROJECTION_COLUMNS]
+    ).select_from(JobOffer).outerjoin(
+        City, JobOffer.city_id == City.city_id
+    ).outerjoin(
+        Region, City.region_id == Region.number_region
+    ).outerjoin(
+        ContractType, JobOffer.type_id == ContractType.type_id
+    ).outerjoin(
+        Company, JobOffer.company_id == Company.company_id
+    ).outerjoin(
+        CompanySector, Company.sector_id == CompanySector.sector_id
+    ).where(
+        JobOffer.state == OfferStateEnum.active,
+        JobOffer.publication_date <= today,
+        or_(
+            JobOffer.closing_date >= today,
+            JobOffer.closing_date == None
+        )
+    )
+
+async def _replace_rows(session: AsyncSession, projection_filter=None, source_filter=None):
+    # Delete And Reinsert The Affected Rows Inside The Caller Transaction
+    delete_query = delete(ActiveOffer)
+    source_query = visible_offers_query(date.today())
+    if projection_filter is not None:
+        delete_query = delete_query.where(projection_filter)
+        source_query = source_query.where(source_filter)
+    await session.execute(delete_query)
+    await session.execute(
+        insert(ActiveOffer).from_select(
+            [target for target, _ in PROJECTION_COLUMNS],
+            source_query
+        )
+    )
+
+async def refresh_active_offer(session: AsyncSession, offer_id: int):
+    await _replace_rows(
+        session,
+        ActiveOffer.offer_id == offer_id,
+        JobOffer.offer_id == offer_id
+    )
+
+async def refresh_company_offers(session: AsyncSession, company_id: int):
+    await _replace_rows(
+        session,
+        ActiveOffer.company_id == company_id,
+        JobOffer.company_id == company_id
+    )
+
+async def rebuild_active_offers(session: AsyncSession):
+    await _replace_rows(session)
+
+async def run_daily_rollover():
+    # Publication And Closing Dates Change Visibility Without Any Write
+    async with async_session() as session:
+        await rebuild_active_offers(session)
+        await session.commit()
+    invalidate_offer_caches()
+    matching_engine.invalidate()
+    await percolate_published_offers(date.today())
+
+def to_summary_offer(offer: ActiveOffer, company_info: bool = True) -> dict:
+    city = None
+    if offer.city_id:
+        city = {
+            "city_id": offer.city_id,
+            "name": offer.city_name,
+            "region": {
+                "number_region": offer.region_id,
+                "name": offer.region_name
+            }
+        }
+    contract_type = None
+    if offer.type_id:
+        contract_type = {
+            "type_id": offer.type_id,
+            "name": offer.contract_name
+        }
+    company = None
+    if company_info and offer.company_id:
+        company = {
+            "company_id": offer.company_id,
+            "trade_name": offer.company_trade_name,
+            "web": offer.company_web,
+            "email": offer.company_email,
+            "description": offer.company_description,
+            "phone": offer.company_phone,
+            "logo": offer.company_logo,
+            "logo_small": image_variant_url("logos", offer.company_logo, "small"),
+            "company_sector": {
+                "sector_id": offer.sector_id,
+                "name": offer.sector_name
+            } if offer.sector_id else None
+        }
+    return {
+        "offer_id": offer.offer_id,
+        "title": offer.title,
+        "code": offer.code,
+        "position": offer.position,
+        "description": offer.description,
+        "publication_date": offer.publication_date,
+        "closing_date": offer.closing_date,
+        "state": offer.state,
+        "featured": offer.featured,
+        "city": city,
+        "contract_type": contract_type,
+        "company": company
+    }
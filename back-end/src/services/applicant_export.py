@@ -0,0 +1,126 @@
+import os
+import io
+import csv
+import asyncio
+import tempfile
+from typing import AsyncIterator
+from openpyxl import Workbook
+from sqlmodel import select
+
+from config.db import async_session
+from models.postulation import Postulation
+from models.candidate import Candidate
+from models.job_answer import JobAnswer
+from models.job_question import JobQuestion
+
+# Rows Fetched Per Server Side Cursor Round Trip
+EXPORT_FETCH_SIZE = 500
+EXPORT_CHUNK_SIZE = 64 * 1024
+APPLICANT_COLUMNS = [
+    "RUN",
+    "Nombre",
+    "Apellido Paterno",
+    "Apellido Materno",
+    "Email",
+    "Teléfono",
+    "Fecha Nacimiento",
+    "Sexo",
+    "Nacionalidad",
+    "Estudio Destacado",
+    "Estado Postulación",
+    "Fecha Postulación"
+]
+
+async def get_offer_questions(session, offer_id: int) -> list[tuple[int, str]]:
+    result = await session.execute(
+        select(JobQuestion.question_id, JobQuestion.question).where(
+            JobQuestion.offer_id == offer_id
+        ).order_by(JobQuestion.question_id)
+    )
+    return result.all()
+
+async def iter_applicant_rows(offer_id: int, question_ids: list[int]) -> AsyncIterator[list]:
+    # Answers Are Joined In The Same Cursor And Grouped By Postulation
+    query = select(
+        Postulation.postulation_id,
+        Postulation.state,
+        Postulation.postulation_date,
+        Candidate.run,
+        Candidate.name,
+        Candidate.paternal,
+        Candidate.maternal,
+        Candidate.email,
+        Candidate.phone,
+        Candidate.birth_date,
+        Candidate.gender,
+        Candidate.nationality,
+        Candidate.featured_study,
+        JobAnswer.question_id,
+        JobAnswer.answer
+    ).join(
+        Candidate, Postulation.candidate_id == Candidate.candidate_id
+    ).outerjoin(
+        JobAnswer, JobAnswer.postulation_id == Postulation.postulation_id
+    ).where(
+        Postulation.offer_id == offer_id
+    ).order_by(Postulation.postulation_id).execution_options(yield_per=EXPORT_FETCH_SIZE)
+    question_columns = {question_id: index for index, question_id in enumerate(question_ids)}
+    current_id = None
+    current_row = None
+    # The Export Outlives The Request Session, So It Opens Its Own
+    async with async_session() as session:
+        result = await session.stream(query)
+        async for row in result:
+            if row.postulation_id != current_id:
+                if current_row:
+                    yield current_row
+                current_id = row.postulation_id
+                current_row = [
+                    row.run,
+                    row.name,
+                    row.paternal,
+                    row.maternal,
+                    row.email,
+                    row.phone,
+                    row.birth_date,
+                    row.gender,
+                    row.nationality,
+                    row.featured_study,
+                    row.state,
+                    row.postulation_date
+                ] + [None] * len(question_ids)
+            if row.question_id in question_columns:
+                current_row[len(APPLICANT_COLUMNS) + question_columns[row.question_id]] = row.answer
+    if current_row:
+        yield current_row
+
+async def stream_applicants_csv(offer_id: int, questions: list[tuple[int, str]]) -> AsyncIterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    # Byte Order Mark So Spreadsheet Tools Detect UTF-8
+    buffer.write("\ufeff")
+    writer.writerow(APPLICANT_COLUMNS + [question for _, question in questions])
+    async for row in iter_applicant_rows(offer_id, [question_id for question_id, _ in questions]):
+        writer.writerow(row)
+        if buffer.tell() >= EXPORT_CHUNK_SIZE:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue().encode("utf-8")
+
+async def stream_applicants_xlsx(offer_id: int, questions: list[tuple[int, str]]) -> AsyncIterator[bytes]:
+    # Write Only Workbooks Keep Rows On Disk Instead Of In Memory
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet("Postulantes")
+    sheet.append(APPLICANT_COLUMNS + [question for _, question in questions])
+    async for row in iter_applicant_rows(offer_id, [question_id for question_id, _ in questions]):
+        sheet.append(row)
+    file_descriptor, path = tempfile.mkstemp(suffix=".xlsx")
+    os.close(file_descriptor)
+    try:
+        await asyncio.to_thread(workbook.save, path)
+        with open(path, "rb") as file:
+            while chunk := await asyncio.to_thread(file.read, EXPORT_CHUNK_SIZE):
+                yield chunk
+    finally:
+        os.remove(path)
@@ -0,0 +1,86 @@
+import time
+from sqlalchemy.orm import selectinload
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models.candidate import Candidate
+from models.candidate_position_preference import CandidatePositionPreference
+from models.city import City
+from schemas.candidate import GetCandidate
+from schemas.work_experience import GetExperience
+from schemas.candidate_study import GetStudy
+from schemas.candidate_language import GetCandidateLanguage
+from schemas.candidate_software import GetCandidateSoftware
+from schemas.candidate_certification import GetCertification
+from schemas.candidate_position_preference import GetPositionPreference
+from schemas.candidate_profile import GetCandidateProfile
+from services.resume_pdf import resume_profile_query
+
+# Each Worker Keeps Its Own Copy, Section Writes Drop It And The TTL Bounds Staleness Across Workers
+PROFILE_CACHE_TTL = 300
+PROFILE_CACHE_MAX_ENTRIES = 2048
+
+candidate_profiles: dict[int, tuple[float, dict]] = {}
+
+def candidate_profile_query():
+    # Every Section Is Loaded By One IN Query Per Relationship, Not One Request Each
+    return resume_profile_query().options(
+        selectinload(Candidate.driver_license),
+        selectinload(Candidate.candidate_position_preference).options(
+            selectinload(CandidatePositionPreference.generic_position),
+            selectinload(CandidatePositionPreference.performance_area),
+            selectinload(CandidatePositionPreference.contract_type),
+            selectinload(CandidatePositionPreference.job_type),
+            selectinload(CandidatePositionPreference.city).options(
+                selectinload(City.region)
+            )
+        )
+    )
+
+def build_candidate_profile(candidate: Candidate) -> dict:
+    profile = GetCandidateProfile(
+        candidate=GetCandidate.model_validate(candidate, from_attributes=True),
+        work_experiences=[
+            GetExperience.model_validate(experience, from_attributes=True)
+            for experience in candidate.work_experiences
+        ],
+        studies=[
+            GetStudy.model_validate(study, from_attributes=True)
+            for study in sorted(candidate.candidate_studies, key=lambda study: study.start_date, reverse=True)
+        ],
+        languages=[
+            GetCandidateLanguage.model_validate(language, from_attributes=True)
+            for language in candidate.candidate_languages
+        ],
+        softwares=[
+            GetCandidateSoftware.model_validate(software, from_attributes=True)
+            for software in candidate.candidate_softwares
+        ],
+        certifications=[
+            GetCertification.model_validate(certification, from_attributes=True)
+            for certification in candidate.candidate_certifications
+        ],
+        position_preference=GetPositionPreference.model_validate(
+            candidate.candidate_position_preference, from_attributes=True
+        ) if candidate.candidate_position_preference else None
+    )
+    return profile.model_dump(mode="json")
+
+async def get_candidate_profile(session: AsyncSession, candidate_id: int) -> dict | None:
+    entry = candidate_profiles.get(candidate_id)
+    if entry and time.monotonic() - entry[0] <= PROFILE_CACHE_TTL:
+        return entry[1]
+    result = await session.execute(
+        candidate_profile_query().where(Candidate.candidate_id == candidate_id)
+    )
+    candidate = result.scalar_one_or_none()
+    if not candidate:
+        return None
+    profile = build_candidate_profile(candidate)
+    # Drop The Oldest Candidate When The Cache Is Full
+    if candidate_id not in candidate_profiles and len(candidate_profiles) >= PROFILE_CACHE_MAX_ENTRIES:
+        candidate_profiles.pop(next(iter(candidate_profiles)))
+    candidate_profiles[candidate_id] = (time.monotonic(), profile)
+    return profile
+
+def invalidate_candidate_profile(candidate_id: int):
+    candidate_profiles.pop(int(candidate_id), None)
@@ -0,0 +1,58 @@
+import os
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+from services.uploads import UPLOADS_DIR, content_hash
+
+# Size Name -> Longest Side In Pixels
+IMAGE_SIZES = {
+    "thumb": 96,
+    "small": 320,
+    "medium": 800
+}
+IMAGE_FOLDERS = {"photos", "logos", "publication_images", "plan_photos"}
+WEBP_QUALITY = 80
+
+variant_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="image-variants")
+
+def variant_filename(filename: str, size: str) -> str:
+    return f"{filename}.{size}.webp"
+
+def image_variant_url(folder: str, filename: str | None, size: str) -> str | None:
+    # Relative To The API Version Root, Like The Upload File Names
+    if not filename:
+        return None
+    return f"images/{folder}/{size}/{filename}"
+
+def generate_image_variants(path: str):
+    # Content Addressed Files Shared By Several Owners Already Have Their Variants
+    if content_hash(os.path.basename(path)) and all(
+        os.path.exists(variant_filename(path, size)) for size in IMAGE_SIZES
+    ):
+        return
+    try:
+        with Image.open(path) as original:
+            image = ImageOps.exif_transpose(original)
+            if image.mode not in ("RGB", "RGBA"):
+                image = image.convert("RGBA" if "A" in image.mode or "transparency" in image.info else "RGB")
+            for size, max_side in IMAGE_SIZES.items():
+                variant = image.copy()
+                variant.thumbnail((max_side, max_side))
+                variant_path = variant_filename(path, size)
+                # Save Beside The Final Name And Rename, So Readers Never See Half An Image
+                temp_path = f"{variant_path}.part"
+                variant.save(temp_path, format="WEBP", quality=WEBP_QUALITY)
+                os.replace(temp_path, variant_path)
+    except UnidentifiedImageError:
+        # Vector Logos (SVG) Are Served As They Are
+        return
+
+def _log_variant_error(future: asyncio.Future):
+    if not future.cancelled() and future.exception():
+        print(f"[ERROR]: Image variants failed: {future.exception()}")
+
+def queue_image_variants(folder: str, filename: str):
+    path = os.path.join(UPLOADS_DIR, folder, filename)
+    future = asyncio.get_running_loop().run_in_executor(variant_executor, generate_image_variants, path)
+    future.add_done_callback(_log_variant_error)
@@ -0,0 +1,207 @@
+import numpy as np
+from collections import defaultdict
+from datetime import datetime, time, timedelta
+from sqlmodel import select, or_
+from sqlalchemy import update
+
+from config.db import async_session
+from config.settings import get_settings
+from models.active_offer import ActiveOffer
+from models.alert_frequency import AlertFrequency
+from models.candidate import Candidate
+from models.candidate_alert_configuration import CandidateAlertConfiguration
+from models.candidate_position_preference import CandidatePositionPreference
+from services.mailer import PooledMailer, build_html_message, render_email_template
+from services.offer_matching import (
+    PREFERENCE_FIELDS,
+    OFFER_FIELDS,
+    preference_query,
+    offer_query,
+    preference_features,
+    offer_features,
+    score_matches
+)
+
+settings = get_settings()
+
+# Due Configurations Claimed Per Batch
+ALERT_BATCH_SIZE = 200
+# Offers Listed Per Digest And Minimum Score To Be Listed
+ALERT_MAX_OFFERS = 10
+ALERT_MIN_SCORE = 60.0
+# First Digest Of A Configuration Looks Back This Far
+ALERT_DEFAULT_WINDOW_DAYS = 7
+
+last_alerts_run: dict = {}
+
+def due_configurations_query(now: datetime):
+    # Served By 'ix_configuracion_alertas_proxima'; Rows Taken By Another Worker Are Skipped
+    return select(
+        CandidateAlertConfiguration.configuration_id,
+        CandidateAlertConfiguration.candidate_id,
+        CandidateAlertConfiguration.email_alerts,
+        CandidateAlertConfiguration.last_alert_sent,
+        AlertFrequency.days,
+        Candidate.name,
+        Candidate.email
+    ).join(
+        AlertFrequency, CandidateAlertConfiguration.frequency_id == AlertFrequency.frequency_id
+    ).join(
+        Candidate, CandidateAlertConfiguration.candidate_id == Candidate.candidate_id
+    ).where(
+        CandidateAlertConfiguration.active_alerts == 1,
+        or_(
+            CandidateAlertConfiguration.next_alert == None,
+            CandidateAlertConfiguration.next_alert <= now
+        )
+    ).order_by(
+        CandidateAlertConfiguration.next_alert,
+        CandidateAlertConfiguration.configuration_id
+    ).limit(ALERT_BATCH_SIZE).with_for_update(skip_locked=True, of=CandidateAlertConfiguration)
+
+def alert_retry_time(now: datetime) -> datetime:
+    # The Job Runs Once A Day, So Claimed Rows Not Sent Are Due Again For The Next Run
+    return datetime.combine(now.date() + timedelta(days=1), time.min)
+
+async def claim_configurations(session, now: datetime) -> list:
+    result = await session.execute(due_configurations_query(now))
+    configurations = result.all()
+    if configurations:
+        # Claimed Rows Stop Being Due, So The Row Locks Are Released Before Any Email Is Sent
+        await session.execute(
+            update(CandidateAlertConfiguration).where(
+                CandidateAlertConfiguration.configuration_id.in_([row.configuration_id for row in configurations])
+            ).values(
+                next_alert=alert_retry_time(now)
+            ).execution_options(synchronize_session=False)
+        )
+    await session.commit()
+    return configurations
+
+def alert_since(configuration, now: datetime):
+    # Publication Dates Have No Time, So Digests Cover Whole Days: From The Day Of The Last One Up To Yesterday
+    return (configuration.last_alert_sent or now - timedelta(days=ALERT_DEFAULT_WINDOW_DAYS)).date()
+
+def match_digests(configurations: list, preferences: dict[int, dict], offers: list[tuple[int, dict]], publication_dates: dict[int, object], now: datetime) -> dict[int, list[tuple[int, float]]]:
+    # One Score Matrix For The Whole Batch: Candidates As Rows, New Offers As Columns
+    rows = [configuration for configuration in configurations if configuration.candidate_id in preferences]
+    if not rows or not offers:
+        return {}
+    preference_columns = {
+        field: np.array([preferences[row.candidate_id][field] for row in rows])[:, None]
+        for field in PREFERENCE_FIELDS
+    }
+    offer_columns = {
+        field: np.array([features[field] for _, features in offers])[None, :]
+        for field in OFFER_FIELDS
+    }
+    scores = score_matches(preference_columns, offer_columns)
+    # Only Offers Published Since Each Candidate Last Digest
+    offer_dates = np.array([publication_dates[offer_id].toordinal() for offer_id, _ in offers])[None, :]
+    since = np.array([alert_since(row, now).toordinal() for row in rows])[:, None]
+    scores = np.where(offer_dates >= since, scores, -1.0)
+    offer_ids = np.array([offer_id for offer_id, _ in offers])
+    digests = {}
+    for row, row_scores in zip(rows, scores):
+        best = np.argsort(-row_scores, kind="stable")[:ALERT_MAX_OFFERS]
+        matches = [(int(offer_ids[index]), float(row_scores[index])) for index in best if row_scores[index] >= ALERT_MIN_SCORE]
+        if matches:
+            digests[row.configuration_id] = matches
+    return digests
+
+def render_digest(configuration, matches: list[tuple[int, float]], offers: dict[int, ActiveOffer]):
+    html = render_email_template("job-alert-digest.html", {
+        "name": configuration.name,
+        "offers": [
+            {
+                "title": offers[offer_id].title,
+                "company": offers[offer_id].company_trade_name,
+                "city": offers[offer_id].city_name,
+                "contract": offers[offer_id].contract_name,
+                "url": f"{settings.front_end_domain}/job-detail/{offer_id}"
+            } for offer_id, _ in matches
+        ]
+    })
+    return build_html_message(
+        configuration.email_alerts or configuration.email,
+        "Nuevas Ofertas Para Ti",
+        html
+    )
+
+async def advance_alerts(session, configurations: list, now: datetime, failed_ids: set[int]):
+    # Failed Rows Keep The Retry Time Set By The Claim; One UPDATE Per Frequency Instead Of One Per Candidate
+    by_days = defaultdict(list)
+    for configuration in configurations:
+        if configuration.configuration_id not in failed_ids:
+            by_days[configuration.days].append(configuration.configuration_id)
+    for days, configuration_ids in by_days.items():
+        await session.execute(
+            update(CandidateAlertConfiguration).where(
+                CandidateAlertConfiguration.configuration_id.in_(configuration_ids)
+            ).values(
+                last_alert_sent=now,
+                # Due From Midnight, So The Run Of That Day Picks It Up Whatever Time It Starts
+                next_alert=datetime.combine(now.date() + timedelta(days=days), time.min)
+            ).execution_options(synchronize_session=False)
+        )
+
+async def process_alert_batch(session, mailer: PooledMailer, now: datetime) -> tuple[int, int, int]:
+    configurations = await claim_configurations(session, now)
+    if not configurations:
+        return 0, 0, 0
+    # Preferences Of The Whole Batch In One Query
+    result = await session.execute(
+        preference_query().where(
+            CandidatePositionPreference.candidate_id.in_([row.candidate_id for row in configurations])
+        )
+    )
+    preferences = dict(preference_features(row) for row in result.all())
+    # Offers Published Since The Oldest Digest Of The Batch, Loaded Once
+    oldest = min(alert_since(row, now) for row in configurations)
+    result = await session.execute(
+        offer_query().add_columns(ActiveOffer.publication_date).where(
+            ActiveOffer.publication_date >= oldest,
+            ActiveOffer.publication_date < now.date()
+        )
+    )
+    offer_rows = result.all()
+    offers = [offer_features(row) for row in offer_rows]
+    publication_dates = {row[0]: row.publication_date for row in offer_rows}
+    digests = match_digests(configurations, preferences, offers, publication_dates, now)
+    failed_ids = set()
+    if digests:
+        result = await session.execute(
+            select(ActiveOffer).where(
+                ActiveOffer.offer_id.in_({offer_id for matches in digests.values() for offer_id, _ in matches})
+            )
+        )
+        summaries = {offer.offer_id: offer for offer in result.scalars().all()}
+        recipients = [row for row in configurations if row.configuration_id in digests]
+        messages = [render_digest(row, digests[row.configuration_id], summaries) for row in recipients]
+        # Throttled Sends Take Minutes, No Transaction Stays Open Meanwhile
+        await session.commit()
+        delivered = await mailer.send_all(messages)
+        failed_ids = {row.configuration_id for row, sent in zip(recipients, delivered) if not sent}
+    await advance_alerts(session, configurations, now, failed_ids)
+    await session.commit()
+    return len(configurations), len(digests) - len(failed_ids), len(failed_ids)
+
+async def run_job_alerts():
+    now = datetime.now()
+    started_at = now
+    totals = {"configurations": 0, "sent": 0, "failed": 0}
+    mailer = PooledMailer()
+    async with async_session() as session:
+        while True:
+            processed, sent, failed = await process_alert_batch(session, mailer, now)
+            if not processed:
+                break
+            totals["configurations"] += processed
+            totals["sent"] += sent
+            totals["failed"] += failed
+    last_alerts_run.update({
+        "started_at": started_at.isoformat(),
+        **totals,
+        "total_seconds": round((datetime.now() - started_at).total_seconds(), 3)
+    })
+    print(f"[INFO]: Job alerts finished: {last_alerts_run}")
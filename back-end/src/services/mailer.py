@@ -0,0 +1,122 @@
+import time
+import asyncio
+import aiosmtplib
+from email.message import EmailMessage
+from fastapi_mail import ConnectionConfig
+
+from config.email.email_utilities import config
+from config.settings import get_settings
+
+settings = get_settings()
+
+# SMTP Sessions Open At Once
+MAILER_CONNECTIONS = 2
+# Messages Per Second Across Every Connection, Below The Provider Limits
+MAILER_MESSAGES_PER_SECOND = 5
+# Reconnect After This Many Messages, Providers Drop Long Sessions
+MAILER_MESSAGES_PER_CONNECTION = 100
+
+def render_email_template(template_name: str, body: dict) -> str:
+    return config.template_engine().get_template(template_name).render(**body)
+
+def build_html_message(recipient: str, subject: str, html: str) -> EmailMessage:
+    message = EmailMessage()
+    message["From"] = settings.smtp_mail_from
+    message["To"] = recipient
+    message["Subject"] = subject
+    message.set_content(html, subtype="html")
+    return message
+
+class RateLimiter:
+    def __init__(self, per_second: float):
+        self.interval = 1 / per_second
+        self.next_slot = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait(self):
+        async with self._lock:
+            now = time.monotonic()
+            delay = self.next_slot - now
+            self.next_slot = max(now, self.next_slot) + self.interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+class PooledMailer:
+    # Reuses A Few Authenticated SMTP Sessions Instead Of One Login Per Message
+    def __init__(
+        self,
+        connection_config: ConnectionConfig = config,
+        connections: int = MAILER_CONNECTIONS,
+        messages_per_second: float = MAILER_MESSAGES_PER_SECOND,
+        messages_per_connection: int = MAILER_MESSAGES_PER_CONNECTION
+    ):
+        self.connection_config = connection_config
+        self.connections = connections
+        self.messages_per_connection = messages_per_connection
+        self.limiter = RateLimiter(messages_per_second)
+
+    async def send_all(self, messages: list[EmailMessage]) -> list[bool]:
+        queue: asyncio.Queue[tuple[int, EmailMessage]] = asyncio.Queue()
+        for item in enumerate(messages):
+            queue.put_nowait(item)
+        results = [False] * len(messages)
+        await asyncio.gather(*[
+            self._worker(queue, results) for _ in range(min(self.connections, len(messages)))
+        ])
+        return results
+
+    async def _connect(self) -> aiosmtplib.SMTP:
+        # Same Settings As The 'fastapi_mail' Sends, Through The Public 'aiosmtplib' Client
+        settings = self.connection_config
+        client = aiosmtplib.SMTP(
+            hostname=settings.MAIL_SERVER,
+            port=settings.MAIL_PORT,
+            timeout=settings.TIMEOUT,
+            use_tls=settings.MAIL_SSL_TLS,
+            start_tls=settings.MAIL_STARTTLS,
+            validate_certs=settings.VALIDATE_CERTS
+        )
+        await client.connect()
+        if settings.USE_CREDENTIALS:
+            try:
+                await client.login(settings.MAIL_USERNAME, settings.MAIL_PASSWORD.get_secret_value())
+            except Exception:
+                client.close()
+                raise
+        return client
+
+    async def _worker(self, queue: asyncio.Queue, results: list[bool]):
+        connection = None
+        sent = 0
+        try:
+            while not queue.empty():
+                index, message = queue.get_nowait()
+                await self.limiter.wait()
+                try:
+                    # Suppressed Sends Never Open A Session
+                    if not self.connection_config.SUPPRESS_SEND:
+                        if connection is None:
+                            connection = await self._connect()
+                        await connection.send_message(message)
+                    results[index] = True
+                    sent += 1
+                    if sent >= self.messages_per_connection:
+                        await self._close(connection)
+                        connection = None
+                        sent = 0
+                except Exception as ex:
+                    # Drop The Session, The Next Message Opens A Fresh One
+                    print(f"[ERROR]: Sending email to {message['To']} failed: {ex}")
+                    await self._close(connection)
+                    connection = None
+                    sent = 0
+        finally:
+            await self._close(connection)
+
+    async def _close(self, connection: aiosmtplib.SMTP | None):
+        if connection is None:
+            return
+        try:
+            await connection.quit()
+        except Exception:
+            connection.close()
@@ -0,0 +1,98 @@
+import re
+import time
+from datetime import date, datetime
+from sqlmodel import select
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from config.db import async_session
+from models.job_offer import JobOffer
+from models.codelco_job import CodelcoJob
+from schemas.job_offer import OfferStateEnum
+from services.active_offers import run_daily_rollover
+from services.scheduler import run_exclusive
+
+# Rows Changed Per UPDATE So Row Locks Stay Short
+MAINTENANCE_BATCH_SIZE = 1000
+SPANISH_MONTHS = {
+    "ene": 1, "feb": 2, "mar": 3, "abr": 4, "may": 5, "jun": 6,
+    "jul": 7, "ago": 8, "sep": 9, "sept": 9, "oct": 10, "nov": 11, "dic": 12
+}
+
+last_maintenance_run: dict = {}
+
+def parse_codelco_date(value: str | None) -> date | None:
+    # Codelco Publishes Dates Like '21 ago 2025', Older Rows May Hold ISO Or dd/mm/yyyy
+    if not value:
+        return None
+    value = value.strip().lower()
+    spanish_match = re.match(r"^(\d{1,2})\s+([a-z]+)\.?\s+(\d{4})$", value)
+    if spanish_match and spanish_match.group(2) in SPANISH_MONTHS:
+        day, month, year = spanish_match.groups()
+        return date(int(year), SPANISH_MONTHS[month], int(day))
+    for date_format in ("%Y-%m-%d", "%d/%m/%Y", "%d-%m-%Y"):
+        try:
+            return datetime.strptime(value[:10], date_format).date()
+        except ValueError:
+            continue
+    return None
+
+async def expire_job_offers(session: AsyncSession, today: date) -> int:
+    expired = 0
+    while True:
+        result = await session.execute(
+            update(JobOffer).where(
+                JobOffer.state == OfferStateEnum.active,
+                JobOffer.closing_date < today
+            ).values(
+                state=OfferStateEnum.finished
+            ).with_dialect_options(
+                mysql_limit=MAINTENANCE_BATCH_SIZE
+            ).execution_options(synchronize_session=False)
+        )
+        await session.commit()
+        expired += result.rowcount
+        if result.rowcount < MAINTENANCE_BATCH_SIZE:
+            return expired
+
+async def deactivate_expired_codelco_jobs(session: AsyncSession, today: date) -> int:
+    # Closing Dates Are Stored As Text, So They Are Parsed Here Instead Of In SQL
+    result = await session.execute(
+        select(CodelcoJob.id, CodelcoJob.fecha).where(CodelcoJob.activo == True)
+    )
+    expired_ids = [
+        job_id for job_id, closing_date in result.all()
+        if (parsed := parse_codelco_date(closing_date)) and parsed < today
+    ]
+    for start in range(0, len(expired_ids), MAINTENANCE_BATCH_SIZE):
+        await session.execute(
+            update(CodelcoJob).where(
+                CodelcoJob.id.in_(expired_ids[start:start + MAINTENANCE_BATCH_SIZE])
+            ).values(
+                activo=False,
+                fecha_actualizado=datetime.now()
+            ).execution_options(synchronize_session=False)
+        )
+        await session.commit()
+    return len(expired_ids)
+
+async def run_nightly_maintenance():
+    today = date.today()
+    started_at = datetime.now()
+    start = time.perf_counter()
+    async with async_session() as session:
+        expired_offers = await expire_job_offers(session, today)
+        offers_seconds = time.perf_counter() - start
+        expired_codelco_jobs = await deactivate_expired_codelco_jobs(session, today)
+        codelco_seconds = time.perf_counter() - start - offers_seconds
+    # Rebuild The Projection After Expiring So Portal Reads See The New States, Under The Startup Rebuild Lock
+    await run_exclusive(run_daily_rollover)
+    last_maintenance_run.update({
+        "started_at": started_at.isoformat(),
+        "expired_offers": expired_offers,
+        "expired_offers_seconds": round(offers_seconds, 3),
+        "expired_codelco_jobs": expired_codelco_jobs,
+        "expired_codelco_jobs_seconds": round(codelco_seconds, 3),
+        "total_seconds": round(time.perf_counter() - start, 3)
+    })
+    print(f"[INFO]: Nightly maintenance finished: {last_maintenance_run}")
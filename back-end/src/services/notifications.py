@@ -0,0 +1,71 @@
+import asyncio
+from typing import Awaitable, Callable
+from sqlmodel import select
+from sqlalchemy import update
+
+from config.db import async_session
+from config.email.email_utilities import send_not_selected_email
+from models.candidate import Candidate
+from models.job_offer import JobOffer
+from models.postulation import Postulation
+from schemas.postulation import PostulationStateEnum
+
+# Candidates Notified Per Email Message
+NOTIFICATION_BATCH_SIZE = 50
+
+NotificationJob = Callable[..., Awaitable[None]]
+
+notification_queue: asyncio.Queue[tuple[NotificationJob, tuple]] = asyncio.Queue()
+worker_tasks: list[asyncio.Task] = []
+
+def queue_notification(job: NotificationJob, *args):
+    notification_queue.put_nowait((job, args))
+
+async def notification_worker():
+    while True:
+        job, args = await notification_queue.get()
+        try:
+            await job(*args)
+        except Exception as ex:
+            print(f"[ERROR]: Notification job {job.__name__} failed: {ex}")
+        finally:
+            notification_queue.task_done()
+
+def start_notification_worker():
+    worker_tasks.append(asyncio.create_task(notification_worker()))
+
+async def stop_notification_worker():
+    for task in worker_tasks:
+        task.cancel()
+    await asyncio.gather(*worker_tasks, return_exceptions=True)
+    worker_tasks.clear()
+
+async def notify_not_selected_postulations(offer_id: int):
+    # Recipients Are The Postulations Flagged When They Were Discarded, Read In Batches From 'ix_postulacion_notificacion'
+    async with async_session() as session:
+        offer = await session.get(JobOffer, offer_id)
+        if not offer:
+            return
+        while True:
+            query = select(Postulation.postulation_id, Postulation.state, Candidate.email).join(
+                Candidate, Postulation.candidate_id == Candidate.candidate_id
+            ).where(
+                Postulation.offer_id == offer_id,
+                Postulation.notification_pending == 1
+            ).limit(NOTIFICATION_BATCH_SIZE).with_for_update(skip_locked=True, of=Postulation)
+            result = await session.execute(query)
+            rows = result.all()
+            if not rows:
+                break
+            # Clear The Flags And Release The Locks Before Sending, Each Email Goes Out At Most Once
+            await session.execute(
+                update(Postulation).where(
+                    Postulation.postulation_id.in_([row.postulation_id for row in rows])
+                ).values(
+                    notification_pending=0
+                ).execution_options(synchronize_session=False)
+            )
+            await session.commit()
+            emails = [row.email for row in rows if row.state == PostulationStateEnum.not_selected]
+            if emails:
+                await send_not_selected_email(emails, offer.title)
@@ -0,0 +1,33 @@
+import time
+
+# Each Worker Keeps Its Own Copy, The TTL Bounds Staleness Across Workers
+OFFER_CACHE_TTL = 60
+FACETS_CACHE_MAX_ENTRIES = 512
+
+latest_offers: dict[bool, tuple[float, list[dict]]] = {}
+offer_facets: dict[tuple, tuple[float, dict]] = {}
+
+def get_cached_latest(featured: bool) -> list[dict] | None:
+    entry = latest_offers.get(featured)
+    if not entry or time.monotonic() - entry[0] > OFFER_CACHE_TTL:
+        return None
+    return entry[1]
+
+def set_cached_latest(featured: bool, offers: list[dict]):
+    latest_offers[featured] = (time.monotonic(), offers)
+
+def get_cached_facets(signature: tuple) -> dict | None:
+    entry = offer_facets.get(signature)
+    if not entry or time.monotonic() - entry[0] > OFFER_CACHE_TTL:
+        return None
+    return entry[1]
+
+def set_cached_facets(signature: tuple, facets: dict):
+    # Drop The Oldest Signature When The Cache Is Full
+    if signature not in offer_facets and len(offer_facets) >= FACETS_CACHE_MAX_ENTRIES:
+        offer_facets.pop(next(iter(offer_facets)))
+    offer_facets[signature] = (time.monotonic(), facets)
+
+def invalidate_offer_caches():
+    latest_offers.clear()
+    offer_facets.clear()
@@ -0,0 +1,107 @@
+import asyncio
+from sqlmodel import select, func
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import IntegrityError, OperationalError
+
+from config.db import async_session
+from models.active_offer import ActiveOffer
+from models.code_counter import CodeCounter
+from models.job_offer import JobOffer
+
+OFFER_CODE_COUNTER = "oferta"
+FIRST_OFFER_CODE = 1000
+# Codes Reserved Per Round Trip, Unused Ones Are Skipped When A Worker Stops
+OFFER_CODE_BLOCK_SIZE = 20
+# MySQL Deadlock And Lock Wait Timeout, Both Leave The Counter Untouched And Can Be Retried
+RETRYABLE_LOCK_ERRORS = {1213, 1205}
+
+class CodeAllocator:
+    def __init__(self, counter_name: str, first_value: int, block_size: int):
+        self.counter_name = counter_name
+        self.first_value = first_value
+        self.block_size = block_size
+        self.next_value = 0
+        self.block_end = 0
+        self._lock = asyncio.Lock()
+
+    async def allocate(self) -> int:
+        async with self._lock:
+            if self.next_value >= self.block_end:
+                self.next_value, self.block_end = await self._reserve_block()
+            value = self.next_value
+            self.next_value += 1
+            return value
+
+    async def allocate_many(self, count: int) -> list[int]:
+        async with self._lock:
+            values = list(range(self.next_value, min(self.block_end, self.next_value + count)))
+            missing = count - len(values)
+            if missing:
+                # Reserve The Remainder In One Round Trip, Keeping Leftovers For Later Calls
+                start, end = await self._reserve_block(max(missing, self.block_size))
+                values += list(range(start, start + missing))
+                self.next_value, self.block_end = start + missing, end
+            else:
+                self.next_value += count
+            return values
+
+    async def _reserve_block(self, size: int | None = None) -> tuple[int, int]:
+        size = size or self.block_size
+        # Own Short Transaction So The Counter Row Lock Is Released Right Away
+        while True:
+            async with async_session() as session:
+                try:
+                    query = select(CodeCounter).where(
+                        CodeCounter.name == self.counter_name
+                    ).with_for_update()
+                    result = await session.execute(query)
+                    counter = result.scalar_one_or_none()
+                    if not counter:
+                        # Seed The Counter Once From The Highest Code In Use
+                        result = await session.execute(select(func.max(JobOffer.code)))
+                        max_code = result.scalar()
+                        counter = CodeCounter(
+                            name=self.counter_name,
+                            next_value=max(self.first_value, (max_code or 0) + 1)
+                        )
+                        session.add(counter)
+                    start = counter.next_value
+                    counter.next_value = start + size
+                    await session.commit()
+                    return start, start + size
+                except IntegrityError:
+                    # Another Worker Seeded The Counter First, Lock Its Row Instead
+                    await session.rollback()
+                except OperationalError as error:
+                    # Workers Seeding The Counter At Once Can Deadlock, One Of Them Is Rolled Back
+                    await session.rollback()
+                    if error.orig.args[0] not in RETRYABLE_LOCK_ERRORS:
+                        raise
+
+offer_code_allocator = CodeAllocator(OFFER_CODE_COUNTER, FIRST_OFFER_CODE, OFFER_CODE_BLOCK_SIZE)
+
+async def reassign_duplicate_offer_codes(session: AsyncSession) -> dict[int, int]:
+    # Codes Given Twice Before 'uq_oferta_codigo' Existed; The Oldest Offer Keeps It, The Rest Get New Codes
+    duplicated = select(JobOffer.code).group_by(JobOffer.code).having(func.count() > 1)
+    result = await session.execute(
+        select(JobOffer.offer_id, JobOffer.code).where(
+            JobOffer.code.in_(duplicated)
+        ).order_by(JobOffer.code, JobOffer.offer_id)
+    )
+    kept_codes = set()
+    offer_ids = []
+    for offer_id, code in result.all():
+        if code in kept_codes:
+            offer_ids.append(offer_id)
+        else:
+            kept_codes.add(code)
+    if not offer_ids:
+        return {}
+    # New Codes Come From The Counter, So They Never Collide With Codes Allocated Meanwhile
+    reassigned = dict(zip(offer_ids, await offer_code_allocator.allocate_many(len(offer_ids))))
+    for offer_id, code in reassigned.items():
+        await session.execute(update(JobOffer).where(JobOffer.offer_id == offer_id).values(code=code))
+        await session.execute(update(ActiveOffer).where(ActiveOffer.offer_id == offer_id).values(code=code))
+    await session.commit()
+    return reassigned
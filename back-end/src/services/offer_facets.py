@@ -0,0 +1,38 @@
+from typing import Any, Callable
+
+# Facet -> (Id Field, Name Field) In The Grouped Rows
+FACETS = {
+    "regions": ("region_id", "region_name"),
+    "cities": ("city_id", "city_name"),
+    "contract_types": ("type_id", "contract_name"),
+    "job_types": ("job_type_id", "job_type_name"),
+    "companies": ("company_id", "company_trade_name")
+}
+
+def count_offer_facets(groups: list[Any], selected: dict[str, Callable[[Any], bool]]) -> dict:
+    # Each Facet Ignores Its Own Selection So The Sidebar Can Show The Alternatives
+    facets = {facet: {} for facet in FACETS}
+    total_offers = 0
+    for group in groups:
+        failed = [facet for facet, predicate in selected.items() if not predicate(group)]
+        if not failed:
+            total_offers += group.total
+        for facet, (id_field, name_field) in FACETS.items():
+            if failed and failed != [facet]:
+                continue
+            value_id = getattr(group, id_field)
+            if value_id is None:
+                continue
+            value = facets[facet].setdefault(value_id, {
+                "value_id": value_id,
+                "name": getattr(group, name_field),
+                "total": 0
+            })
+            value["total"] += group.total
+    return {
+        "total_offers": total_offers,
+        **{
+            facet: sorted(values.values(), key=lambda value: (-value["total"], value["name"] or ""))
+            for facet, values in facets.items()
+        }
+    }
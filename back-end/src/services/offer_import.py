@@ -0,0 +1,229 @@
+import csv
+import io
+import json
+import codecs
+from typing import AsyncIterator
+from pydantic import ValidationError
+from sqlmodel import select, func, tuple_
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models.job_offer import JobOffer
+from models.job_question import JobQuestion
+from models.specific_position import SpecificPosition
+from models.generic_position import GenericPosition
+from schemas.job_offer import CreateOffer, OfferStateEnum, OfferFeaturedEnum
+from schemas.job_question import QuestionTypeEnum
+from services.offer_codes import offer_code_allocator
+
+IMPORT_BATCH_SIZE = 100
+IMPORT_MAX_ROWS = 2000
+# Largest Single Row Kept In Memory While Waiting For The Rest Of It
+IMPORT_MAX_ROW_SIZE = 64 * 1024
+SALARY_QUESTION = "¿Cuál es tu pretensión salarial liquida?"
+
+class ImportFormatError(ValueError):
+    pass
+
+async def iter_json_rows(stream: AsyncIterator[bytes]) -> AsyncIterator[object]:
+    # Decode A Top Level JSON Array One Element At A Time
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder("utf-8")()
+    buffer = ""
+    started = False
+    finished = False
+    async for chunk in stream:
+        buffer += text_decoder.decode(chunk)
+        position = 0
+        while True:
+            while position < len(buffer) and buffer[position] in " \t\r\n,":
+                position += 1
+            if position == len(buffer):
+                break
+            if finished:
+                raise ImportFormatError("Unexpected content after the JSON array")
+            if not started:
+                if buffer[position] != "[":
+                    raise ImportFormatError("The JSON body must be an array of job offers")
+                started = True
+                position += 1
+                continue
+            if buffer[position] == "]":
+                finished = True
+                position += 1
+                continue
+            try:
+                row, position = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                # Incomplete Element, Wait For The Next Chunk
+                if len(buffer) - position > IMPORT_MAX_ROW_SIZE:
+                    raise ImportFormatError("Malformed JSON array")
+                break
+            yield row
+        buffer = buffer[position:]
+    if not finished:
+        raise ImportFormatError("Malformed JSON array")
+
+def _complete_csv_part(buffer: str) -> int:
+    # Last Line Break That Is Not Inside A Quoted Field
+    end = buffer.rfind("\n")
+    while end != -1 and buffer.count('"', 0, end) % 2:
+        end = buffer.rfind("\n", 0, end)
+    return end + 1
+
+async def iter_csv_rows(stream: AsyncIterator[bytes]) -> AsyncIterator[dict]:
+    text_decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    buffer = ""
+    header = None
+    async for chunk in stream:
+        buffer += text_decoder.decode(chunk)
+        end = _complete_csv_part(buffer)
+        if not end:
+            if len(buffer) > IMPORT_MAX_ROW_SIZE:
+                raise ImportFormatError("Malformed CSV file")
+            continue
+        lines, buffer = buffer[:end], buffer[end:]
+        for values in csv.reader(io.StringIO(lines)):
+            if not values:
+                continue
+            if header is None:
+                header = [column.strip() for column in values]
+                continue
+            yield csv_row_to_offer(header, values)
+    buffer += text_decoder.decode(b"", final=True)
+    for values in csv.reader(io.StringIO(buffer)):
+        if values and header is not None:
+            yield csv_row_to_offer(header, values)
+
+def csv_row_to_offer(header: list[str], values: list[str]) -> dict:
+    # Empty Cells Fall Back To The Schema Defaults
+    row = {
+        column: value for column, value in zip(header, values)
+        if value.strip()
+    }
+    if "questions" in row:
+        try:
+            row["questions"] = json.loads(row["questions"])
+        except ValueError:
+            pass
+    return row
+
+def format_validation_errors(ex: ValidationError) -> list[dict]:
+    return [
+        {
+            "field": ".".join(str(loc) for loc in error["loc"]),
+            "message": error["msg"]
+        } for error in ex.errors()
+    ]
+
+async def resolve_specific_positions(session: AsyncSession, pairs: set[tuple[str, int]]) -> dict:
+    # Offers Sharing Name And Generic Position Share One Specific Position Row
+    query = select(
+        SpecificPosition.name,
+        SpecificPosition.position_id,
+        func.min(SpecificPosition.specific_position_id)
+    ).where(
+        tuple_(SpecificPosition.name, SpecificPosition.position_id).in_(list(pairs))
+    ).group_by(SpecificPosition.name, SpecificPosition.position_id)
+    result = await session.execute(query)
+    resolved = {(name, position_id): specific_id for name, position_id, specific_id in result.all()}
+    missing = pairs - resolved.keys()
+    if missing:
+        await session.execute(
+            insert(SpecificPosition),
+            [{"name": name, "position_id": position_id} for name, position_id in missing]
+        )
+        result = await session.execute(query)
+        resolved = {(name, position_id): specific_id for name, position_id, specific_id in result.all()}
+    return resolved
+
+async def import_offer_batch(
+    session: AsyncSession,
+    rows: list[tuple[int, object]],
+    company_id: int | None
+) -> list[dict]:
+    report = {}
+    offers: list[tuple[int, CreateOffer]] = []
+    # Validate Every Row Before Touching The Database
+    for row_number, row in rows:
+        try:
+            offers.append((row_number, CreateOffer.model_validate(row)))
+        except ValidationError as ex:
+            report[row_number] = {
+                "row": row_number,
+                "status": "error",
+                "errors": format_validation_errors(ex)
+            }
+    # Resolve Generic Positions With One Query
+    generic_ids = {offer.generic_position_id for _, offer in offers if offer.generic_position_id}
+    existing_generic_ids = set()
+    if generic_ids:
+        result = await session.execute(
+            select(GenericPosition.position_id).where(GenericPosition.position_id.in_(generic_ids))
+        )
+        existing_generic_ids = set(result.scalars().all())
+    valid_offers = []
+    for row_number, offer in offers:
+        if offer.generic_position_id and offer.generic_position_id not in existing_generic_ids:
+            report[row_number] = {
+                "row": row_number,
+                "status": "error",
+                "errors": [{"field": "generic_position_id", "message": "Generic position does not exists"}]
+            }
+        else:
+            valid_offers.append((row_number, offer))
+    if valid_offers:
+        specific_positions = {}
+        position_pairs = {
+            (offer.position, offer.generic_position_id)
+            for _, offer in valid_offers if offer.generic_position_id
+        }
+        if position_pairs:
+            specific_positions = await resolve_specific_positions(session, position_pairs)
+        # Insert All Job Offers In One Statement
+        codes = await offer_code_allocator.allocate_many(len(valid_offers))
+        offer_rows = []
+        for (_, offer), code in zip(valid_offers, codes):
+            base_data = offer.model_dump(exclude={"questions", "generic_position_id"})
+            base_data["specific_position_id"] = None
+            if offer.generic_position_id:
+                base_data["position"] = None
+                base_data["specific_position_id"] = specific_positions[(offer.position, offer.generic_position_id)]
+            offer_rows.append({
+                **base_data,
+                "code": code,
+                "state": OfferStateEnum.pending,
+                "featured": OfferFeaturedEnum.not_featured,
+                "company_id": company_id
+            })
+        await session.execute(insert(JobOffer), offer_rows)
+        # Codes Are Unique, So They Map The New Offers Back To Their Ids
+        result = await session.execute(
+            select(JobOffer.code, JobOffer.offer_id).where(JobOffer.code.in_(codes))
+        )
+        offer_ids = dict(result.all())
+        # Insert All Job Questions In One Statement
+        question_rows = []
+        for (_, offer), code in zip(valid_offers, codes):
+            if offer.salary:
+                question_rows.append({
+                    "question": SALARY_QUESTION,
+                    "question_type": QuestionTypeEnum.numeric,
+                    "offer_id": offer_ids[code]
+                })
+            for question in offer.questions or []:
+                question_rows.append({
+                    "question": question.question,
+                    "question_type": question.question_type,
+                    "offer_id": offer_ids[code]
+                })
+        if question_rows:
+            await session.execute(insert(JobQuestion), question_rows)
+        for (row_number, _), code in zip(valid_offers, codes):
+            report[row_number] = {
+                "row": row_number,
+                "status": "created",
+                "offer_id": offer_ids[code],
+                "code": code
+            }
+    return [report[row_number] for row_number, _ in rows]
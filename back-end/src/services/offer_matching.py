@@ -0,0 +1,290 @@
+import re
+import time
+import asyncio
+import numpy as np
+from sqlmodel import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models.active_offer import ActiveOffer
+from models.job_offer import JobOffer
+from models.specific_position import SpecificPosition
+from models.candidate_position_preference import CandidatePositionPreference
+from models.city import City
+from schemas.candidate_position_preference import PositionPreferenceStateEnum
+
+# Feature -> Points Out Of 100
+MATCH_WEIGHTS = {
+    "position": 30,
+    "area": 15,
+    "city": 15,
+    "contract": 10,
+    "job_type": 10,
+    "salary": 15,
+    "experience": 5
+}
+# Same Region But Another City Is Worth Part Of The City Points
+REGION_MATCH_FACTOR = 0.5
+# Unset Preferences And Unknown Offer Values Are Worth Half, So Empty Profiles Do Not Top Every List
+UNKNOWN_FACTOR = 0.5
+# Each Worker Keeps Its Own Arrays, Writes Patch Them And The Interval Bounds Staleness Across Workers
+MATCHING_RELOAD_INTERVAL = 600
+MATCH_MIN_SCORE = 1.0
+# Categorical Columns Use 0 For "Not Set"
+CATEGORY_FIELDS = ("position", "area", "city", "region", "contract", "job_type")
+NUMERIC_FIELDS = ("min_wage", "salary", "experience")
+
+def parse_years(value: str | None) -> float:
+    # Free Text Like "3 años" Or "2-4"; The First Number Is The Requirement
+    match = re.search(r"\d+", value or "")
+    return float(match.group()) if match else np.nan
+
+class FeatureTable:
+    # Column Arrays With A Row Per Entity, Rows Are Patched In Place And Grown By Doubling
+    def __init__(self, fields: tuple[str, ...], capacity: int = 1024):
+        self.fields = fields
+        self.size = 0
+        self.ids = np.zeros(capacity, dtype=np.int64)
+        self.columns = {
+            field: np.full(capacity, np.nan if field in NUMERIC_FIELDS else 0, dtype=np.float64 if field in NUMERIC_FIELDS else np.int32)
+            for field in fields
+        }
+        self.rows: dict[int, int] = {}
+
+    @classmethod
+    def from_rows(cls, fields: tuple[str, ...], rows: list[tuple[int, dict]]) -> "FeatureTable":
+        table = cls(fields, max(len(rows), 1024))
+        table.size = len(rows)
+        table.ids[:len(rows)] = [entity_id for entity_id, _ in rows]
+        for field in fields:
+            table.columns[field][:len(rows)] = [features[field] for _, features in rows]
+        table.rows = {entity_id: index for index, (entity_id, _) in enumerate(rows)}
+        return table
+
+    def view(self) -> dict[str, np.ndarray]:
+        return {field: column[:self.size] for field, column in self.columns.items()}
+
+    def get(self, entity_id: int) -> dict | None:
+        index = self.rows.get(entity_id)
+        if index is None:
+            return None
+        return {field: column[index] for field, column in self.columns.items()}
+
+    def upsert(self, entity_id: int, features: dict):
+        index = self.rows.get(entity_id)
+        if index is None:
+            if self.size == len(self.ids):
+                self.ids = np.resize(self.ids, self.size * 2)
+                self.columns = {field: np.resize(column, self.size * 2) for field, column in self.columns.items()}
+            index = self.size
+            self.size += 1
+            self.ids[index] = entity_id
+            self.rows[entity_id] = index
+        for field in self.fields:
+            self.columns[field][index] = features[field]
+
+    def remove(self, entity_id: int):
+        # Move The Last Row Into The Hole So Rows Stay Contiguous
+        index = self.rows.pop(entity_id, None)
+        if index is None:
+            return
+        last = self.size - 1
+        if index != last:
+            last_id = int(self.ids[last])
+            self.ids[index] = last_id
+            for column in self.columns.values():
+                column[index] = column[last]
+            self.rows[last_id] = index
+        self.size = last
+
+PREFERENCE_FIELDS = CATEGORY_FIELDS + ("min_wage", "experience")
+OFFER_FIELDS = CATEGORY_FIELDS + ("salary", "experience")
+
+def score_matches(preference: dict, offer: dict) -> np.ndarray:
+    # Works Element Wise, One Side Is A Single Row And The Other One A Whole Table
+    def category(field: str) -> np.ndarray:
+        return np.where(preference[field] == 0, UNKNOWN_FACTOR, preference[field] == offer[field])
+    city = np.where(
+        preference["city"] == 0,
+        UNKNOWN_FACTOR,
+        np.where(
+            preference["city"] == offer["city"],
+            1.0,
+            np.where((preference["region"] != 0) & (preference["region"] == offer["region"]), REGION_MATCH_FACTOR, 0.0)
+        )
+    )
+    with np.errstate(invalid="ignore", divide="ignore"):
+        # Offers Paying Less Than The Minimum Wage Lose Points Proportionally
+        salary = np.where(
+            np.isnan(preference["min_wage"]) | (preference["min_wage"] <= 0) | np.isnan(offer["salary"]),
+            UNKNOWN_FACTOR,
+            np.clip(offer["salary"] / preference["min_wage"], 0.0, 1.0)
+        )
+        experience = np.where(
+            np.isnan(offer["experience"]),
+            1.0,
+            np.where(
+                np.isnan(preference["experience"]),
+                UNKNOWN_FACTOR,
+                offer["experience"] <= preference["experience"]
+            )
+        )
+    return (
+        MATCH_WEIGHTS["position"] * category("position")
+        + MATCH_WEIGHTS["area"] * category("area")
+        + MATCH_WEIGHTS["city"] * city
+        + MATCH_WEIGHTS["contract"] * category("contract")
+        + MATCH_WEIGHTS["job_type"] * category("job_type")
+        + MATCH_WEIGHTS["salary"] * salary
+        + MATCH_WEIGHTS["experience"] * experience
+    )
+
+def top_matches(ids: np.ndarray, scores: np.ndarray, limit: int) -> list[tuple[int, float]]:
+    # Partial Sort, Only The Best 'limit' Rows Are Ordered
+    scores = np.atleast_1d(scores)
+    if not len(scores):
+        return []
+    if len(scores) > limit:
+        best = np.argpartition(-scores, limit - 1)[:limit]
+    else:
+        best = np.arange(len(scores))
+    best = best[np.lexsort((-ids[best], -scores[best]))]
+    return [
+        (int(ids[index]), round(float(scores[index]), 2))
+        for index in best if scores[index] >= MATCH_MIN_SCORE
+    ]
+
+def preference_query():
+    return select(
+        CandidatePositionPreference.candidate_id,
+        CandidatePositionPreference.position_id,
+        CandidatePositionPreference.area_id,
+        CandidatePositionPreference.city_id,
+        City.region_id,
+        CandidatePositionPreference.type_id,
+        CandidatePositionPreference.job_type_id,
+        CandidatePositionPreference.min_wage,
+        CandidatePositionPreference.years_min_experience
+    ).outerjoin(
+        City, CandidatePositionPreference.city_id == City.city_id
+    ).where(
+        CandidatePositionPreference.active == PositionPreferenceStateEnum.active
+    )
+
+def offer_query():
+    # Only Portal Visible Offers Are Recommended
+    return select(
+        ActiveOffer.offer_id,
+        SpecificPosition.position_id,
+        JobOffer.area_id,
+        ActiveOffer.city_id,
+        ActiveOffer.region_id,
+        ActiveOffer.type_id,
+        ActiveOffer.job_type_id,
+        JobOffer.salary,
+        JobOffer.years_experience
+    ).join(
+        JobOffer, ActiveOffer.offer_id == JobOffer.offer_id
+    ).outerjoin(
+        SpecificPosition, JobOffer.specific_position_id == SpecificPosition.specific_position_id
+    )
+
+def preference_features(row) -> tuple[int, dict]:
+    return row[0], {
+        "position": row[1] or 0,
+        "area": row[2] or 0,
+        "city": row[3] or 0,
+        "region": row[4] or 0,
+        "contract": row[5] or 0,
+        "job_type": row[6] or 0,
+        "min_wage": row[7] if row[7] is not None else np.nan,
+        "experience": parse_years(row[8])
+    }
+
+def offer_features(row) -> tuple[int, dict]:
+    return row[0], {
+        "position": row[1] or 0,
+        "area": row[2] or 0,
+        "city": row[3] or 0,
+        "region": row[4] or 0,
+        "contract": row[5] or 0,
+        "job_type": row[6] or 0,
+        "salary": row[7] if row[7] is not None else np.nan,
+        "experience": parse_years(row[8])
+    }
+
+class MatchingEngine:
+    def __init__(self):
+        self.preferences = FeatureTable(PREFERENCE_FIELDS)
+        self.offers = FeatureTable(OFFER_FIELDS)
+        self.loaded_at = None
+        self._lock = asyncio.Lock()
+
+    async def ensure_loaded(self, session: AsyncSession):
+        if self.loaded_at is not None and time.monotonic() - self.loaded_at <= MATCHING_RELOAD_INTERVAL:
+            return
+        async with self._lock:
+            if self.loaded_at is not None and time.monotonic() - self.loaded_at <= MATCHING_RELOAD_INTERVAL:
+                return
+            preference_rows = await session.execute(preference_query())
+            offer_rows = await session.execute(offer_query())
+            self.load(
+                [preference_features(row) for row in preference_rows.all()],
+                [offer_features(row) for row in offer_rows.all()]
+            )
+
+    def load(self, preferences: list[tuple[int, dict]], offers: list[tuple[int, dict]]):
+        self.preferences = FeatureTable.from_rows(PREFERENCE_FIELDS, preferences)
+        self.offers = FeatureTable.from_rows(OFFER_FIELDS, offers)
+        self.loaded_at = time.monotonic()
+
+    def invalidate(self):
+        self.loaded_at = None
+
+    async def refresh_preference(self, session: AsyncSession, candidate_id: int):
+        # Not Loaded Yet, The Next Full Load Reads The Change
+        if self.loaded_at is None:
+            return
+        # Runs After The Caller Commit, A Failure Only Leaves This Worker Stale Until The Next Reload
+        try:
+            async with self._lock:
+                result = await session.execute(
+                    preference_query().where(CandidatePositionPreference.candidate_id == candidate_id)
+                )
+                row = result.first()
+                if row:
+                    self.preferences.upsert(*preference_features(row))
+                else:
+                    self.preferences.remove(candidate_id)
+        except Exception as ex:
+            print(f"[ERROR]: Refreshing matching preference of candidate {candidate_id} failed: {ex}")
+
+    async def refresh_offer(self, session: AsyncSession, offer_id: int):
+        if self.loaded_at is None:
+            return
+        # Runs After The Caller Commit, A Failure Only Leaves This Worker Stale Until The Next Reload
+        try:
+            async with self._lock:
+                result = await session.execute(offer_query().where(ActiveOffer.offer_id == offer_id))
+                row = result.first()
+                if row:
+                    self.offers.upsert(*offer_features(row))
+                else:
+                    self.offers.remove(offer_id)
+        except Exception as ex:
+            print(f"[ERROR]: Refreshing matching offer {offer_id} failed: {ex}")
+
+    def candidates_for_offer(self, offer_id: int, limit: int) -> list[tuple[int, float]]:
+        offer = self.offers.get(offer_id)
+        if offer is None:
+            return []
+        scores = score_matches(self.preferences.view(), offer)
+        return top_matches(self.preferences.ids[:self.preferences.size], scores, limit)
+
+    def offers_for_candidate(self, candidate_id: int, limit: int) -> list[tuple[int, float]]:
+        preference = self.preferences.get(candidate_id)
+        if preference is None:
+            return []
+        scores = score_matches(preference, self.offers.view())
+        return top_matches(self.offers.ids[:self.offers.size], scores, limit)
+
+matching_engine = MatchingEngine()
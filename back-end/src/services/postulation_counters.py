@@ -0,0 +1,77 @@
+from sqlmodel import select, func
+from sqlalchemy import delete, insert
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models.postulation import Postulation
+from models.postulation_counter import PostulationCounter
+from schemas.postulation import PostulationStateEnum
+
+# Funnel Field -> Postulation State
+FUNNEL_STATES = {
+    "postulate": PostulationStateEnum.postulate,
+    "in_progress": PostulationStateEnum.in_progress,
+    "not_selected": PostulationStateEnum.not_selected,
+    "contracted": PostulationStateEnum.contracted
+}
+
+async def add_to_counter(session: AsyncSession, offer_id: int, state: str, amount: int):
+    # Upsert In The Caller Transaction, The Row Lock Serializes Concurrent Writers
+    await session.execute(
+        mysql_insert(PostulationCounter).values(
+            offer_id=offer_id,
+            state=state,
+            total=amount
+        ).on_duplicate_key_update(
+            total=PostulationCounter.total + amount
+        )
+    )
+
+async def move_counter(session: AsyncSession, offer_id: int, from_state: str, to_state: str):
+    if from_state == to_state:
+        return
+    await add_to_counter(session, offer_id, from_state, -1)
+    await add_to_counter(session, offer_id, to_state, 1)
+
+async def _replace_counters(session: AsyncSession, offer_id: int | None = None):
+    delete_query = delete(PostulationCounter)
+    source_query = select(
+        Postulation.offer_id,
+        Postulation.state,
+        func.count()
+    ).group_by(Postulation.offer_id, Postulation.state)
+    if offer_id is not None:
+        delete_query = delete_query.where(PostulationCounter.offer_id == offer_id)
+        source_query = source_query.where(Postulation.offer_id == offer_id)
+    await session.execute(delete_query)
+    await session.execute(
+        insert(PostulationCounter).from_select(
+            [PostulationCounter.offer_id, PostulationCounter.state, PostulationCounter.total],
+            source_query
+        )
+    )
+
+async def refresh_offer_counters(session: AsyncSession, offer_id: int):
+    await _replace_counters(session, offer_id)
+
+async def rebuild_postulation_counters(session: AsyncSession):
+    await _replace_counters(session)
+
+def build_funnel(counts: dict[str, int]) -> dict:
+    funnel = {field: counts.get(state, 0) for field, state in FUNNEL_STATES.items()}
+    funnel["total"] = sum(funnel.values())
+    return funnel
+
+async def get_offer_funnels(session: AsyncSession, offer_ids: list[int]) -> dict[int, dict]:
+    counts = {offer_id: {} for offer_id in offer_ids}
+    if offer_ids:
+        result = await session.execute(
+            select(
+                PostulationCounter.offer_id,
+                PostulationCounter.state,
+                PostulationCounter.total
+            ).where(PostulationCounter.offer_id.in_(offer_ids))
+        )
+        for offer_id, state, total in result.all():
+            counts[offer_id][state] = total
+    return {offer_id: build_funnel(offer_counts) for offer_id, offer_counts in counts.items()}
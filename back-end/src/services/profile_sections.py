@@ -0,0 +1,73 @@
+from sqlmodel import SQLModel, select
+from sqlalchemy import delete
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Items Accepted Per Section In One Request
+SECTION_MAX_ITEMS = 50
+
+class SectionItemError(ValueError):
+    pass
+
+async def replace_section(
+    session: AsyncSession,
+    model: type[SQLModel],
+    id_field: str,
+    candidate_id: int,
+    items: list[dict],
+    key_fields: tuple[str, ...] | None = None
+) -> dict:
+    # Items Are Matched To Stored Rows By Id, Or By Natural Key For Catalog Sections
+    id_column = getattr(model, id_field)
+    result = await session.execute(
+        select(model).where(model.candidate_id == candidate_id).with_for_update()
+    )
+    stored = {getattr(row, id_field): row for row in result.scalars().all()}
+    if key_fields:
+        stored_keys = {
+            tuple(getattr(row, field) for field in key_fields): row_id
+            for row_id, row in stored.items()
+        }
+        seen_keys = set()
+        for item in items:
+            key = tuple(item[field] for field in key_fields)
+            if key in seen_keys:
+                raise SectionItemError("Section items are repeated")
+            seen_keys.add(key)
+            item[id_field] = stored_keys.get(key)
+    kept_ids = set()
+    rows = []
+    for item in items:
+        row_id = item.get(id_field)
+        if row_id is not None:
+            if row_id not in stored or row_id in kept_ids:
+                raise SectionItemError("Section item does not exists")
+            kept_ids.add(row_id)
+            # Unchanged Rows Are Not Written Again
+            if all(getattr(stored[row_id], field) == value for field, value in item.items()):
+                continue
+        rows.append({**item, id_field: row_id, "candidate_id": candidate_id})
+    removed_ids = stored.keys() - kept_ids
+    # One Statement Per Operation, Whatever The Section Size
+    if removed_ids:
+        await session.execute(
+            delete(model).where(
+                model.candidate_id == candidate_id,
+                id_column.in_(removed_ids)
+            )
+        )
+    if rows:
+        # New Rows Carry A NULL Id, Existing Ones Hit Their Primary Key And Update
+        statement = mysql_insert(model).values(rows)
+        await session.execute(
+            statement.on_duplicate_key_update({
+                getattr(model, field).name: statement.inserted[getattr(model, field).name]
+                for field in rows[0] if field not in (id_field, "candidate_id")
+            })
+        )
+    inserted = sum(1 for row in rows if row[id_field] is None)
+    return {
+        "inserted": inserted,
+        "updated": len(rows) - inserted,
+        "deleted": len(removed_ids)
+    }
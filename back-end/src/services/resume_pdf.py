@@ -0,0 +1,157 @@
+import os
+import io
+import glob
+import asyncio
+import hashlib
+import zipfile
+import tempfile
+import pdfkit
+from concurrent.futures import ThreadPoolExecutor
+from jinja2 import Environment, FileSystemLoader
+from typing import AsyncIterator
+from sqlmodel import select
+from sqlalchemy.orm import selectinload
+
+from config.db import async_session
+from config.settings import get_settings
+from models.candidate import Candidate
+from models.candidate_certification import CandidateCertification
+from models.candidate_software import CandidateSoftware
+from models.candidate_language import CandidateLanguage
+from utilities import build_search_name
+
+settings = get_settings()
+template_dir = Environment(loader=FileSystemLoader("src/templates/cv"))
+
+WKHTMLTOPDF_PATH = settings.wkhtmltopdf_exe_path
+RESUME_CACHE_DIR = "src/cache/resumes"
+# wkhtmltopdf Processes Allowed At Once, Extra Requests Wait Their Turn
+RESUME_RENDER_WORKERS = 2
+# Candidate Profiles Loaded Per Batch When Zipping Many Resumes
+RESUME_ZIP_BATCH_SIZE = 50
+
+render_executor = ThreadPoolExecutor(max_workers=RESUME_RENDER_WORKERS, thread_name_prefix="resume-pdf")
+render_semaphore = asyncio.Semaphore(RESUME_RENDER_WORKERS)
+pending_renders: dict[str, asyncio.Future] = {}
+
+def resume_profile_query():
+    return select(Candidate).options(
+        selectinload(Candidate.work_experiences),
+        selectinload(Candidate.candidate_studies),
+        selectinload(Candidate.candidate_certifications).options(
+            selectinload(CandidateCertification.certification_type)
+        ),
+        selectinload(Candidate.candidate_softwares).options(
+            selectinload(CandidateSoftware.software),
+            selectinload(CandidateSoftware.knownledge_level)
+        ),
+        selectinload(Candidate.candidate_languages).options(
+            selectinload(CandidateLanguage.language),
+            selectinload(CandidateLanguage.language_level)
+        )
+    )
+
+def render_resume_html(candidate: Candidate) -> str:
+    template = template_dir.get_template("cv.html")
+    return template.render(candidate=candidate)
+
+def _render_pdf(html_content: str, path: str):
+    config = pdfkit.configuration(wkhtmltopdf=WKHTMLTOPDF_PATH) if WKHTMLTOPDF_PATH else None
+    pdf_bytes = pdfkit.from_string(html_content, False, configuration=config)
+    # Write Next To The Final File And Rename, So Readers Never See Half A PDF
+    os.makedirs(RESUME_CACHE_DIR, exist_ok=True)
+    file_descriptor, temp_path = tempfile.mkstemp(dir=RESUME_CACHE_DIR, suffix=".tmp")
+    with os.fdopen(file_descriptor, "wb") as file:
+        file.write(pdf_bytes)
+    os.replace(temp_path, path)
+
+async def _render_once(html_content: str, path: str):
+    async with render_semaphore:
+        await asyncio.get_running_loop().run_in_executor(render_executor, _render_pdf, html_content, path)
+
+async def get_resume_pdf(candidate_id: int, html_content: str) -> str:
+    # Cached Files Are Keyed By The Rendered HTML, So Any Profile Change Misses
+    content_hash = hashlib.sha256(html_content.encode("utf-8")).hexdigest()
+    path = os.path.join(RESUME_CACHE_DIR, f"{candidate_id}_{content_hash}.pdf")
+    if os.path.exists(path):
+        return path
+    # Concurrent Downloads Of The Same Resume Share One Render
+    render = pending_renders.get(path)
+    if not render:
+        render = asyncio.ensure_future(_render_once(html_content, path))
+        pending_renders[path] = render
+        render.add_done_callback(lambda _: pending_renders.pop(path, None))
+    await asyncio.shield(render)
+    return path
+
+def invalidate_resume_cache(candidate_id: int | str):
+    for path in glob.glob(os.path.join(RESUME_CACHE_DIR, f"{candidate_id}_*.pdf")):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+class ZipStreamBuffer(io.RawIOBase):
+    # Write Only Target For ZipFile, Drained After Every Entry
+    def __init__(self):
+        self.chunks = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self.chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        data = b"".join(self.chunks)
+        self.chunks.clear()
+        return data
+
+def resume_file_name(candidate: Candidate) -> str:
+    name = "-".join(build_search_name(candidate.name, candidate.paternal, candidate.maternal).split())
+    return f"cv-{name}-{candidate.candidate_id}.pdf"
+
+def _read_file(path: str) -> bytes:
+    with open(path, "rb") as file:
+        return file.read()
+
+async def _render_resume(candidate: Candidate) -> tuple[str, bytes | None]:
+    file_name = resume_file_name(candidate)
+    try:
+        path = await get_resume_pdf(candidate.candidate_id, render_resume_html(candidate))
+        return file_name, await asyncio.to_thread(_read_file, path)
+    except Exception as ex:
+        # Details Stay In The Server Log, The Archive Only Names The Missing File
+        print(f"[ERROR]: Rendering resume of candidate {candidate.candidate_id} failed: {ex}")
+        return file_name, None
+
+async def stream_resumes_zip(candidate_ids: list[int]) -> AsyncIterator[bytes]:
+    buffer = ZipStreamBuffer()
+    failed = []
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_STORED) as archive:
+        for start in range(0, len(candidate_ids), RESUME_ZIP_BATCH_SIZE):
+            # One IN Query Per Profile Section For The Whole Batch
+            async with async_session() as session:
+                result = await session.execute(
+                    resume_profile_query().where(
+                        Candidate.candidate_id.in_(candidate_ids[start:start + RESUME_ZIP_BATCH_SIZE])
+                    )
+                )
+                candidates = result.scalars().all()
+            # Entries Are Written As Soon As Each Render Finishes
+            renders = [asyncio.ensure_future(_render_resume(candidate)) for candidate in candidates]
+            try:
+                for render in asyncio.as_completed(renders):
+                    file_name, content = await render
+                    if content is None:
+                        failed.append(f"{file_name}: No fue posible generar el CV")
+                        continue
+                    archive.writestr(file_name, content)
+                    yield buffer.drain()
+            finally:
+                for render in renders:
+                    render.cancel()
+        if failed:
+            archive.writestr("errores.txt", "\n".join(failed))
+    yield buffer.drain()
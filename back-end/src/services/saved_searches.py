@@ -0,0 +1,210 @@
+import re
+import time
+import asyncio
+from collections import defaultdict
+from datetime import date
+from sqlmodel import select
+from sqlalchemy import insert, literal
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from config.db import async_session
+from models.active_offer import ActiveOffer
+from models.saved_search import SavedSearch
+from models.saved_search_hit import SavedSearchHit
+from utilities import FULLTEXT_MIN_TOKEN_SIZE, normalize_text, tokenize_text
+
+# Saved Searches Kept Per Candidate
+SAVED_SEARCH_MAX_PER_CANDIDATE = 20
+# Each Worker Keeps Its Own Index And Reads New Searches On Every Match; Searches Deleted Elsewhere
+# Cannot Record Hits, So The Full Reload Only Drops Them From Memory
+SAVED_SEARCH_RELOAD_INTERVAL = 24 * 60 * 60
+# Hits Inserted Per Statement
+HIT_INSERT_BATCH_SIZE = 1000
+
+# Filter Dimension -> Offer Attribute, In Anchor Preference Order (Most Selective First)
+FILTER_DIMENSIONS = (
+    ("city", "city_id"),
+    ("region", "region_id"),
+    ("contract", "type_id"),
+    ("job_type", "job_type_id")
+)
+
+class SearchFilter:
+    __slots__ = ("search_id", "tokens", "phrase", "conditions")
+
+    def __init__(self, search_id: int, search: str | None, region: int | None, city: int | None, contract: int | None, job_type: int | None):
+        self.search_id = search_id
+        # Same Terms As 'build_fulltext_query': Every Token Required, Matched By Prefix
+        self.tokens = tuple(dict.fromkeys(
+            token for token in tokenize_text(search) if len(token) >= FULLTEXT_MIN_TOKEN_SIZE
+        ))
+        # Without Indexable Tokens 'get_offers' Falls Back To A Title Substring
+        self.phrase = normalize_text(search.strip()) if search and search.strip() and not self.tokens else None
+        # Set Dimensions Only, In 'FILTER_DIMENSIONS' Order
+        values = {"city": city, "region": region, "contract": contract, "job_type": job_type}
+        self.conditions = tuple(
+            (dimension, values[dimension]) for dimension, _ in FILTER_DIMENSIONS if values[dimension]
+        )
+
+    @classmethod
+    def from_row(cls, row) -> "SearchFilter":
+        return cls(row.search_id, row.search, row.region_id, row.city_id, row.type_id, row.job_type_id)
+
+    def anchor(self) -> tuple:
+        # Longest Token Plus Most Selective Dimension, Common Words Alone Would Post Too Many Searches Together
+        token = max(self.tokens, key=len) if self.tokens else None
+        if self.conditions:
+            return (token, *self.conditions[0])
+        return (token, None, None)
+
+    def matches(self, offer: "OfferTerms") -> bool:
+        for dimension, value in self.conditions:
+            if offer.values[dimension] != value:
+                return False
+        if self.phrase is not None and self.phrase not in offer.title:
+            return False
+        return all(token in offer.prefixes for token in self.tokens)
+
+class OfferTerms:
+    __slots__ = ("title", "prefixes", "values")
+
+    def __init__(self, offer):
+        self.title = normalize_text(offer.title or "")
+        words = set(re.findall(r"[a-z0-9]+", normalize_text(f"{offer.title or ''} {offer.description or ''}")))
+        # Every Prefix A Saved Token Could Be, So Each Posting Lookup Is An Exact Key
+        self.prefixes = {
+            word[:size] for word in words for size in range(FULLTEXT_MIN_TOKEN_SIZE, len(word) + 1)
+        }
+        self.values = {dimension: getattr(offer, attribute) for dimension, attribute in FILTER_DIMENSIONS}
+
+    def keys(self):
+        # Every Anchor Shape A Matching Search Could Have Been Posted Under
+        dimensions = [(None, None)] + [(dimension, value) for dimension, value in self.values.items() if value]
+        for token in (None, *self.prefixes):
+            for dimension, value in dimensions:
+                yield (token, dimension, value)
+
+def build_index(searches: list) -> tuple[dict[int, SearchFilter], dict[tuple, set[int]]]:
+    filters = {}
+    postings = defaultdict(set)
+    for search in searches:
+        search_filter = SearchFilter.from_row(search)
+        filters[search.search_id] = search_filter
+        postings[search_filter.anchor()].add(search.search_id)
+    return filters, postings
+
+class SavedSearchIndex:
+    # Reverse Index: Each Search Is Posted Under One Anchor Key, An Offer Only Checks The Searches Under Its Own Keys
+    def __init__(self):
+        self.filters: dict[int, SearchFilter] = {}
+        self.postings: dict[tuple, set[int]] = defaultdict(set)
+        self.last_search_id = 0
+        self.loaded_at = None
+        self._lock = asyncio.Lock()
+
+    async def ensure_loaded(self, session: AsyncSession):
+        async with self._lock:
+            if self.loaded_at is None or time.monotonic() - self.loaded_at > SAVED_SEARCH_RELOAD_INTERVAL:
+                result = await session.execute(saved_searches_query())
+                # Hundreds Of Thousands Of Searches Take Seconds To Index, Keep The Event Loop Free
+                self.swap(*await asyncio.to_thread(build_index, result.all()))
+                return
+            # Searches Saved Through Other Workers Since The Last Read
+            result = await session.execute(
+                saved_searches_query().where(SavedSearch.search_id > self.last_search_id)
+            )
+            for search in result.all():
+                self.add(search)
+                self.last_search_id = max(self.last_search_id, search.search_id)
+
+    def load(self, searches: list):
+        self.swap(*build_index(searches))
+
+    def swap(self, filters: dict[int, SearchFilter], postings: dict[tuple, set[int]]):
+        self.filters, self.postings = filters, postings
+        self.last_search_id = max(filters, default=0)
+        self.loaded_at = time.monotonic()
+
+    def add(self, search):
+        # Leaves 'last_search_id' To Database Reads, Searches Saved Through Other Workers May Have Lower Ids
+        search_filter = SearchFilter.from_row(search)
+        self.remove(search.search_id)
+        self.filters[search.search_id] = search_filter
+        self.postings[search_filter.anchor()].add(search.search_id)
+
+    def remove(self, search_id: int):
+        search_filter = self.filters.pop(search_id, None)
+        if search_filter is None:
+            return
+        anchor = search_filter.anchor()
+        self.postings[anchor].discard(search_id)
+        if not self.postings[anchor]:
+            del self.postings[anchor]
+
+    def match(self, offer) -> list[int]:
+        terms = OfferTerms(offer)
+        search_ids = []
+        for key in terms.keys():
+            for search_id in self.postings.get(key, ()):
+                if self.filters[search_id].matches(terms):
+                    search_ids.append(search_id)
+        return search_ids
+
+saved_search_index = SavedSearchIndex()
+
+def saved_searches_query():
+    # Plain Rows, Building ORM Objects For Every Search Is The Slowest Part Of A Load
+    return select(
+        SavedSearch.search_id,
+        SavedSearch.search,
+        SavedSearch.region_id,
+        SavedSearch.city_id,
+        SavedSearch.type_id,
+        SavedSearch.job_type_id
+    )
+
+async def record_hits(session: AsyncSession, offer_id: int, search_ids: list[int]) -> int:
+    # Rows Come From 'busqueda_guardada', So Searches Deleted Meanwhile Are Skipped; IGNORE Keeps Earlier Hits
+    recorded = 0
+    for start in range(0, len(search_ids), HIT_INSERT_BATCH_SIZE):
+        result = await session.execute(
+            insert(SavedSearchHit).prefix_with("IGNORE", dialect="mysql").from_select(
+                [SavedSearchHit.search_id, SavedSearchHit.offer_id, SavedSearchHit.candidate_id],
+                select(
+                    SavedSearch.search_id,
+                    literal(offer_id),
+                    SavedSearch.candidate_id
+                ).where(SavedSearch.search_id.in_(search_ids[start:start + HIT_INSERT_BATCH_SIZE]))
+            )
+        )
+        recorded += result.rowcount
+    return recorded
+
+async def percolate_offers(offer_ids: list[int]):
+    # Only Portal Visible Offers Are Matched, Future Ones Are Matched By The Daily Rollover
+    async with async_session() as session:
+        result = await session.execute(
+            select(ActiveOffer).where(ActiveOffer.offer_id.in_(offer_ids))
+        )
+        offers = result.scalars().all()
+        if not offers:
+            return
+        await saved_search_index.ensure_loaded(session)
+        for offer in offers:
+            search_ids = saved_search_index.match(offer)
+            if search_ids:
+                await record_hits(session, offer.offer_id, search_ids)
+        await session.commit()
+
+async def percolate_offer(offer_id: int):
+    await percolate_offers([offer_id])
+
+async def percolate_published_offers(day: date):
+    # Offers Whose Publication Date Just Made Them Visible
+    async with async_session() as session:
+        result = await session.execute(
+            select(ActiveOffer.offer_id).where(ActiveOffer.publication_date == day)
+        )
+        offer_ids = result.scalars().all()
+    if offer_ids:
+        await percolate_offers(offer_ids)
@@ -0,0 +1,60 @@
+import asyncio
+import traceback
+from datetime import datetime, time, timedelta
+from typing import Awaitable, Callable
+from sqlalchemy import text
+
+from config.db import engine
+from config.settings import get_settings
+
+ScheduledJob = Callable[[], Awaitable[None]]
+
+settings = get_settings()
+
+scheduled_tasks: list[asyncio.Task] = []
+
+async def run_exclusive(job: ScheduledJob):
+    # Every Worker Schedules The Job, A Named MySQL Lock Lets Only One Run It; The Rest Skip Instead Of Waiting
+    lock_name = f"{settings.db_name}.{job.__name__}"
+    async with engine.connect() as connection:
+        result = await connection.execute(text("SELECT GET_LOCK(:name, 0)"), {"name": lock_name})
+        if result.scalar() != 1:
+            print(f"[INFO]: Scheduled job {job.__name__} skipped, another worker is running it")
+            return
+        try:
+            await job()
+        finally:
+            await connection.execute(text("SELECT RELEASE_LOCK(:name)"), {"name": lock_name})
+
+async def run_job(job: ScheduledJob, exclusive: bool = False):
+    # Scheduled Jobs Must Never Break The Loop That Runs Them, Failures Are Logged With Their Traceback
+    try:
+        if exclusive:
+            await run_exclusive(job)
+        else:
+            await job()
+    except Exception as ex:
+        print(f"[ERROR]: Scheduled job {job.__name__} failed: {ex}")
+        traceback.print_exc()
+
+async def _run_daily(job: ScheduledJob, at: time, exclusive: bool):
+    while True:
+        now = datetime.now()
+        next_run = datetime.combine(now.date(), at)
+        if next_run <= now:
+            next_run += timedelta(days=1)
+        await asyncio.sleep((next_run - now).total_seconds())
+        await run_job(job, exclusive)
+
+def start_job(job: ScheduledJob, exclusive: bool = False):
+    # Runs Once In The Background, Startup Does Not Wait For It
+    scheduled_tasks.append(asyncio.create_task(run_job(job, exclusive)))
+
+def schedule_daily(job: ScheduledJob, at: time, exclusive: bool = False):
+    scheduled_tasks.append(asyncio.create_task(_run_daily(job, at, exclusive)))
+
+async def stop_scheduled_jobs():
+    for task in scheduled_tasks:
+        task.cancel()
+    await asyncio.gather(*scheduled_tasks, return_exceptions=True)
+    scheduled_tasks.clear()
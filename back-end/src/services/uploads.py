@@ -0,0 +1,155 @@
+import os
+import re
+import glob
+import asyncio
+import hashlib
+import tempfile
+from fastapi import UploadFile
+from sqlmodel import select
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models.upload_reference import UploadReference
+
+UPLOADS_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "uploads")
+# Bytes Read From The Spooled Upload Per Step
+UPLOAD_CHUNK_SIZE = 64 * 1024
+JPEG_CONTENT_TYPES = {"image/jpeg"}
+UPLOAD_FOLDERS = {"resumes", "photos", "logos", "publication_images", "plan_photos"}
+# Content Type -> Stored File Extension
+UPLOAD_EXTENSIONS = {
+    "application/pdf": ".pdf",
+    "application/vnd.openxmlformats-officedocument.wordprocessingml.document": ".docx",
+    "image/jpeg": ".jpg",
+    "image/png": ".png",
+    "image/svg+xml": ".svg"
+}
+# Stored Names Are The SHA-256 Of The Content, So A Name Never Changes Its Bytes
+CONTENT_ADDRESSED_NAME = re.compile(r"^([0-9a-f]{64})\.[a-z]+$")
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+# Uploads Are Served From The API Origin, So Browsers Must Never Run Them As Documents
+SVG_CONTENT_SECURITY_POLICY = "default-src 'none'; style-src 'unsafe-inline'; sandbox"
+
+class UploadTypeError(Exception):
+    pass
+
+class UploadSizeError(Exception):
+    pass
+
+def sniff_content_type(head: bytes) -> str | None:
+    # Trust The File Signature, Not The Client Provided Content Type
+    if head.startswith(b"%PDF-"):
+        return "application/pdf"
+    if head.startswith(b"PK\x03\x04"):
+        return "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+    if head.startswith(b"\xff\xd8\xff"):
+        return "image/jpeg"
+    if head.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "image/png"
+    text = head.lstrip(b"\xef\xbb\xbf \t\r\n").lower()
+    if (text.startswith(b"<?xml") or text.startswith(b"<svg")) and b"<svg" in text:
+        return "image/svg+xml"
+    return None
+
+def upload_headers(filename: str) -> dict[str, str]:
+    # SVG Can Carry Scripts, Opened Directly It Would Run With The API Cookies
+    headers = {"X-Content-Type-Options": "nosniff"}
+    if filename.lower().endswith(".svg"):
+        headers["Content-Security-Policy"] = SVG_CONTENT_SECURITY_POLICY
+    return headers
+
+def _open_temp_file(directory: str) -> tuple[int, str]:
+    os.makedirs(directory, exist_ok=True)
+    return tempfile.mkstemp(dir=directory, suffix=".part")
+
+def _remove_file(path: str):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+def content_hash(filename: str | None) -> str | None:
+    match = CONTENT_ADDRESSED_NAME.match(filename or "")
+    return match.group(1) if match else None
+
+def _store_file(temp_path: str, path: str):
+    # Identical Content Is Already Stored Under The Same Name
+    if os.path.exists(path):
+        _remove_file(temp_path)
+    else:
+        os.replace(temp_path, path)
+
+async def save_upload(
+    session: AsyncSession,
+    file: UploadFile,
+    folder: str,
+    content_types: set[str],
+    max_size: int
+) -> str:
+    # Starlette Has Already Spooled The Whole Body, The Limit Bounds What Is Hashed And Stored;
+    # Request Body Size Itself Must Be Capped By The Proxy
+    if file.size is not None and file.size > max_size:
+        raise UploadSizeError()
+    head = await file.read(UPLOAD_CHUNK_SIZE)
+    content_type = sniff_content_type(head)
+    if content_type not in content_types:
+        raise UploadTypeError()
+    directory = os.path.join(UPLOADS_DIR, folder)
+    file_descriptor, temp_path = await asyncio.to_thread(_open_temp_file, directory)
+    try:
+        digest = hashlib.sha256()
+        with os.fdopen(file_descriptor, "wb") as buffer:
+            size = 0
+            chunk = head
+            while chunk:
+                size += len(chunk)
+                if size > max_size:
+                    raise UploadSizeError()
+                digest.update(chunk)
+                await asyncio.to_thread(buffer.write, chunk)
+                chunk = await file.read(UPLOAD_CHUNK_SIZE)
+        filename = f"{digest.hexdigest()}{UPLOAD_EXTENSIONS[content_type]}"
+        # Take The Reference Row Lock Before Placing The File, So A Concurrent
+        # Release Of The Same Content Cannot Delete It Underneath Us
+        await session.execute(
+            mysql_insert(UploadReference).values(
+                folder=folder,
+                filename=filename,
+                total=1
+            ).on_duplicate_key_update(
+                total=UploadReference.total + 1
+            )
+        )
+        # Rename Only Complete Files Into Place
+        await asyncio.to_thread(_store_file, temp_path, os.path.join(directory, filename))
+        return filename
+    except BaseException:
+        _remove_file(temp_path)
+        raise
+
+def _remove_upload_files(path: str):
+    # Derived Image Variants Live Next To The Original
+    for variant_path in glob.glob(f"{glob.escape(path)}.*.webp"):
+        _remove_file(variant_path)
+    _remove_file(path)
+
+async def remove_upload(session: AsyncSession, folder: str, filename: str | None):
+    # Called After The Owner Row Is Committed, Releases One Reference In Its Own Transaction
+    if not filename:
+        return
+    result = await session.execute(
+        select(UploadReference).where(
+            UploadReference.folder == folder,
+            UploadReference.filename == filename
+        ).with_for_update()
+    )
+    reference = result.scalar_one_or_none()
+    if reference and reference.total > 1:
+        reference.total -= 1
+        session.add(reference)
+    else:
+        # Last Reference (Or A File Stored Before Reference Counting), Delete It Under The Lock
+        if reference:
+            await session.delete(reference)
+        await asyncio.to_thread(_remove_upload_files, os.path.join(UPLOADS_DIR, folder, filename))
+    await session.commit()
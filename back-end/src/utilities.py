@@ -1,13 +1,27 @@
 import re
+import json
+import base64
+import unicodedata
 import bcrypt
 import jwt
 from fastapi import HTTPException, Request, status
+from sqlalchemy.exc import IntegrityError
 from datetime import date, datetime, timedelta, timezone
 
 from config.settings import get_settings
 
 ALGORITHM="HS256"
 settings = get_settings()
+# InnoDB Ignores Tokens Shorter Than 'innodb_ft_min_token_size' (3 By Default)
+FULLTEXT_MIN_TOKEN_SIZE = 3
+SPANISH_STOP_WORDS = frozenset({
+    "a", "al", "ante", "bajo", "con", "contra", "de", "del", "desde", "donde",
+    "durante", "e", "el", "ella", "ellas", "ellos", "en", "entre", "es", "esta",
+    "este", "esto", "hacia", "hasta", "la", "las", "le", "les", "lo", "los",
+    "mas", "me", "mi", "muy", "ni", "no", "o", "para", "pero", "por", "que",
+    "se", "segun", "sin", "so", "sobre", "su", "sus", "tras", "u", "un", "una",
+    "unas", "uno", "unos", "y", "ya"
+})
 
 # General Functions
 def get_password_hash(password: str) -> str:
@@ -57,6 +71,50 @@ def get_optional_user(request: Request) -> dict | None:
     except (jwt.ExpiredSignatureError, jwt.PyJWTError):
         return None
 
+def is_duplicate_entry(ex: IntegrityError) -> bool:
+    # MySQL Error 1062 (ER_DUP_ENTRY) Means A Unique Key Rejected The Row
+    return bool(ex.orig and ex.orig.args and ex.orig.args[0] == 1062)
+
+# Pagination Functions
+def encode_cursor(*values) -> str:
+    raw = json.dumps([value.isoformat() if isinstance(value, (date, datetime)) else value for value in values])
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("utf-8").rstrip("=")
+
+def decode_cursor(cursor: str, types: tuple) -> tuple | None:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("utf-8")))
+        if not isinstance(values, list) or len(values) != len(types):
+            return None
+        return tuple(
+            kind.fromisoformat(value) if kind in (date, datetime) else kind(value)
+            for kind, value in zip(types, values)
+        )
+    except (ValueError, TypeError):
+        return None
+
+# Search Functions
+def normalize_text(value: str) -> str:
+    decomposed = unicodedata.normalize("NFKD", value.lower())
+    return "".join(char for char in decomposed if not unicodedata.combining(char))
+
+def tokenize_text(value: str | None) -> list[str]:
+    if not value:
+        return []
+    tokens = re.findall(r"[a-z0-9]+", normalize_text(value))
+    return [token for token in tokens if token not in SPANISH_STOP_WORDS]
+
+def build_search_name(*parts: str | None) -> str:
+    # Accent Folded Full Name, Kept In Sync By Every Candidate Write
+    return " ".join(re.findall(r"[a-z0-9]+", normalize_text(" ".join(part for part in parts if part))))
+
+def build_fulltext_query(value: str | None) -> str | None:
+    # Every Remaining Term Is Required And Matched By Prefix (Boolean Mode)
+    tokens = [token for token in tokenize_text(value) if len(token) >= FULLTEXT_MIN_TOKEN_SIZE]
+    if not tokens:
+        return None
+    return " ".join(f"+{token}*" for token in dict.fromkeys(tokens))
+
 # Validation Functions
 def validate_run_format(run: str) -> bool:
     run = run.replace('.', '').replace(' ', '')
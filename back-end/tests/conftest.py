@@ -0,0 +1,45 @@
+import os
+
+# Settings Are Read On Import, Tests Never Reach The Database Or SMTP
+for variable, value in {
+    "DB_USERNAME": "test",
+    "DB_PASSWORD": "test",
+    "DB_HOST": "localhost",
+    "DB_NAME": "test",
+    "SMTP_USERNAME": "test",
+    "SMTP_PASSWORD": "test",
+    "SMTP_MAIL_FROM": "test@example.com",
+    "CONTACT_RECIPIENT_EMAIL": "test@example.com",
+    "JWT_SECRET_KEY": "test",
+    "WKHTMLTOPDF_EXE_PATH": "",
+    "FRONT_END_DOMAIN": "http://localhost"
+}.items():
+    os.environ.setdefault(variable, value)
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from config.db import get_session
+from utilities import create_access_token
+
+class UnusedSession:
+    # Requests Rejected Before Any Query Must Never Touch The Session
+    def __getattr__(self, name: str):
+        raise AssertionError(f"Session.{name} used by a rejected request")
+
+async def get_unused_session():
+    yield UnusedSession()
+
+@pytest.fixture
+def router_client():
+    # Mounts Only The Router Under Test, With The Same '/v1' Prefix As 'main'
+    def build(router, session_dependency=get_unused_session) -> TestClient:
+        app = FastAPI()
+        app.include_router(router, prefix="/v1")
+        app.dependency_overrides[get_session] = session_dependency
+        return TestClient(app)
+    return build
+
+def access_token(user_id: int, user_role: int) -> str:
+    return create_access_token({"sub": str(user_id), "user_role": user_role, "user_position": None})
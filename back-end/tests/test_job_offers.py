@@ -0,0 +1,15 @@
+from conftest import access_token
+from routers import job_offers
+from schemas.extras import UserRoleEnum
+
+def test_candidate_cannot_list_recommended_candidates(router_client):
+    client = router_client(job_offers.router)
+    client.cookies.set("access_token", access_token(1, UserRoleEnum.candidate))
+    response = client.get("/v1/job-offers/1/recommended-candidates")
+    assert response.status_code == 403
+
+def test_candidate_cannot_read_offer_funnel(router_client):
+    client = router_client(job_offers.router)
+    client.cookies.set("access_token", access_token(1, UserRoleEnum.candidate))
+    response = client.get("/v1/job-offers/1/funnel")
+    assert response.status_code == 403
@@ -0,0 +1,50 @@
+import asyncio
+from datetime import date
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from sqlmodel import SQLModel, select
+
+from models.candidate import Candidate
+from models.job_offer import JobOffer
+from models.postulation import Postulation
+from schemas.postulation import PostulationStateEnum
+from services import notifications
+
+def test_only_flagged_discarded_postulations_are_notified(monkeypatch):
+    sent = []
+
+    async def send_not_selected_email(emails: list[str], title: str):
+        sent.append((sorted(emails), title))
+
+    async def run() -> list[int]:
+        engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+        async with engine.begin() as connection:
+            await connection.run_sync(SQLModel.metadata.create_all)
+        session_factory = sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+        monkeypatch.setattr(notifications, "async_session", session_factory)
+        monkeypatch.setattr(notifications, "send_not_selected_email", send_not_selected_email)
+        async with session_factory() as session:
+            session.add(JobOffer(offer_id=1, code=1, title="Analista", publication_date=date.today(), state="Activa", featured=0))
+            for candidate_id in range(1, 5):
+                session.add(Candidate(candidate_id=candidate_id, name=f"c{candidate_id}", paternal="p", email=f"{candidate_id}@example.com"))
+            await session.flush()
+            session.add_all([
+                # Discarded By The Request Being Notified
+                Postulation(postulation_id=1, state=PostulationStateEnum.not_selected, notification_pending=1, candidate_id=1, offer_id=1),
+                # Rejected And Emailed Earlier
+                Postulation(postulation_id=2, state=PostulationStateEnum.not_selected, candidate_id=2, offer_id=1),
+                Postulation(postulation_id=3, state=PostulationStateEnum.contracted, candidate_id=3, offer_id=1),
+                # Flagged, Then Moved Back Before The Notifier Ran
+                Postulation(postulation_id=4, state=PostulationStateEnum.in_progress, notification_pending=1, candidate_id=4, offer_id=1)
+            ])
+            await session.commit()
+        await notifications.notify_not_selected_postulations(1)
+        async with session_factory() as session:
+            result = await session.execute(select(Postulation.postulation_id).where(Postulation.notification_pending == 1))
+            pending = result.scalars().all()
+        await engine.dispose()
+        return pending
+
+    assert asyncio.run(run()) == []
+    assert sent == [(["1@example.com"], "Analista")]
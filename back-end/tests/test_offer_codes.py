@@ -0,0 +1,112 @@
+import os
+import asyncio
+import pytest
+from datetime import date
+from sqlalchemy import create_engine, inspect, text, delete
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from sqlmodel import SQLModel, Session, select
+
+from models.active_offer import ActiveOffer
+from models.job_offer import JobOffer
+from schemas.job_offer import OfferStateEnum, OfferFeaturedEnum
+from scripts.create_indexes import create_missing_indexes
+from services import offer_codes
+
+def build_offer(offer_id: int | None, code: int, location: str | None = None) -> JobOffer:
+    return JobOffer(
+        offer_id=offer_id,
+        code=code,
+        title=f"Oferta {code}",
+        location=location,
+        publication_date=date.today(),
+        state=OfferStateEnum.pending,
+        featured=OfferFeaturedEnum.not_featured
+    )
+
+def test_duplicated_codes_are_reassigned_from_the_counter(monkeypatch):
+    async def run() -> tuple[dict[int, int], dict[int, int], dict[int, int]]:
+        engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+        async with engine.begin() as connection:
+            await connection.run_sync(SQLModel.metadata.create_all)
+            # Databases Created Before The Unique Index
+            await connection.execute(text("DROP INDEX uq_oferta_codigo"))
+        session_factory = sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+        monkeypatch.setattr(offer_codes, "async_session", session_factory)
+        monkeypatch.setattr(offer_codes, "offer_code_allocator", offer_codes.CodeAllocator(
+            offer_codes.OFFER_CODE_COUNTER, offer_codes.FIRST_OFFER_CODE, offer_codes.OFFER_CODE_BLOCK_SIZE
+        ))
+        async with session_factory() as session:
+            session.add_all([build_offer(1, 1000), build_offer(2, 1000), build_offer(3, 1001), build_offer(4, 1000)])
+            session.add(ActiveOffer(offer_id=2, code=1000, title="Oferta 1000", publication_date=date.today(), state=OfferStateEnum.active, featured=0))
+            await session.commit()
+            reassigned = await offer_codes.reassign_duplicate_offer_codes(session)
+        async with session_factory() as session:
+            result = await session.execute(select(JobOffer.offer_id, JobOffer.code))
+            codes = dict(result.all())
+            result = await session.execute(select(ActiveOffer.offer_id, ActiveOffer.code))
+            active_codes = dict(result.all())
+        await engine.dispose()
+        return reassigned, codes, active_codes
+
+    reassigned, codes, active_codes = asyncio.run(run())
+    assert sorted(reassigned) == [2, 4]
+    assert codes[1] == 1000 and codes[3] == 1001
+    assert len(set(codes.values())) == len(codes)
+    assert min(reassigned.values()) > 1001
+    assert active_codes[2] == codes[2]
+
+def test_unique_code_index_is_skipped_while_duplicates_remain():
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(text("DROP INDEX uq_oferta_codigo"))
+    with Session(engine) as session:
+        session.add_all([build_offer(1, 1000), build_offer(2, 1000)])
+        session.commit()
+    with engine.begin() as connection:
+        create_missing_indexes(connection)
+        indexes = {index["name"] for index in inspect(connection).get_indexes("oferta")}
+    assert "uq_oferta_codigo" not in indexes
+
+# Locks Only Behave Like Production On MySQL: Set The DB_* Variables Of A Development Database And RUN_MYSQL_TESTS=1
+CHECK_WORKERS = 4
+CHECK_OFFERS_PER_WORKER = 50
+CHECK_BLOCK_SIZE = 7
+CHECK_MARKER = "__check_codigos__"
+
+@pytest.mark.skipif(not os.environ.get("RUN_MYSQL_TESTS"), reason="Needs a MySQL development database")
+def test_parallel_allocators_never_repeat_codes():
+    from config.db import async_session, close_db
+
+    async def create_offer(allocator: offer_codes.CodeAllocator) -> int:
+        async with async_session() as session:
+            offer = build_offer(None, await allocator.allocate(), CHECK_MARKER)
+            session.add(offer)
+            await session.commit()
+            return offer.code
+
+    async def run() -> tuple[list[int], list[int]]:
+        try:
+            # One Allocator Per Simulated Worker Process, All Sharing The Same Counter Row
+            allocators = [
+                offer_codes.CodeAllocator(offer_codes.OFFER_CODE_COUNTER, offer_codes.FIRST_OFFER_CODE, CHECK_BLOCK_SIZE)
+                for _ in range(CHECK_WORKERS)
+            ]
+            codes = await asyncio.gather(*[
+                create_offer(allocators[index % CHECK_WORKERS])
+                for index in range(CHECK_WORKERS * CHECK_OFFERS_PER_WORKER)
+            ])
+            async with async_session() as session:
+                result = await session.execute(select(JobOffer.code).where(JobOffer.location == CHECK_MARKER))
+                stored_codes = result.scalars().all()
+                await session.execute(delete(JobOffer).where(JobOffer.location == CHECK_MARKER))
+                await session.commit()
+            return codes, stored_codes
+        finally:
+            await close_db()
+
+    codes, stored_codes = asyncio.run(run())
+    assert len(set(codes)) == len(codes)
+    assert sorted(stored_codes) == sorted(codes)
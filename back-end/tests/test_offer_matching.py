@@ -0,0 +1,13 @@
+import asyncio
+
+from services.offer_matching import MatchingEngine
+
+class FailingSession:
+    async def execute(self, *args, **kwargs):
+        raise RuntimeError("connection lost")
+
+def test_failed_refresh_after_commit_does_not_raise():
+    engine = MatchingEngine()
+    engine.load([], [])
+    asyncio.run(engine.refresh_offer(FailingSession(), 1))
+    asyncio.run(engine.refresh_preference(FailingSession(), 1))
@@ -0,0 +1,67 @@
+from datetime import date
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
+from sqlmodel import SQLModel, Session
+
+from conftest import access_token
+from models.candidate import Candidate
+from models.job_offer import JobOffer
+from routers import postulations
+from schemas.extras import UserRoleEnum
+
+def test_candidate_cannot_update_postulation_states(router_client):
+    client = router_client(postulations.router)
+    client.cookies.set("access_token", access_token(1, UserRoleEnum.candidate))
+    response = client.put("/v1/postulations/state", json={
+        "offer_id": 1,
+        "state": "No Seleccionado",
+        "postulation_ids": [1, 2]
+    })
+    assert response.status_code == 403
+
+def test_idempotency_key_replays_only_the_same_submission(router_client, monkeypatch, tmp_path):
+    database_url = f"sqlite:///{tmp_path / 'postulations.db'}"
+    with Session(create_engine(database_url)) as session:
+        SQLModel.metadata.create_all(session.get_bind())
+        session.add_all([
+            JobOffer(offer_id=offer_id, code=offer_id, title=f"Oferta {offer_id}", publication_date=date.today(), state="Activa", featured=0)
+            for offer_id in (1, 2)
+        ])
+        session.add(Candidate(candidate_id=1, name="c", paternal="p", email="c@example.com"))
+        session.commit()
+    # NullPool: The Test Client Runs Requests On Its Own Event Loop
+    engine = create_async_engine(database_url.replace("sqlite://", "sqlite+aiosqlite://"), poolclass=NullPool)
+    session_factory = sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+
+    async def get_test_session():
+        async with session_factory() as session:
+            yield session
+
+    async def add_to_counter(*args):
+        pass
+
+    async def send_postulation_email_confirmation(*args):
+        pass
+
+    # SQLite Reports Unique Violations Without MySQL Error Codes; Counters Use A MySQL Only Upsert
+    monkeypatch.setattr(postulations, "is_duplicate_entry", lambda ex: "UNIQUE constraint failed" in str(ex.orig))
+    monkeypatch.setattr(postulations, "add_to_counter", add_to_counter)
+    monkeypatch.setattr(postulations, "send_postulation_email_confirmation", send_postulation_email_confirmation)
+    client = router_client(postulations.router, get_test_session)
+    client.cookies.set("access_token", access_token(1, UserRoleEnum.candidate))
+
+    def submit(offer_id: int, key: str | None = None):
+        return client.post("/v1/postulations/", json={"offer_id": offer_id}, headers={"Idempotency-Key": key} if key else {})
+
+    first = submit(1, "retry-1")
+    assert first.status_code == 200
+    retry = submit(1, "retry-1")
+    assert retry.status_code == 200
+    assert retry.json()["postulation_id"] == first.json()["postulation_id"]
+    # Same Key, Different Body
+    assert submit(2, "retry-1").status_code == 422
+    # Real Duplicates, With Another Key Or None
+    assert submit(1, "retry-2").status_code == 400
+    assert submit(1).status_code == 400